@@ -0,0 +1,169 @@
+"""
+## =========================================================================== ##
+MIT License
+Copyright (c) 2021 Roman Parak
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+## =========================================================================== ##
+Author   : Roman Parak
+Email    : Roman.Parak@outlook.com
+Github   : https://github.com/rparak
+File Name: Histogram.py
+## =========================================================================== ##
+"""
+
+# Initialization of Constants:
+#   Units of the output values (summary, edges of the bins): Number of ns in one unit
+CONST_HISTOGRAM_UNITS = {'ns': 1.0, 'us': 1e3, 'ms': 1e6, 's': 1e9}
+
+class Histogram(object):
+    """
+    Description:
+        A fixed-size histogram of time values (e.g. the period of a loop or the latency of a stage) with the sum 
+        and the exact maximum of the values.
+
+        The memory is constant and the cost of one value is constant (one integer division and one increment 
+        of a list item). The values are added in ns (integer), the values above the range are counted in the last 
+        bin and the negative values in the first one. The summary is in the output unit {unit} and it can be read 
+        while the values are being added (live).
+
+    Initialization of the Class:
+        Args:
+            (1) bin_width [Float]: Width of one bin in seconds.
+            (2) num_of_bins [INT]: Number of bins.
+            (3) unit [String]: Unit of the output values (CONST_HISTOGRAM_UNITS).
+
+        Example:
+            Initialization:
+                Cls = Histogram(5e-6, 4000, 'us')
+
+            Calculation:
+                Cls.Add(value{0})                   # In ns
+                ...
+                Cls.Add(value{n})
+
+            Returns:
+                Cls.Get_Summary()                   # Number of values, mean, p50, p99, max (in the unit)
+                Cls.Get_Histogram()                 # Edges of the bins (in the unit), counts
+    """
+
+    def __init__(self, bin_width, num_of_bins, unit = 'us'):
+        # << PUBLIC >> #
+        self.unit = unit
+
+        # << PRIVATE >> #
+        # Width of one bin in ns, number of bins
+        self.__bin_width   = int(round(bin_width * 1e9))
+        self.__num_of_bins = int(num_of_bins)
+        # Number of ns in one output unit
+        self.__scale = CONST_HISTOGRAM_UNITS[unit]
+        self.Clear()
+
+    def Clear(self):
+        """
+        Description:
+            Function to remove all values from the histogram.
+        """
+
+        # Counts of the bins, sum and maximum of the values (ns)
+        self.__counts = [0] * self.__num_of_bins
+        self.__sum = 0
+        self.__max = 0
+
+    def Add(self, value):
+        """
+        Description:
+            Function to add a new value.
+
+        Args:
+            (1) value [INT]: Value in ns (a negative value is counted as 0).
+        """
+
+        if value < 0:
+            value = 0
+
+        i = value // self.__bin_width; last = self.__num_of_bins - 1
+        self.__counts[i if i < last else last] += 1
+        self.__sum += value
+        if value > self.__max:
+            self.__max = value
+
+    def Get_Bin_Width(self):
+        """
+        Description:
+            Function to get the width of one bin.
+
+        Returns:
+            (1) parameter [Float]: Width of one bin in the unit.
+        """
+
+        return self.__bin_width / self.__scale
+
+    def Get_Counts(self):
+        """
+        Description:
+            Function to get the counts of the bins.
+
+        Returns:
+            (1) parameter [INT Vector]: Counts (copy), the last bin includes all values above the range.
+        """
+
+        return list(self.__counts)
+
+    def Get_Histogram(self):
+        """
+        Description:
+            Function to get the edges and the counts of the bins.
+
+        Returns:
+            (1) parameter [Float Vector]: Edges of the bins in the unit (number of bins + 1).
+            (2) parameter [INT Vector]: Counts, the last bin includes all values above the range.
+        """
+
+        return [i * self.__bin_width / self.__scale for i in range(self.__num_of_bins + 1)], self.Get_Counts()
+
+    def __Percentile(self, counts, num_of_values, q):
+        # Percentile from the histogram (upper edge of the bin)
+        limit = q / 100.0 * num_of_values; cumulative = 0
+        for i, count in enumerate(counts):
+            cumulative += count
+            if cumulative >= limit:
+                return (i + 1) * self.__bin_width / self.__scale
+
+        return self.__num_of_bins * self.__bin_width / self.__scale
+
+    def Get_Summary(self):
+        """
+        Description:
+            Function to get the summary of the values (it can be called while the values are being added).
+
+        Returns:
+            (1) parameter [Dictionary]: Number of values and the mean, p50, p99 and max in the unit, e.g. 'p99_us' 
+                                        (the percentiles are the upper edges of the bins, 0.0 without values).
+        """
+
+        # Copy of the counts (a new value can be added in the meantime)
+        counts = self.Get_Counts(); num_of_values = sum(counts)
+
+        if num_of_values == 0:
+            return {'num_of_values': 0, f'mean_{self.unit}': 0.0, f'p50_{self.unit}': 0.0, f'p99_{self.unit}': 0.0, 
+                    f'max_{self.unit}': 0.0}
+
+        return {'num_of_values': num_of_values, 
+                f'mean_{self.unit}': self.__sum / num_of_values / self.__scale,
+                f'p50_{self.unit}': self.__Percentile(counts, num_of_values, 50), 
+                f'p99_{self.unit}': self.__Percentile(counts, num_of_values, 99),
+                f'max_{self.unit}': self.__max / self.__scale}
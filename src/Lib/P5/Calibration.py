@@ -0,0 +1,315 @@
+"""
+## =========================================================================== ## 
+MIT License
+Copyright (c) 2021 Roman Parak
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+## =========================================================================== ## 
+Author   : Roman Parak
+Email    : Roman.Parak@outlook.com
+Github   : https://github.com/rparak
+File Name: Calibration.py
+## =========================================================================== ## 
+"""
+
+# Time (Time access and conversions)
+import time
+# OS (Operating system interfaces)
+import os
+# JSON (JSON encoder and decoder)
+import json
+# Numpy (Array computing) [pip3 install numpy]
+import numpy as np
+# Lib.Signal.Quantile (Streaming quantile estimator)
+import Lib.Signal.Quantile as Quantile
+# Lib.Parameters (Main Control Parameters)
+import Lib.Parameters as Parameters
+
+# Initialization of Constants:
+#   Minimum range of one axis in cm (a shorter sweep is not accepted)
+CONST_CALIBRATION_MIN_RANGE = 5.0
+#   Minimum number of samples of one gesture
+CONST_GESTURE_MIN_NUM_OF_DATA = 50
+#   Minimum distance between two gesture templates (twice the hysteresis, the gestures must be distinguishable)
+CONST_GESTURE_MIN_DISTANCE = 2.0 * Parameters.CONST_GESTURE_HYSTERESIS
+
+class Workspace_Calibration(object):
+    """
+    Description:
+        Calibration of the workspace of the glove position from a sweep of the hand. The robust minimum and maximum 
+        of each axis are the lower and upper quantiles of the positions, estimated by the streaming P-Square estimators 
+        (Quantile.P2_Quantile), so the memory is constant however long the sweep is and single wild values do not 
+        change the result.
+
+    Initialization of the Class:
+        Args:
+            (1) quantiles [Float Vector]: Lower and upper quantile (0.0 - 1.0).
+            (2) num_of_axes [INT]: Number of axes.
+
+        Example:
+            Initialization:
+                Cls = Workspace_Calibration([0.02, 0.98])
+
+            Calculation:
+                Cls.Add([X{0}, Y{0}, Z{0}])
+                ...
+                Cls.Add([X{n}, Y{n}, Z{n}])
+
+            Returns:
+                Cls.Get_Limit()             # [[X_min, X_max], [Y_min, Y_max], [Z_min, Z_max]]
+                Cls.Save(file_path)         # Parameter file of the subscribers (Load_Workspace)
+    """
+
+    def __init__(self, quantiles = Parameters.CONST_CALIBRATION_QUANTILES, num_of_axes = 3):
+        # << PRIVATE >> #
+        self.__quantiles = list(quantiles)
+        # Estimators of the lower and upper quantile of each axis
+        self.__estimator = [[Quantile.P2_Quantile(quantiles[0]), Quantile.P2_Quantile(quantiles[1])] for _ in range(num_of_axes)]
+
+    def __len__(self):
+        return len(self.__estimator[0][0])
+
+    def Add(self, position):
+        """
+        Description:
+            Function to add a new (valid) position.
+
+        Args:
+            (1) position [Float Vector]: Position {X, Y, Z}.
+        """
+
+        for value, estimator in zip(position, self.__estimator):
+            estimator[0].Add(value); estimator[1].Add(value)
+
+    def Get_Limit(self):
+        """
+        Description:
+            Function to get the calibrated limit of each axis.
+
+        Returns:
+            (1) parameter [Float Matrix]: Limit of each axis (Boundaries: [Lower Value{-}, Upper Value{+}]), None if there is no position.
+        """
+
+        if len(self) == 0:
+            return None
+
+        return [[estimator[0].Get_Value(), estimator[1].Get_Value()] for estimator in self.__estimator]
+
+    def Clear(self):
+        """
+        Description:
+            Function to remove all positions (restart the calibration).
+        """
+
+        for estimator in self.__estimator:
+            estimator[0].Clear(); estimator[1].Clear()
+
+    def Save(self, file_path):
+        """
+        Description:
+            Function to save the calibrated limit to the parameter file (.json).
+
+        Args:
+            (1) file_path [String]: Path to the file.
+
+        Returns:
+            (1) parameter [Bool]: True if the limit has been saved, False if the sweep is too short (the range of an axis 
+                                  is shorter than CONST_CALIBRATION_MIN_RANGE).
+        """
+
+        limit = self.Get_Limit()
+        if limit is None or any(l[1] - l[0] < CONST_CALIBRATION_MIN_RANGE for l in limit):
+            print(f'[ERROR] The calibration sweep is too short: {limit}')
+            return False
+
+        # The file is replaced in one step (a subscriber never reads a partially written file).
+        with open(file_path + '.tmp', 'w') as f:
+            json.dump({'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'), 'num_of_data': len(self), 'quantiles': self.__quantiles, 
+                       'limit': limit}, f, indent=2)
+        os.replace(file_path + '.tmp', file_path)
+
+        print(f'[INFO] The calibration has been successfully saved: {file_path}')
+        print(f'[INFO] Workspace {{X, Y, Z}}: {[[round(l[0], 2), round(l[1], 2)] for l in limit]}')
+
+        return True
+
+def Load_Workspace(file_path, limit):
+    """
+    Description:
+        Function to load the calibrated workspace (limit of each axis) from the parameter file (Workspace_Calibration.Save).
+
+    Args:
+        (1) file_path [String]: Path to the file.
+        (2) limit [Float Matrix]: Default limit of each axis (if there is no valid file).
+
+    Returns:
+        (1) parameter [Float Matrix]: Limit of each axis (Boundaries: [Lower Value{-}, Upper Value{+}]).
+    """
+
+    if not os.path.isfile(file_path):
+        print(f'[INFO] No calibration file ({file_path}), the default workspace is used.')
+        return limit
+
+    try:
+        with open(file_path, 'r') as f:
+            calibration = json.load(f)
+
+        assert len(calibration['limit']) == len(limit) and all(l[1] > l[0] for l in calibration['limit'])
+
+    except (ValueError, KeyError, TypeError, AssertionError):
+        print(f'[ERROR] The calibration file is not valid ({file_path}), the default workspace is used.')
+        return limit
+
+    print(f'[INFO] The calibration has been successfully loaded: {file_path} ({calibration["timestamp"]})')
+
+    return [[float(l[0]), float(l[1])] for l in calibration['limit']]
+
+class Gesture_Calibration(object):
+    """
+    Description:
+        Calibration of the templates of the hand gestures (Gesture.Gesture_Classifier). The operator holds each gesture 
+        for a while and the template is the mean of the recorded fingers bend (Gesture_Classifier.Calibrate).
+
+    Initialization of the Class:
+        Args:
+            (1) names [String Vector]: Names of the gestures.
+
+        Example:
+            Initialization:
+                Cls = Gesture_Calibration(['OPEN', 'CLOSED', 'POINT'])
+
+            Calculation:
+                Cls.Add('OPEN', [T{0}, I{0}, M{0}, R{0}, L{0}])
+                ...
+                Cls.Add('POINT', [T{n}, I{n}, M{n}, R{n}, L{n}])
+
+            Returns:
+                Cls.Get_Templates()         # {name: fingers bend {T, I, M, R, L}}
+                Cls.Apply(classifier)       # Templates of the classifier (Gesture_Classifier.Calibrate)
+                Cls.Save(file_path)         # Parameter file of the glove (Load_Gestures)
+    """
+
+    def __init__(self, names = list(Parameters.CONST_GESTURE_TEMPLATES.keys())):
+        # << PRIVATE >> #
+        # Recorded fingers bend of each gesture
+        self.__data = {name: [] for name in names}
+
+    def Add(self, name, fingers_bend):
+        """
+        Description:
+            Function to add a new sample of the gesture.
+
+        Args:
+            (1) name [String]: Name of the gesture.
+            (2) fingers_bend [Float Vector]: Raw fingers bend {T, I, M, R, L}.
+        """
+
+        self.__data[name].append(list(fingers_bend))
+
+    def Get_Templates(self):
+        """
+        Description:
+            Function to get the calibrated templates.
+
+        Returns:
+            (1) parameter [Dictionary]: Templates {name: fingers bend {T, I, M, R, L}}, None if a gesture has no sample.
+        """
+
+        if any(len(data) == 0 for data in self.__data.values()):
+            return None
+
+        return {name: np.mean(np.asarray(data, dtype=np.float64), axis=0).tolist() for name, data in self.__data.items()}
+
+    def Apply(self, classifier):
+        """
+        Description:
+            Function to set the calibrated templates of the classifier.
+
+        Args:
+            (1) classifier [Gesture_Classifier]: Classifier of the glove.
+        """
+
+        for name, data in self.__data.items():
+            classifier.Calibrate(name, data)
+
+    def Save(self, file_path):
+        """
+        Description:
+            Function to save the calibrated templates to the parameter file (.json).
+
+        Args:
+            (1) file_path [String]: Path to the file.
+
+        Returns:
+            (1) parameter [Bool]: True if the templates have been saved, False if a gesture has fewer samples than 
+                                  CONST_GESTURE_MIN_NUM_OF_DATA or two templates are closer than CONST_GESTURE_MIN_DISTANCE.
+        """
+
+        num_of_data = {name: len(data) for name, data in self.__data.items()}
+        if any(n < CONST_GESTURE_MIN_NUM_OF_DATA for n in num_of_data.values()):
+            print(f'[ERROR] The gesture calibration is too short: {num_of_data}')
+            return False
+
+        templates = self.Get_Templates(); names = list(templates.keys())
+        for i, name_i in enumerate(names):
+            for name_j in names[i + 1:]:
+                if np.linalg.norm(np.subtract(templates[name_i], templates[name_j])) < CONST_GESTURE_MIN_DISTANCE:
+                    print(f'[ERROR] The gestures {name_i} and {name_j} are not distinguishable: {templates}')
+                    return False
+
+        # The file is replaced in one step (the glove never reads a partially written file).
+        with open(file_path + '.tmp', 'w') as f:
+            json.dump({'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'), 'num_of_data': num_of_data, 'templates': templates}, f, indent=2)
+        os.replace(file_path + '.tmp', file_path)
+
+        print(f'[INFO] The gesture calibration has been successfully saved: {file_path}')
+        for name, template in templates.items():
+            print(f'[INFO] Gesture {name} {{T, I, M, R, L}}: {[round(value, 2) for value in template]}')
+
+        return True
+
+def Load_Gestures(file_path, templates):
+    """
+    Description:
+        Function to load the calibrated templates of the hand gestures from the parameter file (Gesture_Calibration.Save).
+
+    Args:
+        (1) file_path [String]: Path to the file.
+        (2) templates [Dictionary]: Default templates {name: fingers bend {T, I, M, R, L}} (if there is no valid file).
+
+    Returns:
+        (1) parameter [Dictionary]: Templates of the gestures (the order of the default templates).
+    """
+
+    if not os.path.isfile(file_path):
+        print(f'[INFO] No gesture calibration file ({file_path}), the default templates are used.')
+        return templates
+
+    try:
+        with open(file_path, 'r') as f:
+            calibration = json.load(f)
+
+        assert set(calibration['templates'].keys()) == set(templates.keys())
+        assert all(len(calibration['templates'][name]) == len(template) and np.all(np.isfinite(calibration['templates'][name])) 
+                   for name, template in templates.items())
+
+    except (ValueError, KeyError, TypeError, AttributeError, AssertionError):
+        print(f'[ERROR] The gesture calibration file is not valid ({file_path}), the default templates are used.')
+        return templates
+
+    print(f'[INFO] The gesture calibration has been successfully loaded: {file_path} ({calibration["timestamp"]})')
+
+    return {name: [float(value) for value in calibration['templates'][name]] for name in templates.keys()}
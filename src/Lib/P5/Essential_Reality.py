@@ -31,12 +31,26 @@ import sys
 import time
 # Threading (Thread-based parallelism)
 import threading
-# CTypes (C compatible data types, and allows calling functions in DLLs)
-import ctypes as ct
-# Lib.Signal.Filter (Filters: SMA, BLP)
-import Lib.Signal.Filter as Filter
+# Collections (Container datatypes)
+import collections
+# OS (Operating system interfaces)
+import os
+# Lib.P5.P5_Binding (Binding layer of the P5 library)
+import Lib.P5.P5_Binding as P5_Binding
+# Lib.P5.P5_Simulator (Simulated backend of the P5 library)
+import Lib.P5.P5_Simulator as P5_Simulator
+# Lib.P5.Gesture (Hand-gesture classifier)
+import Lib.P5.Gesture as Gesture
+# Lib.P5.Calibration (Calibration of the workspace and of the gestures)
+import Lib.P5.Calibration as Calibration
+# Lib.P5.History (History of the sensor samples)
+import Lib.P5.History as History
+# Lib.P5.Tracking (Tracking quality of the glove position)
+import Lib.P5.Tracking as Tracking
 # Lib.Parameters (Main Control Parameters)
 import Lib.Parameters as Parameters
+# Lib.Scheduler (Scheduler of the periodic loops)
+import Lib.Scheduler as Scheduler
 
 """
 Essential Reality P5 Glove Notes: 
@@ -45,189 +59,269 @@ Essential Reality P5 Glove Notes:
         and convert them to the position (x, y, z) and orientation in terms of pitch, yaw and roll. The glove also has 
         bend sensors in the fingers and four buttons on the top. 
       - Communication between the gloves and the application on the computer is via USB port.
+      - Several gloves can be connected at the same time. All of them are sampled in one pass of the acquisition loop, 
+        the data of each glove are available under its identification number (0, 1, ..., Get_Count() - 1).
 
 Warning: It is necessary to use the 32-bit version of Python!
 """
 
 # Initialization of Constants:
 # Sensor Units
-CONST_P5_CM      = ct.c_float((2.54/51.2))
+CONST_P5_CM      = 2.54/51.2
 # Time step inside threads
 CONST_TIME_STEP  = Parameters.CONST_TIME_STEP
 # Fingers Bend
 CONST_FINGERS_BEND_LIMIT = [[5.0, 65.0], [5.0, 65.0], [5.0, 65.0], [5.0, 65.0], [5.0, 65.0]]
-# Offset for gesture recognition
-CONST_FINGERS_BEND_OFFSET = 10.0
 # Gesture recognition: Hand (open or closed)
 CONST_HAND_STATE_OPEN   = False
 CONST_HAND_STATE_CLOSED = True
 # Other auxiliary constants
 CONST_NULL = 0
 CONST_NUM_OF_FINGERS = 5
+CONST_NUM_OF_BUTTONS = 4
+
+"""
+Description:
+    Snapshot of the glove data from one pass of the acquisition loop. The snapshot is immutable, so a consumer 
+    always gets the position, the fingers bend and the buttons sampled together.
+
+        timestamp [Float]: Time of the sample in seconds (monotonic clock: time.perf_counter()).
+        sequence [INT]: Sequence number of the sample (0, 1, 2, ...), -1 if there is no sample yet.
+        position [Float Tuple]: Raw position (X, Y, Z).
+        fingers_bend [Float Tuple]: Raw fingers bend (Thumb, Index, Middle, Ring, Little).
+        buttons [Bool Tuple]: Buttons (A, B, C, D).
+        valid [Bool]: Validity of the position (Tracking.Tracking_Quality), False if the IR tracking is lost.
+"""
+P5_Sample = collections.namedtuple('P5_Sample', ['timestamp', 'sequence', 'position', 'fingers_bend', 'buttons', 'valid'])
 
 class P5_Glove(object):
     """
     Description:
-        A class for controlling and collecting data from the Essential reality glove.
+        A class for controlling and collecting data from the Essential reality gloves (one or more).
 
     Initialization of the Class:
         Args:
             (1) lib_name [string]: DLL name.
+            (2) library [P5_Library]: Backend with the interface of P5_Binding.P5_Library (e.g. P5_Simulator.P5_Library_Simulator), 
+                                      None: the DLL {lib_name} is loaded.
+            (3) time_step [Float]: Time step of the acquisition loop.
         
         Example:
             Initialization:
                 Cls = Essential_Reality.P5_Glove('P5DLL.dll')
+                Cls = Essential_Reality.Create_P5_Glove('P5DLL.dll')  # Backend selected by Parameters.CONST_P5_BACKEND
 
             Connection:
                 Cls.Connect()
 
             Returns:
                 Cls.Get_{name}(ID)          # Cls.Get_Absolute_Position_ID(0): Raw X-Position
+                Cls.Get_Sample()            # The last snapshot of all data (P5_Sample)
+                Cls.Get_History()           # History of the samples (History.Sensor_History)
+                Cls.Get_Sample(glove)       # The same for the glove {glove} (Cls.Get_IDs()), the default glove is the last one
     """
-    def __init__(self, lib_name = 'P5DLL.dll'):
+    def __init__(self, lib_name = 'P5DLL.dll', library = None, time_step = CONST_TIME_STEP):
         # << PUBLIC >> #
         self.error = False
 
         # << PRIVATE >> #
+        # Time step of the acquisition loop
+        self.__time_step = time_step
         # Load the library (.dll) to communicate with the P5 Glove
         try:
-            self.__dll_lib = ct.cdll.LoadLibrary(lib_name)
-        except FileNotFoundError as error:
+            self.__dll_lib = P5_Binding.P5_Library(lib_name) if library is None else library
+        except OSError as error:
             self.__dll_lib = CONST_NULL
             self.error = True 
             print('[ERROR] Could not find module ' + lib_name + '. Try using the full path with constructor syntax.')
 
         # P5 Glove Data:
-        #   Identificational number
-        self.__id = ct.c_int(CONST_NULL - 1)
-        #   Position Raw (X, Y, Z)
-        self.__pos_rt = [ct.c_float(0.0), ct.c_float(0.0), ct.c_float(0.0)] 
-        #   Fingers Bend Raw (Thumb, Index, Middle, Ring, Little)
-        self.__fingers_bend_rt = [ct.c_float(0.0), ct.c_float(0.0), ct.c_float(0.0), ct.c_float(0.0), ct.c_float(0.0)]; 
-        #   Buttons (A, B, C, D)
-        self.__buttons_rt = [ct.c_float(0.0), ct.c_float(0.0), ct.c_float(0.0), ct.c_float(0.0)]
+        #   Identificational number of the default glove
+        self.__id = CONST_NULL - 1
+        #   Identificational numbers of all connected gloves
+        self.__ids = []
+        #   Templates of the hand gestures (the calibrated templates if the parameter file exists)
+        self.__gesture_templates = Calibration.Load_Gestures(Parameters.CONST_GESTURE_CALIBRATION_FILE_PATH, Parameters.CONST_GESTURE_TEMPLATES)
+        #   Data of each glove (index: identificational number), the data of one glove until the connection
+        self.__Create_Glove_Data(1)
+        # Acquisition loop (Thread) and its state
+        self.__t_acquisition = None
+        self.__is_running    = False
+        #   The acquisition loop of the connected gloves has been started (Wait_For_Connection).
+        self.__is_connected  = threading.Event()
+
+    def __Create_Glove_Data(self, count):
+        #   The last snapshot of all data
+        #       Note: The reference is replaced in one step by the acquisition loop, so no lock is needed.
+        self.__sample = [P5_Sample(0.0, -1, (0.0,) * 3, (0.0,) * CONST_NUM_OF_FINGERS, (False,) * CONST_NUM_OF_BUTTONS, False)] * count
+        #   History of the samples (bounded memory)
+        self.__history = [History.Sensor_History(Parameters.CONST_P5_HISTORY_NUM_OF_DATA) for _ in range(count)]
+        #   Hand-gesture classifier (updated with each snapshot)
+        self.__gesture = [Gesture.Gesture_Classifier(self.__gesture_templates, Parameters.CONST_GESTURE_HYSTERESIS, Parameters.CONST_GESTURE_TOLERANCE) 
+                          for _ in range(count)]
+        #   Tracking quality of the position (the validity of each snapshot)
+        #       Note: The time between two samples of the glove (not of the simulated loop).
+        self.__tracking = [Tracking.Tracking_Quality(Parameters.CONST_FILTER_POS_LIMIT, *Parameters.CONST_TRACKING_QUALITY, CONST_TIME_STEP) 
+                           for _ in range(count)]
 
     def Connect(self):
         """
         Description:
-            Function to connect and initialize the P5 glove. The function also triggers multi-threaded 
-            processing for data collection.
+            Function to connect and initialize the P5 glove. The function also starts the acquisition loop 
+            (the function blocks until the glove is disconnected).
         """
 
         # Initialization and start the glove driver
-        self.__dll_lib.P5_Init()
-
-        if self.__dll_lib.P5_GetCount() > CONST_NULL:
-            # Get the number of gloves
-            self.__id = ct.c_int(self.__dll_lib.P5_GetCount() - 1)
+        self.__dll_lib.Init()
+
+        count = self.__dll_lib.Get_Count()
+        if count > CONST_NULL:
+            # Get the number of gloves (the default glove is the last one)
+            self.__ids = list(range(count))
+            self.__id  = count - 1
+            self.__Create_Glove_Data(count)
             # Set Parameters (Units)
-            self.__dll_lib.P5_SetUnits(CONST_P5_CM)
+            self.__dll_lib.Set_Units(CONST_P5_CM)
             # Disable mouse control on the desktop
-            self.__dll_lib.P5_SetMouseState(self.__dll_lib.P5_GetCount() - 1, ct.c_bool(False))
+            for id in self.__ids:
+                self.__dll_lib.Set_Mouse_State(id, False)
 
-            print('[INFO] The USB device is recognized.')
+            print(f'[INFO] The USB device is recognized. Number of gloves: {count}')
             
-            # Start multi-threaded processing for data collection
+            # Start the acquisition loop
             self.__Data_Collection()
         else:
-            self.__id  = ct.c_int(CONST_NULL - 1)
+            self.__id  = CONST_NULL - 1
             self.error = True 
             print('[ERROR] The USB device is not recognized. Try connecting the device again.')
 
-    def __Get_Absolute_Position(self):
+    def __Acquisition(self):
         """
         Description:
-            Function (thread) to collect position data from gloves.
+            Function (thread) to collect all data from the gloves (position, fingers bend and buttons) in one pass 
+            per time step and to publish them as one snapshot per glove.
         """
 
-        while True:
-            # t_{0}: time start
-            t_0 = time.time()
+        # Everything needed by one glove in the pass: id, output array of the library (overwritten in each pass), 
+        # history, hand-gesture classifier and tracking quality
+        #   Note: Resolved once, so the cost of each glove in the pass is the same.
+        gloves = [(id, self.__dll_lib.Get_Data(id), self.__history[id], self.__gesture[id], self.__tracking[id]) for id in self.__ids]
+        sample = self.__sample
 
-            # Get the raw data from the sensor
-            self.__dll_lib.P5_GetAbsolutePos(self.__id, 
-                                             ct.byref(self.__pos_rt[0]), 
-                                             ct.byref(self.__pos_rt[1]), 
-                                             ct.byref(self.__pos_rt[2]))
+        # Scheduler of the loop (absolute deadlines, period: time step)
+        RATE = Scheduler.Rate(self.__time_step, name = 'P5_Acquisition')
 
-            # t_{1}: time stop
-            #   t = t_{1} - t_{0}
-            t = time.time() - t_0
+        sequence = 0
+        while self.__is_running == True:
+            # t_{0}: time start (the timestamp of all gloves in the pass)
+            t_0 = time.perf_counter()
 
-            # Recalculate the time
-            if t < CONST_TIME_STEP:
-                time.sleep(CONST_TIME_STEP - t)
+            for id, data_rt, history, gesture, tracking in gloves:
+                # Get the raw data from the sensor (Position, Fingers Bend, Buttons)
+                self.__dll_lib.Read(id)
+                position = tuple(data_rt[P5_Binding.CONST_P5_DATA_POSITION])
 
-    def __Get_Fingers_Bend(self):
-        """
-        Description:
-            Function (thread) to collect fingers bend data from gloves.
-        """
+                # Publish the snapshot (with the validity of the position)
+                sample[id] = P5_Sample(t_0, sequence, position, tuple(data_rt[P5_Binding.CONST_P5_DATA_FINGERS_BEND]), 
+                                       tuple(b != 0.0 for b in data_rt[P5_Binding.CONST_P5_DATA_BUTTONS]), tracking.Compute(position))
 
-        while True:
-            # t_{0}: time start
-            t_0 = time.time()
-
-            # Get the raw data from the sensor
-            self.__dll_lib.P5_GetFingerBends(self.__id, 
-                                             ct.byref(self.__fingers_bend_rt[0]), 
-                                             ct.byref(self.__fingers_bend_rt[1]), 
-                                             ct.byref(self.__fingers_bend_rt[2]),
-                                             ct.byref(self.__fingers_bend_rt[3]),
-                                             ct.byref(self.__fingers_bend_rt[4]))
-
-            # t_{1}: time stop
-            #   t = t_{1} - t_{0}
-            t = time.time() - t_0
-
-            # Recalculate the time
-            if t < CONST_TIME_STEP:
-                time.sleep(CONST_TIME_STEP - t)
-
-    def __Get_Buttons_Value(self):
-        while True:
-            # t_{0}: time start
-            t_0 = time.time()
-
-            # Get the raw data from the sensor
-            self.__dll_lib.P5_GetButtons(self.__id, 
-                                         ct.byref(self.__buttons_rt[0]),
-                                         ct.byref(self.__buttons_rt[1]),
-                                         ct.byref(self.__buttons_rt[2]),
-                                         ct.byref(self.__buttons_rt[3]))
-
-            # t_{1}: time stop
-            #   t = t_{1} - t_{0}
-            t = time.time() - t_0
-
-            # Recalculate the time
-            if t < CONST_TIME_STEP:
-                time.sleep(CONST_TIME_STEP - t)
+                # History of the samples
+                history.Append(sample[id])
 
-    def __Data_Collection(self):
-        try:
-            # Start Stream: Thread (Position: X, Y, Z)
-            self.__t_position_rt = threading.Thread(target = self.__Get_Absolute_Position, daemon = True)
-            self.__t_position_rt.start()
+                # Hand-gesture recognition
+                gesture.Compute(sample[id].fingers_bend)
 
-            # Start Stream: Thread (Fingers Bend: T, I, M, R, L)
-            self.__t_fingers_bend_rt = threading.Thread(target = self.__Get_Fingers_Bend, daemon = True)
-            self.__t_fingers_bend_rt.start()
+            sequence += 1
 
-            # Start Stream: Thread {Buttons: A, B, C, D}
-            self.__t_buttons_rt = threading.Thread(target = self.__Get_Buttons_Value, daemon = True)
-            self.__t_buttons_rt.start()
+            # Wait for the next deadline
+            RATE.Sleep()
+
+    def __Data_Collection(self):
+        try:
+            # Start Stream: Thread (each glove - Position: X, Y, Z; Fingers Bend: T, I, M, R, L; Buttons: A, B, C, D)
+            self.__is_running = True
+            self.__t_acquisition = threading.Thread(target = self.__Acquisition, daemon = True)
+            self.__t_acquisition.start()
+            self.__is_connected.set()
 
-            while self.__t_position_rt.is_alive() and self.__t_fingers_bend_rt.is_alive() and self.__t_buttons_rt.is_alive():
-                self.__t_position_rt.join(0.0001)
-                self.__t_fingers_bend_rt.join(0.0001)
-                self.__t_buttons_rt.join(0.0001)
+            while self.__t_acquisition.is_alive():
+                self.__t_acquisition.join(0.0001)
 
         except KeyboardInterrupt:
             self.Disconnect()
             sys.exit(1)
 
-    def Get_Absolute_Position_ID(self, id):
+    def Wait_For_Connection(self, timeout):
+        """
+        Description:
+            Function to wait until the gloves are connected and the acquisition loop is running (Connect is called 
+            from another thread).
+
+        Args:
+            (1) timeout [Float]: Maximum time to wait in seconds.
+
+        Returns:
+            (1) parameter [Bool]: The gloves are connected, False if the connection failed or the time is over.
+        """
+
+        t_0 = time.perf_counter()
+        while self.error != True and time.perf_counter() - t_0 < timeout:
+            if self.__is_connected.wait(0.01) == True:
+                return True
+
+        return False
+
+    def Get_Count(self):
+        """
+        Description:
+            Function to get the number of connected gloves.
+
+        Returns:
+            (1) parameter [INT]: Number of gloves.
+        """
+
+        return len(self.__ids)
+
+    def Get_IDs(self):
+        """
+        Description:
+            Function to get the identification numbers of the connected gloves.
+
+        Returns:
+            (1) parameter [INT List]: Identification numbers of the gloves.
+        """
+
+        return list(self.__ids)
+
+    def Get_Sample(self, glove = None):
+        """
+        Description:
+            Function to get the last snapshot of all data from the sensor.
+
+        Args:
+            (1) glove [INT]: Identification number of the glove, None: the default glove.
+
+        Returns:
+            (1) parameter [P5_Sample]: The snapshot (timestamp, sequence, position, fingers_bend, buttons).
+        """
+
+        return self.__sample[self.__id if glove is None else glove]
+
+    def Get_History(self, glove = None):
+        """
+        Description:
+            Function to get the history of the samples (e.g. the last N samples or the samples since t).
+
+        Args:
+            (1) glove [INT]: Identification number of the glove, None: the default glove.
+
+        Returns:
+            (1) parameter [Sensor_History]: History of the samples.
+        """
+
+        return self.__history[self.__id if glove is None else glove]
+
+    def Get_Absolute_Position_ID(self, id, glove = None):
         """
         Description:
             Function to get the raw position value from the sensor.
@@ -235,18 +329,20 @@ class P5_Glove(object):
         Input:
             (1) id [INT]: The identification value of the vector.
                           (ID{0}: X,ID{1}: Y,ID{2}: Z)
+            (2) glove [INT]: Identification number of the glove, None: the default glove.
         
         Returns:
             (1) parameter [Float]: Raw position value.
         """
         try:
-            assert id < len(self.__pos_rt)
-            return self.__pos_rt[id].value
+            sample = self.Get_Sample(glove)
+            assert id < len(sample.position)
+            return sample.position[id]
         except AssertionError as error:
             print('[ERROR] The identification number is out of range.')
 
 
-    def Get_Fingers_Bend_ID(self, id):
+    def Get_Fingers_Bend_ID(self, id, glove = None):
         """
         Description:
             Function to get the raw value of the fingers bend from the sensor.
@@ -254,17 +350,19 @@ class P5_Glove(object):
         Input:
             (1) id [INT]: The identification value of the vector.
                           (ID{0}: T,ID{1}: I,ID{2}: M, ID{3}: R, ID{4}: L)
+            (2) glove [INT]: Identification number of the glove, None: the default glove.
 
         Returns:
             (1) parameter [Float]: Raw fingers bend value.
         """
         try:
-            assert id < len(self.__fingers_bend_rt)
-            return self.__fingers_bend_rt[id].value
+            sample = self.Get_Sample(glove)
+            assert id < len(sample.fingers_bend)
+            return sample.fingers_bend[id]
         except AssertionError as error:
             print('[ERROR] The identification number is out of range.')
 
-    def Get_Buttons_Value_ID(self, id):
+    def Get_Buttons_Value_ID(self, id, glove = None):
         """
         Description:
             Function to get the raw value of the buttons from the sensor.
@@ -272,41 +370,118 @@ class P5_Glove(object):
         Input:
             (1) id [INT]: The identification value of the vector.
                           (ID{0}: A,ID{1}: B,ID{2}: C, ID{3}: D)
+            (2) glove [INT]: Identification number of the glove, None: the default glove.
 
         Returns:
             (1) parameter [Bool]: Converted raw button value (0.0/1.0) to bool (false/true).
         """
         try:
-            assert id < len(self.__buttons_rt)
-            return bool(self.__buttons_rt[id].value)
+            sample = self.Get_Sample(glove)
+            assert id < len(sample.buttons)
+            return sample.buttons[id]
         except AssertionError as error:
             print('[ERROR] The identification number is out of range.')
 
-    def Get_Hand_Gesture(self):
+    def Get_Tracking_Quality(self, glove = None):
+        """
+        Description:
+            Function to get the tracking-quality stage of the position (e.g. the state of the last sample or the number 
+            of the invalid samples).
+
+        Args:
+            (1) glove [INT]: Identification number of the glove, None: the default glove.
+
+        Returns:
+            (1) parameter [Tracking_Quality]: Tracking quality.
+        """
+
+        return self.__tracking[self.__id if glove is None else glove]
+
+    def Get_Hand_Gesture(self, glove = None):
         """
         Description:
             Function to hand gesture recognition (closed or open).
+
+        Args:
+            (1) glove [INT]: Identification number of the glove, None: the default glove.
+
+        Returns:
+            (1) parameter [Bool]: CONST_HAND_STATE_CLOSED if the gesture is 'CLOSED', otherwise CONST_HAND_STATE_OPEN.
         """
 
-        SMA = []
-        # Initialization of filters for each part.
-        for _, limit in enumerate(Parameters.CONST_FILTER_FINGERS_BEND_LIMIT):
-            # Simple Moving Average (SMA)
-            SMA.append(Filter.Simple_Moving_Average([limit[0], limit[1]], Parameters.CONST_FILTER_FINGERS_BEND_NUM_OF_DATA))
+        return CONST_HAND_STATE_CLOSED if self.Get_Hand_Gesture_Name(glove) == 'CLOSED' else CONST_HAND_STATE_OPEN
 
-        counter = 0
-        for i, f_b in enumerate(self.__fingers_bend_rt):
-            counter = counter + 1 if CONST_FINGERS_BEND_LIMIT[0][1] - CONST_FINGERS_BEND_OFFSET <= SMA[i].Compute(f_b.value) <= CONST_FINGERS_BEND_LIMIT[0][1] else counter
+    def Get_Hand_Gesture_Name(self, glove = None):
+        """
+        Description:
+            Function to get the name of the recognized hand gesture (Parameters.CONST_GESTURE_TEMPLATES).
+
+        Args:
+            (1) glove [INT]: Identification number of the glove, None: the default glove.
+
+        Returns:
+            (1) parameter [String]: Name of the gesture.
+        """
+
+        return self.__gesture[self.__id if glove is None else glove].Get_Gesture()
+
+    def Get_Gesture_Classifier(self, glove = None):
+        """
+        Description:
+            Function to get the hand-gesture classifier (e.g. calibration of the templates).
+
+        Args:
+            (1) glove [INT]: Identification number of the glove, None: the default glove.
 
-            if i != counter - 1:
-                return CONST_HAND_STATE_OPEN
+        Returns:
+            (1) parameter [Gesture_Classifier]: Classifier.
+        """
 
-        return CONST_HAND_STATE_CLOSED
+        return self.__gesture[self.__id if glove is None else glove]
             
     def Disconnect(self):
         """
         Description:
             Function to disconnect (close) the P5 glove.
         """
-        self.__dll_lib.P5_Close()
+        # Stop the acquisition loop (wait for the last pass)
+        self.__is_running = False
+        self.__is_connected.clear()
+        if self.__t_acquisition is not None and self.__t_acquisition is not threading.current_thread():
+            self.__t_acquisition.join(1.0)
+        self.__dll_lib.Close()
         time.sleep(2)
+
+def Create_P5_Glove(lib_name = 'P5DLL.dll'):
+    """
+    Description:
+        Function to create the P5 glove with the backend selected by the configuration (Parameters.CONST_P5_BACKEND):
+            'DLL'      : Essential Reality P5 library {lib_name}.
+            'REPLAY'   : Recordings (Parameters.CONST_P5_REPLAY_FILE_NAME) from the Evaluation/P5_Results folder.
+            'SYNTHETIC': Synthetic motion with noise and dropouts (Parameters.CONST_P5_SYNTHETIC_*).
+        The simulated backends run with the speed Parameters.CONST_P5_SIMULATION_SPEED and simulate 
+        Parameters.CONST_P5_SIMULATION_NUM_OF_GLOVES gloves.
+
+    Args:
+        (1) lib_name [string]: DLL name.
+
+    Returns:
+        (1) parameter [P5_Glove]: The P5 glove.
+    """
+
+    if Parameters.CONST_P5_BACKEND == 'DLL':
+        return P5_Glove(lib_name)
+
+    if Parameters.CONST_P5_BACKEND == 'REPLAY':
+        library = P5_Simulator.P5_Library_Simulator(P5_Simulator.CONST_SIMULATION_MODE_REPLAY, 
+                                                    [os.path.join(os.getcwd(), 'Evaluation', 'P5_Results', file_name + '.txt') 
+                                                     for file_name in Parameters.CONST_P5_REPLAY_FILE_NAME],
+                                                    num_of_gloves = Parameters.CONST_P5_SIMULATION_NUM_OF_GLOVES)
+    else:
+        library = P5_Simulator.P5_Library_Simulator(P5_Simulator.CONST_SIMULATION_MODE_SYNTHETIC, None, Parameters.CONST_P5_SYNTHETIC_NOISE, 
+                                                    Parameters.CONST_P5_SYNTHETIC_DROPOUT, num_of_gloves = Parameters.CONST_P5_SIMULATION_NUM_OF_GLOVES)
+
+    print(f'[INFO] Simulated P5 glove: {Parameters.CONST_P5_BACKEND} (Speed: {Parameters.CONST_P5_SIMULATION_SPEED}x, '
+          f'Gloves: {Parameters.CONST_P5_SIMULATION_NUM_OF_GLOVES})')
+
+    return P5_Glove(library = library, time_step = CONST_TIME_STEP / Parameters.CONST_P5_SIMULATION_SPEED)
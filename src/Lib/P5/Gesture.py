@@ -0,0 +1,153 @@
+"""
+## =========================================================================== ## 
+MIT License
+Copyright (c) 2021 Roman Parak
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+## =========================================================================== ## 
+Author   : Roman Parak
+Email    : Roman.Parak@outlook.com
+Github   : https://github.com/rparak
+File Name: Gesture.py
+## =========================================================================== ## 
+"""
+
+# Numpy (Array computing) [pip3 install numpy]
+import numpy as np
+# Lib.Signal.Filter (Filters: SMA, BLP, BLPMA, One Euro, Kalman)
+import Lib.Signal.Filter as Filter
+# Lib.Parameters (Main Control Parameters)
+import Lib.Parameters as Parameters
+
+class Gesture_Classifier(object):
+    """
+    Description:
+        A streaming hand-gesture classifier. The fingers bend {T, I, M, R, L} is smoothed by the simple moving 
+        average (the state is kept between the samples) and compared with the templates (centroids) of the gestures 
+        (nearest centroid, Euclidean distance). The cost per sample is constant (O(1)).
+
+        Hysteresis: The gesture is changed only if the distance to the new template is smaller than the distance 
+        to the current template minus {hysteresis}, so the gesture does not flicker between two templates.
+
+        Tolerance: A gesture with a tolerance is accepted only if each smoothed finger is within the tolerance 
+        of its template (e.g. CLOSED: all five fingers within 60 +- 5). If the current gesture is not accepted, 
+        the nearest accepted gesture is used immediately (without the hysteresis), if no gesture is accepted, 
+        the first one.
+
+    Initialization of the Class:
+        Args:
+            (1) templates [Dictionary]: Templates of the gestures {name: fingers bend {T, I, M, R, L}}. 
+                                        Note: 
+                                            The first template is the initial gesture.
+            (2) hysteresis [Float]: Hysteresis (distance).
+            (3) tolerance [Dictionary]: Tolerance of the fingers bend {name: tolerance}, the other gestures are not limited.
+            (4) limit [Float Matrix]: Limit of each finger (Boundaries: [Lower Value{-}, Upper Value{+}]).
+            (5) num_of_data [INT]: Number of total periods of the moving average.
+
+        Example:
+            Initialization:
+                Cls = Gesture_Classifier(Parameters.CONST_GESTURE_TEMPLATES, Parameters.CONST_GESTURE_HYSTERESIS, 
+                                         Parameters.CONST_GESTURE_TOLERANCE)
+
+            Calculation:
+                Cls.Compute([T{0}, I{0}, M{0}, R{0}, L{0}])
+                ...
+                Cls.Compute([T{n}, I{n}, M{n}, R{n}, L{n}])
+
+            Returns:
+                Cls.Get_Gesture()   # Name of the gesture (e.g. 'CLOSED')
+    """
+
+    def __init__(self, templates = Parameters.CONST_GESTURE_TEMPLATES, hysteresis = Parameters.CONST_GESTURE_HYSTERESIS, 
+                 tolerance = Parameters.CONST_GESTURE_TOLERANCE, limit = Parameters.CONST_FILTER_FINGERS_BEND_LIMIT, 
+                 num_of_data = Parameters.CONST_FILTER_FINGERS_BEND_NUM_OF_DATA):
+        # << PRIVATE >> #
+        # Names and templates (centroids) of the gestures
+        self.__names     = list(templates.keys())
+        self.__templates = np.array(list(templates.values()), dtype=np.float64)
+        # Hysteresis (distance)
+        self.__hysteresis = hysteresis
+        # Tolerance of each gesture (inf: not limited)
+        self.__tolerance_by_name = dict(tolerance)
+        self.__tolerance = np.array([self.__tolerance_by_name.get(name, np.inf) for name in self.__names], dtype=np.float64)
+        # Filter of the fingers bend (Simple Moving Average)
+        self.__filter = Filter.Filter_Bank(Filter.CONST_FILTER_TYPE_SMA, limit, num_of_data, warm_start = True)
+        # Index of the current gesture
+        self.__index = 0
+
+    def Compute(self, fingers_bend):
+        """
+        Description:
+            Main function to classify the gesture from a new sample.
+
+        Args:
+            (1) fingers_bend [Float Vector]: Raw fingers bend {T, I, M, R, L}.
+        
+        Returns:
+            (1) parameter [INT]: Index of the gesture.
+        """
+
+        # Squared distance to each accepted template (the other templates: inf)
+        difference = self.__templates - self.__filter.Compute(fingers_bend)
+        distance = np.where(np.all(np.abs(difference) <= self.__tolerance[:, np.newaxis], axis=1), np.sum(difference**2, axis=1), np.inf)
+
+        # The nearest template with the hysteresis (the current template is not accepted: without the hysteresis)
+        index = int(np.argmin(distance))
+        if index != self.__index and (distance[self.__index] == np.inf or 
+                                      np.sqrt(distance[index]) + self.__hysteresis < np.sqrt(distance[self.__index])):
+            self.__index = index
+
+        return self.__index
+
+    def Get_Gesture(self):
+        """
+        Description:
+            Function to get the current gesture.
+
+        Returns:
+            (1) parameter [String]: Name of the gesture.
+        """
+
+        return self.__names[self.__index]
+
+    def Set_Template(self, name, fingers_bend):
+        """
+        Description:
+            Function to set (or add) the template of a gesture.
+
+        Args:
+            (1) name [String]: Name of the gesture.
+            (2) fingers_bend [Float Vector]: Template (centroid) of the fingers bend {T, I, M, R, L}.
+        """
+
+        if name in self.__names:
+            self.__templates[self.__names.index(name)] = fingers_bend
+        else:
+            self.__names.append(name)
+            self.__templates = np.vstack((self.__templates, np.asarray(fingers_bend, dtype=np.float64)))
+            self.__tolerance = np.append(self.__tolerance, self.__tolerance_by_name.get(name, np.inf))
+
+    def Calibrate(self, name, data):
+        """
+        Description:
+            Function to calibrate the template of a gesture from the recorded samples (the operator holds the gesture).
+
+        Args:
+            (1) name [String]: Name of the gesture.
+            (2) data [Float Matrix]: Raw fingers bend {number of samples, 5}.
+        """
+
+        self.Set_Template(name, np.mean(np.asarray(data, dtype=np.float64), axis=0))
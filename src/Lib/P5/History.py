@@ -0,0 +1,174 @@
+"""
+## =========================================================================== ## 
+MIT License
+Copyright (c) 2021 Roman Parak
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+## =========================================================================== ## 
+Author   : Roman Parak
+Email    : Roman.Parak@outlook.com
+Github   : https://github.com/rparak
+File Name: History.py
+## =========================================================================== ## 
+"""
+
+# Threading (Thread-based parallelism)
+import threading
+# Collections (Container datatypes)
+import collections
+# Numpy (Array computing) [pip3 install numpy]
+import numpy as np
+# Lib.Signal.Filter (Ring buffer)
+import Lib.Signal.Filter as Filter
+
+# Initialization of Constants:
+#   Layout of the channels in the buffer
+CONST_HISTORY_TIMESTAMP    = 0
+CONST_HISTORY_SEQUENCE     = 1
+CONST_HISTORY_POSITION     = slice(2, 5)
+CONST_HISTORY_FINGERS_BEND = slice(5, 10)
+CONST_HISTORY_BUTTONS      = slice(10, 14)
+CONST_HISTORY_VALID        = 14
+CONST_HISTORY_NUM_OF_CHANNELS = 15
+
+"""
+Description:
+    Samples from the history buffer (views of the buffer, one row per sample, oldest first).
+
+        timestamp [Float Vector]: Time of the samples in seconds {n}.
+        sequence [Float Vector]: Sequence numbers of the samples {n}.
+        position [Float Matrix]: Raw position {n, 3}.
+        fingers_bend [Float Matrix]: Raw fingers bend {n, 5}.
+        buttons [Float Matrix]: Buttons (0.0/1.0) {n, 4}.
+        valid [Float Vector]: Validity of the position (0.0/1.0) {n}.
+"""
+History_Samples = collections.namedtuple('History_Samples', ['timestamp', 'sequence', 'position', 'fingers_bend', 'buttons', 'valid'])
+
+class Sensor_History(object):
+    """
+    Description:
+        A fixed-size history of the glove samples (P5_Sample) in a preallocated NumPy ring buffer (Filter.Ring_Buffer), 
+        so the memory is bounded however long the session runs.
+
+        The queries return views of the buffer without any copying. The samples are ordered by the time, so a time range 
+        is found by a binary search over the timestamps (numpy.searchsorted).
+
+        Note:
+            A view is valid until the buffer is overwritten, i.e. for the next {num_of_data - n} samples. Copy the 
+            arrays (numpy.copy) if they are kept for a longer time.
+
+    Initialization of the Class:
+        Args:
+            (1) num_of_data [INT]: Capacity of the history (number of samples).
+
+        Example:
+            Initialization:
+                Cls = Sensor_History(num_of_data = 2500)
+
+            Calculation:
+                Cls.Append(sample{0})
+                ...
+                Cls.Append(sample{n})
+
+            Returns:
+                Cls.Get_Last(100)           # The last 100 samples
+                Cls.Get_Range(t_0, t_1)     # The samples with timestamps in the range [t_0, t_1]
+    """
+
+    def __init__(self, num_of_data = 2500):
+        # << PRIVATE >> #
+        # Ring buffer of the samples {number of channels, number of data}
+        self.__data_stack = Filter.Ring_Buffer(num_of_data, CONST_HISTORY_NUM_OF_CHANNELS)
+        # Preallocated row of a new sample
+        self.__value = np.zeros(CONST_HISTORY_NUM_OF_CHANNELS, dtype=np.float64)
+        # The buffer is written by the acquisition thread and read by the other threads.
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.__data_stack)
+
+    def __Samples(self, data):
+        # Views of the channels (one row per sample)
+        return History_Samples(data[CONST_HISTORY_TIMESTAMP], data[CONST_HISTORY_SEQUENCE], data[CONST_HISTORY_POSITION].T, 
+                               data[CONST_HISTORY_FINGERS_BEND].T, data[CONST_HISTORY_BUTTONS].T, data[CONST_HISTORY_VALID])
+
+    def Append(self, sample):
+        """
+        Description:
+            Function to add a new sample to the history.
+
+        Args:
+            (1) sample [P5_Sample]: Sample of the glove.
+        """
+
+        self.__value[CONST_HISTORY_TIMESTAMP] = sample.timestamp
+        self.__value[CONST_HISTORY_SEQUENCE]  = sample.sequence
+        self.__value[CONST_HISTORY_POSITION]     = sample.position
+        self.__value[CONST_HISTORY_FINGERS_BEND] = sample.fingers_bend
+        self.__value[CONST_HISTORY_BUTTONS]      = sample.buttons
+        self.__value[CONST_HISTORY_VALID]        = sample.valid
+
+        with self.__lock:
+            self.__data_stack.Append(self.__value)
+
+    def Get_Last(self, num_of_data):
+        """
+        Description:
+            Function to get the last {num_of_data} samples.
+
+        Args:
+            (1) num_of_data [INT]: Number of samples (less if the history is shorter).
+
+        Returns:
+            (1) parameter [History_Samples]: Views of the samples (oldest first).
+        """
+
+        with self.__lock:
+            data = self.__data_stack.Get_Data()
+
+        return self.__Samples(data[:, data.shape[1] - min(num_of_data, data.shape[1]):])
+
+    def Get_Range(self, t_0, t_1 = np.inf):
+        """
+        Description:
+            Function to get the samples with timestamps in the range [t_0, t_1] (e.g. samples since t_0).
+
+        Args:
+            (1) t_0 [Float]: Start time in seconds (monotonic clock).
+            (2) t_1 [Float]: End time in seconds (monotonic clock).
+
+        Returns:
+            (1) parameter [History_Samples]: Views of the samples (oldest first).
+        """
+
+        with self.__lock:
+            data = self.__data_stack.Get_Data()
+
+        # Binary search over the timestamps
+        timestamp = data[CONST_HISTORY_TIMESTAMP]
+        i_0 = np.searchsorted(timestamp, t_0, side='left')
+        i_1 = np.searchsorted(timestamp, t_1, side='right')
+
+        return self.__Samples(data[:, i_0:i_1])
+
+    def Clear(self):
+        """
+        Description:
+            Function to remove all samples from the history.
+        """
+
+        with self.__lock:
+            self.__data_stack.Clear()
@@ -0,0 +1,45 @@
+/*
+ * Stand-in for the Essential Reality P5 library (P5DLL) with the same functions.
+ * It is used to measure the overhead of the Python binding without a glove
+ * (Lib/P5/P5_Binding_Benchmark.py).
+ *
+ * Build (Linux):
+ *     $ gcc -shared -fPIC -O2 -o libP5DLL_Stub.so P5DLL_Stub.c
+ */
+
+typedef int P5BOOL;
+
+static int   p5_count = 0;
+static float p5_units = 1.0f;
+static long  p5_tick  = 0;
+
+P5BOOL P5_Init(void) { p5_count = 1; return 1; }
+void P5_Close(void) { p5_count = 0; }
+int P5_GetCount(void) { return p5_count; }
+void P5_SetUnits(float units) { p5_units = units; }
+P5BOOL P5_SetMouseState(int id, P5BOOL state) { (void)id; (void)state; return 1; }
+
+P5BOOL P5_GetAbsolutePos(int id, float *x, float *y, float *z)
+{
+    (void)id;
+    p5_tick++;
+    *x = (float)(p5_tick % 100) * p5_units;
+    *y = (float)(p5_tick % 200) * p5_units;
+    *z = -(float)(p5_tick % 300) * p5_units;
+    return 1;
+}
+
+P5BOOL P5_GetFingerBends(int id, float *thumb, float *index, float *middle, float *ring, float *little)
+{
+    (void)id;
+    *thumb = *index = *middle = *ring = *little = (float)(5 + p5_tick % 60);
+    return 1;
+}
+
+P5BOOL P5_GetButtons(int id, float *a, float *b, float *c, float *d)
+{
+    (void)id;
+    *a = (float)((p5_tick / 1000) % 2);
+    *b = *c = *d = 0.0f;
+    return 1;
+}
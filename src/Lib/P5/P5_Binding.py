@@ -0,0 +1,205 @@
+"""
+## =========================================================================== ## 
+MIT License
+Copyright (c) 2021 Roman Parak
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+## =========================================================================== ## 
+Author   : Roman Parak
+Email    : Roman.Parak@outlook.com
+Github   : https://github.com/rparak
+File Name: P5_Binding.py
+## =========================================================================== ## 
+"""
+
+# CTypes (C compatible data types, and allows calling functions in DLLs)
+import ctypes as ct
+
+"""
+Description:
+    Binding layer of the Essential Reality P5 library (P5DLL). The functions are resolved once and their prototypes 
+    are declared. The outputs of the position, fingers bend and buttons functions are written to one preallocated 
+    array of floats (one array per glove) through preallocated references (ct.byref), so reading the glove does not 
+    create any new ctypes objects.
+
+    Note:
+        The argument types of the reading functions (CONST_P5_PROTOTYPES_READ) are not declared (argtypes), only 
+        the result type. With declared argtypes, ctypes converts each argument (from_param) on each call, which 
+        costs more than the call itself (Lib/P5/P5_Binding_Benchmark.py). The arguments are always the preallocated 
+        references, so no conversion is needed.
+
+    Layout of the output array:
+        [0:3]  Position (X, Y, Z)
+        [3:8]  Fingers Bend (Thumb, Index, Middle, Ring, Little)
+        [8:12] Buttons (A, B, C, D)
+"""
+
+# Initialization of Constants:
+#   Layout of the output array
+CONST_P5_DATA_POSITION     = slice(0, 3)
+CONST_P5_DATA_FINGERS_BEND = slice(3, 8)
+CONST_P5_DATA_BUTTONS      = slice(8, 12)
+CONST_P5_DATA_SIZE         = 12
+#   Prototypes of the P5DLL functions: name: (restype, argtypes)
+#       Note: P5BOOL is an int.
+CONST_P5_PROTOTYPES = {'P5_Init': (ct.c_int, []),
+                       'P5_Close': (None, []),
+                       'P5_GetCount': (ct.c_int, []),
+                       'P5_SetUnits': (None, [ct.c_float]),
+                       'P5_SetMouseState': (ct.c_int, [ct.c_int, ct.c_int])}
+#   Prototypes of the reading functions: name: (restype, argtypes)
+#       Note: The argtypes are only used for documentation (see the note above).
+CONST_P5_PROTOTYPES_READ = {'P5_GetAbsolutePos': (ct.c_int, [ct.c_int] + [ct.POINTER(ct.c_float)] * 3),
+                            'P5_GetFingerBends': (ct.c_int, [ct.c_int] + [ct.POINTER(ct.c_float)] * 5),
+                            'P5_GetButtons': (ct.c_int, [ct.c_int] + [ct.POINTER(ct.c_float)] * 4)}
+
+class P5_Library(object):
+    """
+    Description:
+        A class to call the functions of the P5 library (P5DLL).
+
+    Initialization of the Class:
+        Args:
+            (1) lib_name [string]: Library name (P5DLL.dll, or a stand-in shared library with the same functions).
+
+        Note:
+            The library is loaded with ctypes.cdll.LoadLibrary(), an OSError is raised if it can not be found.
+        
+        Example:
+            Initialization:
+                Cls = P5_Binding.P5_Library('P5DLL.dll')
+
+            Reading (one pass):
+                Cls.Read(id)
+
+            Returns:
+                Cls.Get_Data(id)[CONST_P5_DATA_POSITION]   # Position (X, Y, Z)
+    """
+
+    def __init__(self, lib_name = 'P5DLL.dll'):
+        # << PRIVATE >> #
+        # Load the library and declare the prototypes of the functions
+        dll_lib = ct.cdll.LoadLibrary(lib_name)
+        for name, (restype, argtypes) in CONST_P5_PROTOTYPES.items():
+            function = getattr(dll_lib, name)
+            function.restype  = restype
+            function.argtypes = argtypes
+        for name, (restype, _) in CONST_P5_PROTOTYPES_READ.items():
+            getattr(dll_lib, name).restype = restype
+        self.__dll_lib = dll_lib
+        # Resolved functions (read in each pass)
+        self.__get_absolute_pos  = dll_lib.P5_GetAbsolutePos
+        self.__get_finger_bends  = dll_lib.P5_GetFingerBends
+        self.__get_buttons       = dll_lib.P5_GetButtons
+        # Preallocated output arrays of each glove {id: (id [ct.c_int], output array, references to each value)}
+        self.__buffer = {}
+
+    def __Create_Buffer(self, id):
+        # Output array of the glove and the references to each value
+        #   Note: The id is converted to ct.c_int once.
+        data = (ct.c_float * CONST_P5_DATA_SIZE)()
+        self.__buffer[id] = (ct.c_int(id), data, [ct.byref(data, i * ct.sizeof(ct.c_float)) for i in range(CONST_P5_DATA_SIZE)])
+
+        return self.__buffer[id]
+
+    def Init(self):
+        """
+        Description:
+            Function to initialize and start the glove driver.
+
+        Returns:
+            (1) parameter [Bool]: The driver has been started.
+        """
+
+        return bool(self.__dll_lib.P5_Init())
+
+    def Close(self):
+        """
+        Description:
+            Function to close the glove driver.
+        """
+
+        self.__dll_lib.P5_Close()
+
+    def Get_Count(self):
+        """
+        Description:
+            Function to get the number of the connected gloves.
+
+        Returns:
+            (1) parameter [INT]: Number of gloves.
+        """
+
+        return self.__dll_lib.P5_GetCount()
+
+    def Set_Units(self, units):
+        """
+        Description:
+            Function to set the units of the position.
+
+        Args:
+            (1) units [Float]: Conversion factor (e.g. centimeters: 2.54/51.2).
+        """
+
+        self.__dll_lib.P5_SetUnits(units)
+
+    def Set_Mouse_State(self, id, state):
+        """
+        Description:
+            Function to enable/disable the mouse control on the desktop.
+
+        Args:
+            (1) id [INT]: Identification number of the glove.
+            (2) state [Bool]: Mouse control enabled.
+        """
+
+        self.__dll_lib.P5_SetMouseState(id, int(state))
+
+    def Read(self, id):
+        """
+        Description:
+            Function to read the position, the fingers bend and the buttons of the glove (one pass) to the output array.
+
+        Args:
+            (1) id [INT]: Identification number of the glove.
+        """
+
+        buffer = self.__buffer.get(id)
+        if buffer is None:
+            buffer = self.__Create_Buffer(id)
+        id, _, p = buffer
+
+        self.__get_absolute_pos(id, p[0], p[1], p[2])
+        self.__get_finger_bends(id, p[3], p[4], p[5], p[6], p[7])
+        self.__get_buttons(id, p[8], p[9], p[10], p[11])
+
+    def Get_Data(self, id = 0):
+        """
+        Description:
+            Function to get the output array of the glove (the values of the last pass, the array is overwritten by the next pass).
+
+        Args:
+            (1) id [INT]: Identification number of the glove.
+
+        Returns:
+            (1) parameter [ctypes Float Array]: Output array (layout: CONST_P5_DATA_*).
+        """
+
+        buffer = self.__buffer.get(id)
+        if buffer is None:
+            buffer = self.__Create_Buffer(id)
+
+        return buffer[1]
@@ -0,0 +1,213 @@
+"""
+## =========================================================================== ## 
+MIT License
+Copyright (c) 2021 Roman Parak
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+## =========================================================================== ## 
+Author   : Roman Parak
+Email    : Roman.Parak@outlook.com
+Github   : https://github.com/rparak
+File Name: P5_Binding_Benchmark.py
+## =========================================================================== ## 
+"""
+
+# System (Default)
+import sys
+# Time (Time access and conversions)
+import time
+# OS (Operating system interfaces)
+import os
+# Platform (Access to underlying platform's identifying data)
+import platform
+# JSON (JSON encoder and decoder)
+import json
+# Subprocess (Subprocess management)
+import subprocess
+# Tempfile (Generate temporary files and directories)
+import tempfile
+# CTypes (C compatible data types, and allows calling functions in DLLs)
+import ctypes as ct
+# Numpy (Array computing) [pip3 install numpy]
+import numpy as np
+# Lib.P5.P5_Binding (Binding layer of the P5 library)
+import Lib.P5.P5_Binding as P5_Binding
+
+"""
+Description:
+    Micro-benchmark of the P5 library calls (one tick = position + fingers bend + buttons) without a glove. 
+    The P5 library is replaced by a stand-in shared library (P5DLL_Stub.c) compiled with gcc.
+
+    Compared implementations:
+        Legacy : Untyped cdll calls with new ct.byref() objects on each call (the previous implementation).
+        Typed  : Declared argtypes (ct.POINTER(ct.c_float)) with preallocated pointers.
+        Binding: P5_Binding.P5_Library (preallocated output array and references).
+
+    For each implementation, the per-tick latency (mean, p50, p99, max in microseconds) is reported.
+
+    Run (from the ../src/ folder, Linux):
+        $ python -m Lib.P5.P5_Binding_Benchmark
+
+    The results are saved to the ../src/Evaluation/Benchmark_Results/ folder (.json).
+"""
+
+# Initialization of Constants:
+#   Number of ticks (Warm-up, Measurement)
+CONST_BENCHMARK_NUM_OF_WARM_UP = 1000
+CONST_BENCHMARK_NUM_OF_TICKS   = 100000
+#   Source of the stand-in library
+CONST_BENCHMARK_STUB_SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'P5DLL_Stub.c')
+#   Output file name
+CONST_BENCHMARK_FILE_NAME = 'P5_Binding_Benchmark'
+
+def Build_Stub(directory_name):
+    """
+    Description:
+        Function to compile the stand-in library (gcc).
+
+    Args:
+        (1) directory_name [String]: Output directory.
+
+    Returns:
+        (1) parameter [String]: File path of the shared library.
+    """
+
+    file_path = os.path.join(directory_name, 'libP5DLL_Stub.so')
+    subprocess.run(['gcc', '-shared', '-fPIC', '-O2', '-o', file_path, CONST_BENCHMARK_STUB_SOURCE], check=True)
+
+    return file_path
+
+def Create_Legacy(lib_name):
+    """
+    Description:
+        Function to create one tick of the previous implementation (untyped calls, new ct.byref() objects).
+
+    Args:
+        (1) lib_name [String]: File path of the shared library.
+
+    Returns:
+        (1) parameter [Function]: Function to read one tick.
+    """
+
+    # Note: A new library object, so the functions do not share the declared prototypes.
+    dll_lib = ct.CDLL(lib_name)
+    pos_rt = [ct.c_float(0.0) for _ in range(3)]; fingers_bend_rt = [ct.c_float(0.0) for _ in range(5)]; buttons_rt = [ct.c_float(0.0) for _ in range(4)]
+    id = ct.c_int(0)
+
+    def Tick():
+        dll_lib.P5_GetAbsolutePos(id, ct.byref(pos_rt[0]), ct.byref(pos_rt[1]), ct.byref(pos_rt[2]))
+        dll_lib.P5_GetFingerBends(id, ct.byref(fingers_bend_rt[0]), ct.byref(fingers_bend_rt[1]), ct.byref(fingers_bend_rt[2]),
+                                  ct.byref(fingers_bend_rt[3]), ct.byref(fingers_bend_rt[4]))
+        dll_lib.P5_GetButtons(id, ct.byref(buttons_rt[0]), ct.byref(buttons_rt[1]), ct.byref(buttons_rt[2]), ct.byref(buttons_rt[3]))
+
+    return Tick
+
+def Create_Typed(lib_name):
+    """
+    Description:
+        Function to create one tick with the declared argtypes of the reading functions.
+
+    Args:
+        (1) lib_name [String]: File path of the shared library.
+
+    Returns:
+        (1) parameter [Function]: Function to read one tick.
+    """
+
+    dll_lib = ct.CDLL(lib_name)
+    for name, (restype, argtypes) in P5_Binding.CONST_P5_PROTOTYPES_READ.items():
+        getattr(dll_lib, name).restype  = restype
+        getattr(dll_lib, name).argtypes = argtypes
+    data = (ct.c_float * P5_Binding.CONST_P5_DATA_SIZE)()
+    #   Note: The pointers keep a reference to the array (from_buffer).
+    p = [ct.pointer(ct.c_float.from_buffer(data, i * ct.sizeof(ct.c_float))) for i in range(P5_Binding.CONST_P5_DATA_SIZE)]
+
+    def Tick():
+        dll_lib.P5_GetAbsolutePos(0, p[0], p[1], p[2])
+        dll_lib.P5_GetFingerBends(0, p[3], p[4], p[5], p[6], p[7])
+        dll_lib.P5_GetButtons(0, p[8], p[9], p[10], p[11])
+
+    return Tick
+
+def Create_Binding(lib_name):
+    """
+    Description:
+        Function to create one tick of the binding layer.
+
+    Args:
+        (1) lib_name [String]: File path of the shared library.
+
+    Returns:
+        (1) parameter [Function]: Function to read one tick.
+    """
+
+    P5_LIB = P5_Binding.P5_Library(lib_name)
+
+    return lambda: P5_LIB.Read(0)
+
+def Measure(tick):
+    """
+    Description:
+        Function to measure the latency of each tick.
+
+    Args:
+        (1) tick [Function]: Function to read one tick.
+
+    Returns:
+        (1) parameter [Dictionary]: Latency statistics (in microseconds).
+    """
+
+    for _ in range(CONST_BENCHMARK_NUM_OF_WARM_UP):
+        tick()
+
+    latency = np.zeros(CONST_BENCHMARK_NUM_OF_TICKS, dtype=np.int64)
+
+    for i in range(CONST_BENCHMARK_NUM_OF_TICKS):
+        t_0 = time.perf_counter_ns()
+        tick()
+        latency[i] = time.perf_counter_ns() - t_0
+
+    latency_us = latency / 1000.0
+
+    return {'mean_us': float(np.mean(latency_us)), 'p50_us': float(np.percentile(latency_us, 50)),
+            'p99_us': float(np.percentile(latency_us, 99)), 'max_us': float(np.max(latency_us))}
+
+def main():
+    with tempfile.TemporaryDirectory() as directory_name:
+        lib_name = Build_Stub(directory_name)
+
+        results = []
+        for name, create in [('Legacy', Create_Legacy), ('Typed', Create_Typed), ('Binding', Create_Binding)]:
+            statistics = Measure(create(lib_name))
+            results.append({'implementation': name, **statistics})
+
+            print(f'[{name:7s}] Mean: {statistics["mean_us"]:6.2f} us, p50: {statistics["p50_us"]:6.2f} us, p99: {statistics["p99_us"]:6.2f} us, '
+                  f'Max: {statistics["max_us"]:8.2f} us')
+
+    # Save the results (and information about the environment) to a file.
+    output = {'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'), 'platform': platform.platform(), 'python': platform.python_version(),
+              'num_of_ticks': CONST_BENCHMARK_NUM_OF_TICKS, 'results': results}
+
+    directory_name = os.path.join(os.getcwd(), 'Evaluation', 'Benchmark_Results')
+    os.makedirs(directory_name, exist_ok=True)
+    file_path = os.path.join(directory_name, CONST_BENCHMARK_FILE_NAME + '_' + time.strftime('%Y%m%d_%H%M%S') + '.json')
+    with open(file_path, 'w') as f:
+        json.dump(output, f, indent=2)
+
+    print(f'[INFO] The results have been successfully saved: {file_path}')
+
+if __name__ == '__main__':
+    sys.exit(main())
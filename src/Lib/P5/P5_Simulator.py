@@ -0,0 +1,202 @@
+"""
+## =========================================================================== ## 
+MIT License
+Copyright (c) 2021 Roman Parak
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+## =========================================================================== ## 
+Author   : Roman Parak
+Email    : Roman.Parak@outlook.com
+Github   : https://github.com/rparak
+File Name: P5_Simulator.py
+## =========================================================================== ## 
+"""
+
+# CSV (File reading and writing)
+import csv
+# CTypes (C compatible data types, and allows calling functions in DLLs)
+import ctypes as ct
+# Numpy (Array computing) [pip3 install numpy]
+import numpy as np
+# Lib.P5.P5_Binding (Binding layer of the P5 library)
+import Lib.P5.P5_Binding as P5_Binding
+# Lib.Parameters (Main Control Parameters)
+import Lib.Parameters as Parameters
+
+"""
+Description:
+    Simulated backend of the Essential Reality P5 glove for runs without the glove (e.g. load tests on Linux).
+    The class has the same interface as P5_Binding.P5_Library, so it is used by the P5_Glove class in the same 
+    way as the P5 library (Essential_Reality.Create_P5_Glove).
+
+    Each call of the Read() function produces one sample:
+        REPLAY   : The raw values of the recordings (Evaluation/P5_Results/*.txt: X_DATA_RT, ..., L_DATA_RT) in a loop.
+        SYNTHETIC: Slow motion of the hand inside the workspace (Lissajous curve), opening and closing of the hand, 
+                   Gaussian noise and dropouts (the position is frozen, the same as the IR occlusion of the glove).
+    The button A (movement) is always pressed. Each simulated glove starts at a different point of the recording / motion.
+"""
+
+# Initialization of Constants:
+#   Simulation mode
+CONST_SIMULATION_MODE_REPLAY    = 0
+CONST_SIMULATION_MODE_SYNTHETIC = 1
+#   Columns of the recordings (Position, Fingers Bend)
+CONST_REPLAY_COLUMNS = [['X_DATA_RT', 'Y_DATA_RT', 'Z_DATA_RT'], ['T_DATA_RT', 'I_DATA_RT', 'M_DATA_RT', 'R_DATA_RT', 'L_DATA_RT']]
+#   Synthetic motion: Frequency of the position {X, Y, Z} in Hz, Amplitude (part of the workspace), Period of the hand gesture in s
+CONST_SYNTHETIC_FRQ       = [0.25, 0.35, 0.2]
+CONST_SYNTHETIC_AMPLITUDE = 0.4
+CONST_SYNTHETIC_GESTURE_PERIOD = 4.0
+#   Synthetic motion: Fingers bend (Open, Closed)
+CONST_SYNTHETIC_FINGERS_BEND = [10.0, 60.0]
+#   Offset between the simulated gloves in s
+CONST_SIMULATION_GLOVE_OFFSET = 1.0
+
+def Load_Recording(file_path, columns):
+    """
+    Description:
+        Function to load the raw values from a recording (Utils.Data_Collection_*).
+
+    Args:
+        (1) file_path [String]: File path of the recording.
+        (2) columns [String Vector]: Names of the columns.
+
+    Returns:
+        (1) parameter [Float Matrix]: Raw values {number of samples, number of columns}.
+    """
+
+    with open(file_path, 'r', newline='') as f:
+        return np.array([[float(row[name]) for name in columns] for row in csv.DictReader(f)], dtype=np.float32)
+
+class P5_Library_Simulator(object):
+    """
+    Description:
+        A class to simulate the P5 library (the same interface as P5_Binding.P5_Library).
+
+    Initialization of the Class:
+        Args:
+            (1) mode [INT]: Simulation mode (CONST_SIMULATION_MODE_{REPLAY, SYNTHETIC}).
+            (2) file_path [String Vector]: File paths of the recordings (Position, Fingers Bend), REPLAY only.
+            (3) noise [Float]: Standard deviation of the noise (cm), SYNTHETIC only.
+            (4) dropout [Float Vector]: Probability of a dropout (per sample) and its length (samples), SYNTHETIC only.
+            (5) time_step [Float]: Time step between two samples (s), SYNTHETIC only.
+            (6) seed [INT]: Seed of the random generator, SYNTHETIC only.
+            (7) num_of_gloves [INT]: Number of simulated gloves.
+
+        Example:
+            Initialization:
+                Cls = P5_Library_Simulator(mode = CONST_SIMULATION_MODE_SYNTHETIC, noise = 0.3, dropout = [0.002, 25])
+
+            Reading (one sample):
+                Cls.Read(id)
+
+            Returns:
+                Cls.Get_Data(id)[P5_Binding.CONST_P5_DATA_POSITION]   # Position (X, Y, Z)
+    """
+
+    def __init__(self, mode = CONST_SIMULATION_MODE_SYNTHETIC, file_path = None, noise = 0.3, dropout = [0.002, 25], 
+                 time_step = Parameters.CONST_TIME_STEP, seed = 0, num_of_gloves = 1):
+        # << PRIVATE >> #
+        # Simulation mode
+        self.__mode = mode
+        # Time step between two samples
+        self.__time_step = time_step
+        # Number of simulated gloves, number of connected gloves
+        self.__num_of_gloves = num_of_gloves
+        self.__count = 0
+        # Output arrays of each glove (the same type and layout as P5_Binding.P5_Library) and their NumPy views
+        self.__data_rt = [(ct.c_float * P5_Binding.CONST_P5_DATA_SIZE)() for _ in range(num_of_gloves)]
+        self.__data    = [np.ctypeslib.as_array(data_rt) for data_rt in self.__data_rt]
+        # Index of the sample of each glove (the gloves start at a different point)
+        self.__index = [int(i * CONST_SIMULATION_GLOVE_OFFSET / time_step) for i in range(num_of_gloves)]
+        # Button A (movement) is always pressed
+        for data in self.__data:
+            data[P5_Binding.CONST_P5_DATA_BUTTONS.start] = 1.0
+
+        if self.__mode == CONST_SIMULATION_MODE_REPLAY:
+            # Raw values of the recordings (Position, Fingers Bend)
+            self.__recording = [Load_Recording(f_p, columns) for f_p, columns in zip(file_path, CONST_REPLAY_COLUMNS)]
+        else:
+            # Parameters of the synthetic motion
+            self.__noise = noise; self.__dropout = dropout
+            self.__rng = np.random.default_rng(seed)
+            # Center and amplitude of the motion inside the workspace
+            limit = np.array(Parameters.CONST_FILTER_POS_LIMIT, dtype=np.float64)
+            self.__center    = np.mean(limit, axis=1)
+            self.__amplitude = CONST_SYNTHETIC_AMPLITUDE * (limit[:, 1] - limit[:, 0])
+            # Number of the remaining samples of the dropout (each glove)
+            self.__dropout_counter = [0] * num_of_gloves
+
+    def Init(self):
+        self.__count = self.__num_of_gloves
+        return True
+
+    def Close(self):
+        self.__count = 0
+
+    def Get_Count(self):
+        return self.__count
+
+    def Set_Units(self, units):
+        pass
+
+    def Set_Mouse_State(self, id, state):
+        pass
+
+    def Read(self, id):
+        """
+        Description:
+            Function to generate one sample (position, fingers bend and buttons) to the output array.
+
+        Args:
+            (1) id [INT]: Identification number of the glove.
+        """
+
+        data = self.__data[id]; index = self.__index[id]
+
+        if self.__mode == CONST_SIMULATION_MODE_REPLAY:
+            data[P5_Binding.CONST_P5_DATA_POSITION]     = self.__recording[0][index % self.__recording[0].shape[0]]
+            data[P5_Binding.CONST_P5_DATA_FINGERS_BEND] = self.__recording[1][index % self.__recording[1].shape[0]]
+        else:
+            t = index * self.__time_step
+
+            # Dropout: The position is frozen.
+            if self.__dropout_counter[id] == 0 and self.__rng.random() < self.__dropout[0]:
+                self.__dropout_counter[id] = self.__dropout[1]
+            if self.__dropout_counter[id] > 0:
+                self.__dropout_counter[id] -= 1
+            else:
+                data[P5_Binding.CONST_P5_DATA_POSITION] = (self.__center + self.__amplitude * np.sin(2.0 * np.pi * np.array(CONST_SYNTHETIC_FRQ) * t) 
+                                                           + self.__rng.normal(0.0, self.__noise, 3))
+
+            # Hand gesture: Open / Closed (half of the period)
+            closed = (t % CONST_SYNTHETIC_GESTURE_PERIOD) >= CONST_SYNTHETIC_GESTURE_PERIOD / 2.0
+            data[P5_Binding.CONST_P5_DATA_FINGERS_BEND] = CONST_SYNTHETIC_FINGERS_BEND[int(closed)] + self.__rng.normal(0.0, self.__noise, 5)
+
+        self.__index[id] += 1
+
+    def Get_Data(self, id = 0):
+        """
+        Description:
+            Function to get the output array of the glove (the values of the last sample).
+
+        Args:
+            (1) id [INT]: Identification number of the glove.
+
+        Returns:
+            (1) parameter [ctypes Float Array]: Output array (layout: P5_Binding.CONST_P5_DATA_*).
+        """
+
+        return self.__data_rt[id]
@@ -0,0 +1,197 @@
+"""
+## =========================================================================== ## 
+MIT License
+Copyright (c) 2021 Roman Parak
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+## =========================================================================== ## 
+Author   : Roman Parak
+Email    : Roman.Parak@outlook.com
+Github   : https://github.com/rparak
+File Name: Tracking.py
+## =========================================================================== ## 
+"""
+
+# Collections (Container datatypes)
+import collections
+# Lib.Parameters (Main Control Parameters)
+import Lib.Parameters as Parameters
+
+# Initialization of Constants:
+#   State of the tracking (the reason why the sample is not valid)
+CONST_TRACKING_VALID        = 0
+CONST_TRACKING_FROZEN       = 1
+CONST_TRACKING_OUT_OF_RANGE = 2
+CONST_TRACKING_JUMP         = 3
+CONST_TRACKING_RECOVERY     = 4
+CONST_TRACKING_STATE_NAMES  = ['VALID', 'FROZEN', 'OUT_OF_RANGE', 'JUMP', 'RECOVERY']
+
+class Tracking_Quality(object):
+    """
+    Description:
+        A tracking-quality stage of the glove position. If the IR LEDs of the glove are occluded, the library keeps 
+        returning the last (frozen) position or wild values. Each sample is flagged as valid / not valid:
+
+            FROZEN      : The position has not changed (all of the axes) for more than {max_frozen} seconds.
+                          Note: The glove updates the position slower than it is sampled, so a few identical 
+                                samples in a row are normal.
+            OUT_OF_RANGE: The position is out of the limit extended by {margin} (any of the axes).
+            JUMP        : The position deviates from the running median of the last {num_of_data} samples by more 
+                          than {max_deviation} (any of the axes).
+                          Note: The real glove switches between two solutions of the IR tracking from one sample to 
+                                the next (e.g. Z: -36 / -45 cm), so a sample can not be compared with the previous one. 
+                                The switching is left to the filters of the subscribers, only the spikes far from 
+                                the median are rejected. A real movement moves the median within a few samples.
+            RECOVERY    : The sample is good, but the tracking was lost (FROZEN or OUT_OF_RANGE) less than {recovery} 
+                          seconds ago (the first samples after the loss are often wild). A single JUMP does not 
+                          start the recovery.
+
+        The cost per sample is constant (the median of {num_of_data} values of three axes).
+
+        Recording Evaluation/P5_Results/Experiment_Position.txt (X/Y/Z_DATA_RT, the default parameters): 
+            Invalid samples: 68 of 1001 (6.8 %), JUMP 18, RECOVERY 33, OUT_OF_RANGE 17, FROZEN 0.
+
+    Initialization of the Class:
+        Args:
+            (1) limit [Float Matrix]: Limit of each axis (Boundaries: [Lower Value{-}, Upper Value{+}]).
+            (2) margin [Float]: Margin of the limit (cm).
+            (3) max_frozen [Float]: Maximum time of the frozen position in seconds.
+            (4) num_of_data [INT]: Number of the samples of the running median.
+            (5) max_deviation [Float]: Maximum deviation from the running median (cm).
+            (6) recovery [Float]: Time of the good samples needed after the tracking loss in seconds.
+            (7) time_step [Float]: Time between two samples in seconds.
+
+        Example:
+            Initialization:
+                Cls = Tracking_Quality(Parameters.CONST_FILTER_POS_LIMIT, *Parameters.CONST_TRACKING_QUALITY)
+
+            Calculation:
+                Cls.Compute([X{0}, Y{0}, Z{0}])
+                ...
+                Cls.Compute([X{n}, Y{n}, Z{n}])     # True if the sample is valid
+
+            Returns:
+                Cls.Get_State()                     # CONST_TRACKING_{VALID, FROZEN, OUT_OF_RANGE, JUMP, RECOVERY}
+                Cls.Get_Num_Of_Invalid()            # Number of the invalid samples of each state
+    """
+
+    def __init__(self, limit = Parameters.CONST_FILTER_POS_LIMIT, margin = 10.0, max_frozen = 0.1, num_of_data = 9, max_deviation = 15.0, 
+                 recovery = 0.02, time_step = Parameters.CONST_TIME_STEP):
+        # << PRIVATE >> #
+        # Limit of each axis (extended by the margin)
+        self.__limit = [[l[0] - margin, l[1] + margin] for l in limit]
+        # Maximum number of the identical samples, maximum deviation from the median, number of the good samples 
+        # needed after the tracking loss
+        self.__max_frozen    = int(round(max_frozen / time_step))
+        self.__max_deviation = max_deviation
+        self.__recovery      = int(round(recovery / time_step))
+        # Number of the samples of the running median
+        self.__num_of_data = num_of_data
+        self.Clear()
+
+    def Clear(self):
+        """
+        Description:
+            Function to reset the stage (the next sample is the first one).
+        """
+
+        # The previous sample and the last samples in the range (running median)
+        self.__previous = None
+        self.__window   = collections.deque(maxlen = self.__num_of_data)
+        # Number of the identical samples in a row, number of the remaining samples of the recovery
+        self.__num_of_frozen   = 0
+        self.__num_of_recovery = 0
+        # State of the last sample and the number of the invalid samples of each state
+        self.__state = CONST_TRACKING_VALID
+        self.__num_of_invalid = [0] * len(CONST_TRACKING_STATE_NAMES)
+
+    def Compute(self, position):
+        """
+        Description:
+            Function to check the quality of the new sample.
+
+        Args:
+            (1) position [Float Vector]: Raw position {X, Y, Z}.
+
+        Returns:
+            (1) parameter [Bool]: True if the sample is valid.
+        """
+
+        position = tuple(position); state = CONST_TRACKING_VALID
+
+        # Out of the range
+        for value, limit in zip(position, self.__limit):
+            if value < limit[0] or value > limit[1]:
+                state = CONST_TRACKING_OUT_OF_RANGE
+
+        # Frozen position
+        if self.__previous is not None and position == self.__previous:
+            self.__num_of_frozen += 1
+        else:
+            self.__num_of_frozen = 0
+        self.__previous = position
+
+        if state == CONST_TRACKING_VALID:
+            if self.__num_of_frozen >= self.__max_frozen:
+                state = CONST_TRACKING_FROZEN
+            elif len(self.__window) > 0:
+                # Implausible deviation from the running median (the median of the samples before the new one)
+                #   Note: The lower median if the number of samples is even.
+                i = (len(self.__window) - 1) // 2
+                for axis, value in enumerate(position):
+                    if abs(value - sorted(p[axis] for p in self.__window)[i]) > self.__max_deviation:
+                        state = CONST_TRACKING_JUMP
+                        break
+
+        # The running median follows all samples in the range (including the jumps), so a real fast movement is valid 
+        # again within a few samples.
+        if state != CONST_TRACKING_OUT_OF_RANGE:
+            self.__window.append(position)
+
+        if state in [CONST_TRACKING_FROZEN, CONST_TRACKING_OUT_OF_RANGE]:
+            # The tracking is lost: Restart the recovery.
+            self.__num_of_recovery = self.__recovery
+        elif state == CONST_TRACKING_VALID and self.__num_of_recovery > 0:
+            self.__num_of_recovery -= 1
+            state = CONST_TRACKING_RECOVERY
+
+        if state != CONST_TRACKING_VALID:
+            self.__num_of_invalid[state] += 1
+        self.__state = state
+
+        return state == CONST_TRACKING_VALID
+
+    def Get_State(self):
+        """
+        Description:
+            Function to get the state of the last sample.
+
+        Returns:
+            (1) parameter [INT]: State (CONST_TRACKING_{VALID, FROZEN, OUT_OF_RANGE, JUMP, RECOVERY}).
+        """
+
+        return self.__state
+
+    def Get_Num_Of_Invalid(self):
+        """
+        Description:
+            Function to get the number of the invalid samples of each state.
+
+        Returns:
+            (1) parameter [Dictionary]: Number of the invalid samples {name of the state: number}.
+        """
+
+        return {name: self.__num_of_invalid[i] for i, name in enumerate(CONST_TRACKING_STATE_NAMES) if i != CONST_TRACKING_VALID}
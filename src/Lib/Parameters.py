@@ -29,13 +29,106 @@ File Name: Parameters.py
 #   Position
 CONST_FILTER_POS_LIMIT = [[-22.5, 22.5], [0.0, 45.0], [-45.0, 0.0]]
 CONST_FILTER_POS_NUM_OF_DATA = 100
+#   Position filter of the controllers (sub_ur_ctrl.py, sub_ur_stream.py)
+#       Type of the filter: 'SMA', 'BLP', 'BLPMA', 'ONE_EURO', 'KALMAN'
+CONST_FILTER_POS_TYPE = 'BLPMA'
+#       Butterworth Low Pass (Moving Average): Number of total periods (SMA), Cut-off frequency in Hz, Order
+CONST_FILTER_POS_NUM_OF_DATA_AVG = 20
+CONST_FILTER_POS_FRQ_C = 1.95
+CONST_FILTER_POS_ORDER = 3
+#       One Euro Filter: Minimum cut-off frequency in Hz, Speed coefficient, Cut-off frequency of the derivative in Hz
+CONST_FILTER_POS_ONE_EURO = [1.0, 0.05, 1.0]
+#       Kalman Filter (constant velocity): Standard deviation of the process noise (cm/s^2) and of the measurement noise (cm)
+CONST_FILTER_POS_KALMAN = [200.0, 0.3]
+#       Outlier rejection in front of the filter (Hampel filter + rate-of-change gate): 
+#           Number of values in the window, Threshold in standard deviations, Minimum threshold in cm, Maximum rate of change in cm/s
+CONST_FILTER_POS_OUTLIER = [9, 3.0, 0.5, 300.0]
 #   Fingers Bend
 CONST_FILTER_FINGERS_BEND_LIMIT = [[5.0, 65.0], [5.0, 65.0], [5.0, 65.0], [5.0, 65.0], [5.0, 65.0]]
 CONST_FILTER_FINGERS_BEND_NUM_OF_DATA = 25
 
+# Gesture recognition (Lib.P5.Gesture): 
+#   Templates (centroids) of the fingers bend {T, I, M, R, L} for each gesture
+#       Note: The default templates, the glove loads the calibrated templates (CONST_GESTURE_CALIBRATION_FILE_PATH) if they exist.
+CONST_GESTURE_TEMPLATES = {'OPEN': [15.0, 15.0, 15.0, 15.0, 15.0], 'CLOSED': [60.0, 60.0, 60.0, 60.0, 60.0], 
+                           'POINT': [60.0, 15.0, 60.0, 60.0, 60.0]}
+#   Hysteresis: The gesture is changed only if the new template is closer by this distance
+CONST_GESTURE_HYSTERESIS = 5.0
+#   Tolerance: The gesture is accepted only if each smoothed finger is within the tolerance of its template
+#       Note: CLOSED (the gripper): All five fingers in [55, 65] with the default template, the same rule as the original 
+#             open/closed detection. The other gestures are not limited.
+CONST_GESTURE_TOLERANCE = {'CLOSED': 5.0}
+#   Calibration of the templates (Lib.P5.Calibration, pub_p5_glove_stream.py: button (g)): 
+#       The operator holds each gesture: Time to form the gesture and time of the recording in seconds, Parameter file
+CONST_GESTURE_CALIBRATION_TIME      = [2.0, 3.0]
+CONST_GESTURE_CALIBRATION_FILE_PATH = 'Gesture_Calibration.json'
+
 # Time step inside threads (Essential Reality P5)
 CONST_TIME_STEP  = 0.004
 
+# Scheduler of the periodic loops (Lib.Scheduler.Rate):
+#   Overrun policy: 0 - SKIP (drop the missed ticks), 1 - CATCH_UP (run the missed ticks back to back)
+CONST_SCHEDULER_OVERRUN_POLICY = 0
+#   Spin time before the deadline in seconds (the rest of the period is slept)
+#       Note: Limited to a quarter of the period of the loop (Scheduler.CONST_MAX_SPIN_RATIO), e.g. 0.5 ms of the 2 ms servo loop.
+CONST_SCHEDULER_SPIN_TIME = 0.002
+#   Histograms of the loop statistics (period, work time, jitter): Width of one bin in seconds, Number of bins (5 us, 0 - 20 ms)
+CONST_SCHEDULER_HISTOGRAM = [5e-6, 4000]
+
+# Capacity of the sensor history (Essential Reality P5): Number of samples (10 s)
+CONST_P5_HISTORY_NUM_OF_DATA = 2500
+
+# Backend of the P5 glove (Lib.P5.Essential_Reality.Create_P5_Glove):
+#   'DLL': Essential Reality P5 library (P5DLL.dll), 'REPLAY': Recording (Evaluation/P5_Results), 'SYNTHETIC': Synthetic motion
+CONST_P5_BACKEND = 'DLL'
+#   Speed of the simulation (REPLAY, SYNTHETIC): 1.0 - real time, > 1.0 - faster
+CONST_P5_SIMULATION_SPEED = 1.0
+#   Number of simulated gloves (REPLAY, SYNTHETIC)
+CONST_P5_SIMULATION_NUM_OF_GLOVES = 1
+#   Replay: File names of the recordings (Position, Fingers Bend)
+CONST_P5_REPLAY_FILE_NAME = ['Experiment_Position', 'Experiment_Finger_Bends']
+#   Synthetic: Standard deviation of the noise (cm), Probability of a dropout (per sample), Length of a dropout (samples)
+CONST_P5_SYNTHETIC_NOISE   = 0.3
+CONST_P5_SYNTHETIC_DROPOUT = [0.002, 25]
+
+# Tracking quality of the glove position (Lib.P5.Tracking): 
+#   Margin of the limit (CONST_FILTER_POS_LIMIT) in cm, Maximum time of the frozen position in s, Number of samples of the running median, 
+#   Maximum deviation from the running median in cm, Recovery time after the tracking loss (FROZEN, OUT_OF_RANGE) in s
+CONST_TRACKING_QUALITY = [10.0, 0.1, 9, 15.0, 0.02]
+
+# ZeroMQ endpoints of the glove data (Lib.Transport.Endpoint): 'tcp://', 'ipc://', 'inproc://' (one process), 'pgm://' / 'epgm://' (multicast)
+#   Publisher (pub_p5_glove_stream.py): Bound endpoints (one or more), e.g. ['tcp://*:2224', 'ipc:///tmp/p5_glove']
+CONST_PUBLISHER_ENDPOINTS = ['tcp://*:2224']
+#   Subscribers: Endpoint of each process (script), e.g. 'ipc:///tmp/p5_glove' on a single machine
+CONST_SUBSCRIBER_ENDPOINT = {'sub_ur_ctrl': 'tcp://127.0.0.1:2224', 'sub_ur_stream': 'tcp://127.0.0.1:2224', 
+                             'sub_data_collection': 'tcp://127.0.0.1:2224'}
+
+# ZeroMQ topic of the glove data (pub_p5_glove_stream.py): '{CONST_P5_TOPIC}{id:02d}', e.g. 'P5_GLOVE_00'
+CONST_P5_TOPIC = 'P5_GLOVE_'
+#   Identification number of the glove used to control the robot (subscribers)
+CONST_P5_GLOVE_ID = 0
+
+# Publish policy of the glove data (pub_p5_glove_stream.py, Lib.Transport.Deadband): 
+#   0 - ALWAYS (a message every CONST_TIME_STEP), 
+#   1 - DEADBAND (a message only if a value changes by more than the deadband, and a heartbeat)
+CONST_PUBLISH_POLICY = 0
+#   Deadband: Position (cm), Fingers bend
+CONST_PUBLISH_DEADBAND = [0.05, 1.0]
+#   Heartbeat: Maximum time between two messages in seconds (must be lower than CONST_SUBSCRIBER_MAX_AGE)
+CONST_PUBLISH_HEARTBEAT = 0.04
+
+# Subscriber of the glove data (Lib.Transport.Subscriber): 
+#   Mode: 0 - QUEUE (all messages in order), 1 - LATEST (only the newest message, the backlog is skipped)
+CONST_SUBSCRIBER_MODE = 1
+#   Maximum age of the glove sample in seconds (from the receipt on the local clock, the robot does not move to an older sample)
+CONST_SUBSCRIBER_MAX_AGE = 0.05
+
+# Latency tracing from the glove sample to the robot command (Lib.Transport.Trace): 
+#   Histograms of the stages: Width of one bin in seconds, Number of bins (10 us, 0 - 100 ms)
+CONST_TRACE_HISTOGRAM = [10e-6, 10000]
+#   Period of the live summary in seconds
+CONST_TRACE_PRINT_PERIOD = 1.0
+
 # Initialization of Constants:-+
 #   Universal Robots (UR10e)
 #       Workspace
@@ -44,4 +137,10 @@ CONST_UR_WORKSPACE          = [760.0, 400.0, 200.0]
 CONST_UR_CARTES_POS_HOME    = [0.0, -700.0, 515.0]
 CONST_UR_CARTES_ORIENT_HOME = [0.0, 3.142, 0.0]
 #   Essential Reality P5 Glove
+#       Note: The default workspace, the subscribers load the calibrated workspace (CONST_CALIBRATION_FILE_PATH) if it exists.
 CONST_SENSOR_POS_WORKSPACE  = CONST_FILTER_POS_LIMIT
+#       Calibration of the workspace (Lib.P5.Calibration, pub_p5_glove_stream.py: button (c)): 
+#           Lower and upper quantile of the positions, Time of the sweep in seconds, Parameter file
+CONST_CALIBRATION_QUANTILES = [0.02, 0.98]
+CONST_CALIBRATION_TIME      = 10.0
+CONST_CALIBRATION_FILE_PATH = 'Workspace_Calibration.json'
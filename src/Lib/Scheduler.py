@@ -0,0 +1,381 @@
+"""
+## =========================================================================== ##
+MIT License
+Copyright (c) 2021 Roman Parak
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+## =========================================================================== ##
+Author   : Roman Parak
+Email    : Roman.Parak@outlook.com
+Github   : https://github.com/rparak
+File Name: Scheduler.py
+## =========================================================================== ##
+"""
+
+# Time (Time access and conversions)
+import time
+# OS (Operating system interfaces)
+import os
+# JSON (JSON encoder and decoder)
+import json
+# Lib.Parameters (Main Control Parameters)
+import Lib.Parameters as Parameters
+# Lib.Histogram (Fixed-size histogram of time values)
+import Lib.Histogram as Histogram
+
+# Initialization of Constants:
+#   Overrun policy (the loop body took longer than the time left to the deadline):
+#       SKIP    : The late tick continues immediately, the missed deadlines are dropped and the next deadline is the next 
+#                 one on the original grid (no burst of ticks, the phase of the loop is kept).
+#       CATCH_UP: The late tick continues immediately and the deadline moves by one period only, so the missed ticks 
+#                 are run back to back until the loop is on the grid again. If the loop is more than {max_catch_up} 
+#                 periods late, the missed deadlines are dropped as with SKIP.
+CONST_OVERRUN_POLICY_SKIP     = 0
+CONST_OVERRUN_POLICY_CATCH_UP = 1
+#   Quantities of the loop statistics (the histograms):
+#       PERIOD: Time between two wake-ups of the loop.
+#       WORK  : Time of the loop body (from the wake-up to the call of the Sleep function).
+#       JITTER: Time between the deadline and the wake-up (lateness).
+CONST_STATISTICS_QUANTITIES = ['period', 'work', 'jitter']
+#   Maximum spin time as a fraction of the period (the rest of the period is slept, even with a short period)
+CONST_MAX_SPIN_RATIO = 0.25
+
+# All the loop statistics of the process (name: Loop_Statistics), see Get_Statistics / Dump_Statistics
+#   Note: The instance of the Rate class with a name is added automatically.
+_loop_statistics = {}
+
+class Loop_Statistics(object):
+    """
+    Description:
+        Statistics of a periodic loop: fixed-size histograms of the period, work time and jitter (lateness of the wake-up) 
+        and the number of deadline misses (overruns) and dropped ticks.
+
+        The histograms (Lib.Histogram, in us) have a constant memory and a constant cost per tick, the values above 
+        the range are counted in the last bin (the exact maximum is kept separately).
+
+    Initialization of the Class:
+        Args:
+            (1) name [String]: Name of the loop.
+            (2) period [Float]: Period of the loop in seconds.
+            (3) histogram [Float, INT]: Width of one bin in seconds and number of bins.
+
+        Example:
+            Initialization:
+                Cls = Loop_Statistics('P5_Acquisition', 0.004)
+
+            Calculation:
+                Cls.Add(period, work, jitter)     # In ns, called by Rate.Sleep()
+
+            Returns:
+                Cls.Get_Summary()               # Mean, p50, p99, max (us) of each quantity, number of ticks, misses, ...
+                Cls.Get_Histogram('jitter')     # Edges of the bins (us), counts
+    """
+
+    def __init__(self, name, period, histogram = Parameters.CONST_SCHEDULER_HISTOGRAM):
+        # << PUBLIC >> #
+        self.name = name
+
+        # << PRIVATE >> #
+        # Period of the loop in ns
+        self.__period = int(round(period * 1e9))
+        # Width of one bin in seconds and number of bins of the histograms
+        self.__histogram_parameters = histogram
+        self.Clear()
+
+    def Clear(self):
+        """
+        Description:
+            Function to remove all values from the statistics.
+        """
+
+        # Histograms of the quantities (period, work, jitter)
+        self.__histogram = [Histogram.Histogram(self.__histogram_parameters[0], self.__histogram_parameters[1], 'us') 
+                            for _ in CONST_STATISTICS_QUANTITIES]
+        # Number of ticks, deadline misses and dropped ticks (SKIP policy)
+        self.__num_of_ticks   = 0
+        self.__num_of_misses  = 0
+        self.__num_of_dropped = 0
+
+    def Add(self, period, work, jitter, miss = False, dropped = 0):
+        """
+        Description:
+            Function to add the values of one tick.
+
+        Args:
+            (1) period [INT]: Time between the last two wake-ups in ns.
+            (2) work [INT]: Time of the loop body in ns.
+            (3) jitter [INT]: Lateness of the wake-up in ns.
+            (4) miss [Bool]: The deadline was missed.
+            (5) dropped [INT]: Number of the dropped ticks.
+        """
+
+        self.__num_of_ticks += 1
+        if miss == True:
+            self.__num_of_misses  += 1
+            self.__num_of_dropped += dropped
+
+        histogram = self.__histogram
+        histogram[0].Add(period)
+        histogram[1].Add(work)
+        histogram[2].Add(jitter)
+
+    def Get_Histogram(self, quantity):
+        """
+        Description:
+            Function to get the histogram of the quantity.
+
+        Args:
+            (1) quantity [String]: Name of the quantity (CONST_STATISTICS_QUANTITIES).
+
+        Returns:
+            (1) parameter [Float Vector]: Edges of the bins in us (number of bins + 1), the last bin includes all values above the range.
+            (2) parameter [INT Vector]: Counts.
+        """
+
+        return self.__histogram[CONST_STATISTICS_QUANTITIES.index(quantity)].Get_Histogram()
+
+    def Get_Summary(self):
+        """
+        Description:
+            Function to get the summary of the statistics (it can be called while the loop is running).
+
+        Returns:
+            (1) parameter [Dictionary]: Name, period (us), number of ticks, misses and dropped ticks and for each quantity 
+                                        the number of values and the mean, p50, p99 and max in us (Histogram.Get_Summary).
+        """
+
+        summary = {'name': self.name, 'period_us': self.__period / 1e3, 'num_of_ticks': self.__num_of_ticks, 
+                   'num_of_misses': self.__num_of_misses, 'num_of_dropped': self.__num_of_dropped}
+        for i, quantity in enumerate(CONST_STATISTICS_QUANTITIES):
+            summary[quantity] = self.__histogram[i].Get_Summary()
+
+        return summary
+
+    def To_Dict(self):
+        """
+        Description:
+            Function to get the summary and all the histograms (e.g. to save them to a file).
+
+        Returns:
+            (1) parameter [Dictionary]: Summary, width of one bin (us) and the counts of each quantity.
+        """
+
+        return {**self.Get_Summary(), 'bin_width_us': self.__histogram[0].Get_Bin_Width(), 
+                'histogram': {quantity: self.__histogram[i].Get_Counts() for i, quantity in enumerate(CONST_STATISTICS_QUANTITIES)}}
+
+def Get_Statistics(name = None):
+    """
+    Description:
+        Function to get the statistics of a loop of the process (live).
+
+    Args:
+        (1) name [String]: Name of the loop, None: all loops.
+
+    Returns:
+        (1) parameter [Loop_Statistics or Dictionary]: Statistics of the loop (None if there is no loop with the name), 
+                                                       or all the statistics {name: Loop_Statistics}.
+    """
+
+    if name is None:
+        return dict(_loop_statistics)
+
+    return _loop_statistics.get(name)
+
+def Dump_Statistics(file_name = None):
+    """
+    Description:
+        Function to print the summary of all loops of the process and to save the statistics (including the histograms) 
+        to the ../src/Evaluation/Loop_Statistics/ folder (.json), e.g. at the shutdown.
+
+    Args:
+        (1) file_name [String]: Output file name (without the extension and the time), None: the statistics are only printed.
+    """
+
+    for statistics in list(_loop_statistics.values()):
+        summary = statistics.Get_Summary()
+        print(f'[INFO] Loop: {summary["name"]} (Period: {summary["period_us"]:0.1f} us), Ticks: {summary["num_of_ticks"]}, '
+              f'Misses: {summary["num_of_misses"]}, Dropped: {summary["num_of_dropped"]}')
+        for quantity in CONST_STATISTICS_QUANTITIES:
+            print(f'[INFO]   {quantity:6s} Mean: {summary[quantity]["mean_us"]:9.1f} us, p50: {summary[quantity]["p50_us"]:9.1f} us, '
+                  f'p99: {summary[quantity]["p99_us"]:9.1f} us, Max: {summary[quantity]["max_us"]:9.1f} us')
+
+    if file_name is None:
+        return
+
+    directory_name = os.path.join(os.getcwd(), 'Evaluation', 'Loop_Statistics')
+    os.makedirs(directory_name, exist_ok=True)
+    file_path = os.path.join(directory_name, file_name + '_' + time.strftime('%Y%m%d_%H%M%S') + '.json')
+    with open(file_path, 'w') as f:
+        json.dump({'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'), 
+                   'loops': [statistics.To_Dict() for statistics in list(_loop_statistics.values())]}, f, indent=2)
+
+    print(f'[INFO] The loop statistics have been successfully saved: {file_path}')
+
+class Rate(object):
+    """
+    Description:
+        A scheduler for periodic loops with absolute deadlines on the monotonic clock (time.perf_counter_ns). The deadlines 
+        are on a fixed grid (t_{start} + k * period), so the loop does not drift if the duration of the loop body changes.
+
+        The waiting is hybrid: time.sleep() until {spin_time} before the deadline (the OS wakes the thread up too late 
+        by up to the sleep granularity), then a spin until the deadline. The spin calls time.sleep(0), so other threads 
+        can run in the meantime (the GIL is released). The spin time is at most CONST_MAX_SPIN_RATIO of the period, 
+        so a short loop (e.g. the 2 ms servo loop) does not spin for the whole period.
+
+    Initialization of the Class:
+        Args:
+            (1) period [Float]: Period of the loop in seconds.
+            (2) policy [INT]: Overrun policy (CONST_OVERRUN_POLICY_SKIP or CONST_OVERRUN_POLICY_CATCH_UP).
+            (3) spin_time [Float]: Time before the deadline (in seconds) in which the scheduler spins instead of sleeping 
+                                   (limited to CONST_MAX_SPIN_RATIO * period).
+            (4) max_catch_up [INT]: Maximum number of the missed periods run back to back (CATCH_UP only).
+            (5) name [String]: Name of the loop, the statistics of the loop (Loop_Statistics) are available by Get_Statistics(name).
+                               None: without statistics.
+
+        Example:
+            Initialization:
+                Cls = Rate(0.004, name = 'P5_Acquisition')
+
+            Loop:
+                while ...:
+                    ... (loop body)
+                    Cls.Sleep()     # Wait for the next deadline, False if the deadline was missed
+
+            Returns:
+                Cls.Get_Num_Of_Ticks()
+                Cls.Get_Num_Of_Overruns()
+                Cls.Get_Statistics()    # Loop_Statistics (period, work time, jitter)
+    """
+
+    def __init__(self, period, policy = Parameters.CONST_SCHEDULER_OVERRUN_POLICY, spin_time = Parameters.CONST_SCHEDULER_SPIN_TIME, 
+                 max_catch_up = 10, name = None):
+        # << PRIVATE >> #
+        # Period and spin time in ns
+        self.__period    = int(round(period * 1e9))
+        self.__spin_time = int(round(min(spin_time, CONST_MAX_SPIN_RATIO * period) * 1e9))
+        # Overrun policy
+        self.__policy       = policy
+        self.__max_catch_up = max_catch_up
+        # Number of ticks and overruns
+        self.__num_of_ticks    = 0
+        self.__num_of_overruns = 0
+        # Statistics of the loop (registered under the name)
+        self.__statistics = None
+        if name is not None:
+            self.__statistics = Loop_Statistics(name, period)
+            _loop_statistics[name] = self.__statistics
+        # The next deadline (the first one is one period after the initialization)
+        self.Reset()
+
+    def Reset(self):
+        """
+        Description:
+            Function to restart the grid of the deadlines from the current time (e.g. after a pause of the loop).
+        """
+
+        # The last wake-up of the loop
+        self.__t_wake   = time.perf_counter_ns()
+        self.__deadline = self.__t_wake + self.__period
+
+    def Sleep(self):
+        """
+        Description:
+            Function to wait for the next deadline.
+
+        Returns:
+            (1) parameter [Bool]: True if the deadline was met, False if the deadline was missed (overrun).
+        """
+
+        self.__num_of_ticks += 1
+
+        t = time.perf_counter_ns()
+        if t > self.__deadline:
+            # Overrun: The tick continues immediately.
+            self.__num_of_overruns += 1
+
+            if self.__policy == CONST_OVERRUN_POLICY_CATCH_UP and t - self.__deadline <= self.__max_catch_up * self.__period:
+                dropped = 0
+            else:
+                # The next deadline on the grid (after the current time)
+                dropped = (t - self.__deadline) // self.__period
+
+            if self.__statistics is not None:
+                self.__statistics.Add(t - self.__t_wake, t - self.__t_wake, t - self.__deadline, True, dropped)
+
+            self.__deadline += (dropped + 1) * self.__period; self.__t_wake = t
+
+            return False
+
+        # Sleep (coarse)
+        if self.__deadline - t > self.__spin_time:
+            time.sleep((self.__deadline - t - self.__spin_time) / 1e9)
+
+        # Spin (fine)
+        t_wake = time.perf_counter_ns()
+        while t_wake < self.__deadline:
+            time.sleep(0)
+            t_wake = time.perf_counter_ns()
+
+        if self.__statistics is not None:
+            self.__statistics.Add(t_wake - self.__t_wake, t - self.__t_wake, t_wake - self.__deadline)
+
+        self.__deadline += self.__period; self.__t_wake = t_wake
+
+        return True
+
+    def Get_Period(self):
+        """
+        Description:
+            Function to get the period of the loop.
+
+        Returns:
+            (1) parameter [Float]: Period in seconds.
+        """
+
+        return self.__period / 1e9
+
+    def Get_Num_Of_Ticks(self):
+        """
+        Description:
+            Function to get the number of ticks (calls of the Sleep function).
+
+        Returns:
+            (1) parameter [INT]: Number of ticks.
+        """
+
+        return self.__num_of_ticks
+
+    def Get_Statistics(self):
+        """
+        Description:
+            Function to get the statistics of the loop.
+
+        Returns:
+            (1) parameter [Loop_Statistics]: Statistics, None if the loop has no name.
+        """
+
+        return self.__statistics
+
+    def Get_Num_Of_Overruns(self):
+        """
+        Description:
+            Function to get the number of missed deadlines (overruns).
+
+        Returns:
+            (1) parameter [INT]: Number of overruns.
+        """
+
+        return self.__num_of_overruns
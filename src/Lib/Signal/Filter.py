@@ -29,8 +29,38 @@ File Name: Filter.py
 import numpy as np
 # Scipy (Mathematics, science, etc.) [pip install scipy]
 import scipy.signal
+# Math (Mathematical functions)
+import math
 # Random (Generate pseudo-random numbers)
 import random
+# Struct (Interpret bytes as packed binary data)
+import struct
+
+# Initialization of Constants:
+#   Butterworth filter mode:
+#       WINDOW: The filter is run over the whole data stack (sliding window) for each new sample.
+#       STREAM: The coefficients (second-order sections) are designed once and the filter state 
+#               is kept between calls, so each sample costs only a few multiply-adds.
+CONST_BLP_MODE_WINDOW = 0
+CONST_BLP_MODE_STREAM = 1
+#   The number of samples after which the running sum of the moving average is recalculated 
+#   from the data stack (prevents the accumulation of floating-point errors).
+CONST_SMA_SUM_RECALCULATION_PERIOD = 1000
+#   Filter type (Filter_Bank):
+#       SMA: Simple Moving Average, BLP: Butterworth Low Pass, BLPMA: Butterworth Low Pass Moving Average
+#       ONE_EURO: One Euro Filter, KALMAN: Kalman Filter (constant velocity)
+CONST_FILTER_TYPE_SMA      = 0
+CONST_FILTER_TYPE_BLP      = 1
+CONST_FILTER_TYPE_BLPMA    = 2
+CONST_FILTER_TYPE_ONE_EURO = 3
+CONST_FILTER_TYPE_KALMAN   = 4
+#   Filter type by name (e.g. Parameters.CONST_FILTER_POS_TYPE)
+CONST_FILTER_TYPE_NAME = {'SMA': CONST_FILTER_TYPE_SMA, 'BLP': CONST_FILTER_TYPE_BLP, 'BLPMA': CONST_FILTER_TYPE_BLPMA, 
+                          'ONE_EURO': CONST_FILTER_TYPE_ONE_EURO, 'KALMAN': CONST_FILTER_TYPE_KALMAN}
+#   Identification of the binary filter state (Get_State/Set_State)
+CONST_STATE_MAGIC = b'P5FS'
+#   Seed of the random levels of the skip list (Sorted_Window), the levels only change the speed, not the result
+CONST_SKIP_LIST_SEED = 0
 
 def Check_Limit(value, limit, data_stack):
     """
@@ -40,7 +70,7 @@ def Check_Limit(value, limit, data_stack):
     Args:
         (1) value [Float]: Raw value from the sensor.
         (2) limit [Float Vector]: Limit (Boundaries [low(-),high(+)]).
-        (3) data_stack [Float Vector]: Data stack of values.
+        (3) data_stack [Float Vector or Ring_Buffer]: Data stack of values.
         
     Returns:
         (1) parameter [Float]: New value after limit check.
@@ -49,13 +79,517 @@ def Check_Limit(value, limit, data_stack):
 
     if limit[0] <= value <= limit[1]:
         # Return input value (everything is fine).
-        return value #if data_stack and value != data_stack[-1] else value + offset
+        return value
     else:
-        # If the value is out of range, set a random offset and add it to the previous value.
-        offset = random.choice([-1, 1]) * 0.01
+        # If the value is out of range, hold the previous value (0.0 if there is no previous value).
+        return data_stack[-1] if data_stack else 0.0
+
+def Check_Limit_Vector(value, limit, last_value):
+    """
+    Description:
+        Input data limit check for multiple channels (vectorized version of the Check_Limit function).
+
+    Args:
+        (1) value [Float Vector]: Raw values from the sensor (one value per channel).
+        (2) limit [Float Matrix]: Limit for each channel (Boundaries [low(-),high(+)]).
+        (3) last_value [Float Vector]: The last values after the limit check (0.0 if there is no previous value).
+        
+    Returns:
+        (1) parameter [Float Vector]: New values after limit check.
+
+    """
+
+    in_range = (limit[:, 0] <= value) & (value <= limit[:, 1])
+
+    if in_range.all():
+        # Return input values (everything is fine).
+        return value
+
+    # If the value is out of range, hold the previous value.
+    return np.where(in_range, value, last_value)
+
+def Sos_Filter_Step(sos, zi, value):
+    """
+    Description:
+        One step of the cascaded second-order sections (SOS) filter in the transposed direct form II.
+        The function is equivalent to scipy.signal.sosfilt() called with a single sample, but without
+        the overhead of the array conversion.
+
+    Args:
+        (1) sos [Float Matrix]: Second-order sections (Rows: [b_0, b_1, b_2, a_0, a_1, a_2], a_0 = 1.0).
+        (2) zi [Float Matrix]: State of the filter (Rows: [z_0, z_1]). The state is updated in place.
+        (3) value [Float]: Input value.
+        
+    Returns:
+        (1) parameter [Float]: Output value of the filter.
+    """
+
+    for i, (b_0, b_1, b_2, _, a_1, a_2) in enumerate(sos):
+        z = zi[i]
+        # Output of the section is the input of the next section.
+        y = b_0 * value + z[0]
+        z[0] = b_1 * value - a_1 * y + z[1]
+        z[1] = b_2 * value - a_2 * y
+        value = y
+
+    return value
+
+def Butterworth_Warm_Start(data_stack, sos, zi, value):
+    """
+    Description:
+        Function to set the state of the Butterworth filter to the steady state for a constant input {value},
+        so the output does not ramp from zero (warm start).
+
+        Window mode: The data stack is filled with the value.
+        Stream mode: The state of the sections is set to the steady state of the step response (scipy.signal.sosfilt_zi).
+
+    Args:
+        (1) data_stack [Ring_Buffer]: Data stack of values (None if there is no data stack).
+        (2) sos [Float Matrix]: Second-order sections.
+        (3) zi [Float Matrix]: State of the filter {sections, 2} or {sections, channels, 2}. The state is updated in place.
+        (4) value [Float or Float Vector]: The first value (one value per channel).
+    """
+
+    if data_stack is not None:
+        data_stack.Fill(value)
+
+    zi_steady = scipy.signal.sosfilt_zi(np.array(sos))
+    for i, z in enumerate(zi):
+        z[:] = zi_steady[i] * value if np.ndim(value) == 0 else zi_steady[i][np.newaxis, :] * np.asarray(value)[:, np.newaxis]
+
+def Butterworth_Window_Tolerance(num_of_data = 100, frq_s = 100, frq_c = 1.0, order = 2):
+    """
+    Description:
+        The maximum difference between the output of the Butterworth filter in the sliding-window mode (CONST_BLP_MODE_WINDOW)
+        and in the streaming mode (CONST_BLP_MODE_STREAM), relative to the maximum absolute input value. 
+
+        Once the window is full, the window mode is equal to the convolution of the input with the impulse response {h} 
+        truncated to {num_of_data} samples, while the streaming mode uses the whole impulse response. Therefore:
+
+            |y_window[n] - y_stream[n]| <= max(|x|) * sum(|h[k]|), k >= num_of_data
+
+        For example (num_of_data = 100, frq_s = 250, order = 3): frq_c = 1.95 -> 0.117, frq_c = 2.5 -> 0.072.
+
+    Args:
+        (1) num_of_data [INT]: Number of total periods (window size).
+        (2) frq_s [INT]: Sample frequency in Hz.
+        (3) frq_c [Float]: Cut-off frequency in Hz.
+        (4) order [INT]: Order of the butterworth filter.
+        
+    Returns:
+        (1) parameter [Float]: Relative tolerance.
+    """
+
+    sos = scipy.signal.butter(order, frq_c / (frq_s/2), btype='lowpass', analog=False, output='sos')
+
+    # Impulse response long enough for the tail to decay below the numerical precision.
+    impulse = np.zeros(np.maximum(num_of_data * 20, int(frq_s / frq_c) * 100))
+    impulse[0] = 1.0
+
+    return np.sum(np.abs(scipy.signal.sosfilt(sos, impulse)[num_of_data:]))
+
+def One_Euro_Step(state, value, t_s, min_cutoff, beta, d_cutoff):
+    """
+    Description:
+        One step of the One Euro filter (Casiez et al., 2012). The value and the state can be scalars or
+        vectors (NumPy) of the same length.
+
+        The filter is a first-order low-pass filter whose cut-off frequency increases with the speed of the signal:
+
+            f_c = min_cutoff + beta * |dx/dt|,  alpha = 1 / (1 + 1 / (2 * pi * f_c * t_s))
+
+        where {dx/dt} is the low-pass filtered derivative of the signal (cut-off frequency {d_cutoff}).
+
+    Args:
+        (1) state [List]: State of the filter ([x, dx/dt], [None, None] before the first value). 
+                          The state is updated in place.
+        (2) value [Float or Float Vector]: Input value.
+        (3) t_s [Float]: Sampling period in seconds.
+        (4) min_cutoff [Float]: Minimum cut-off frequency in Hz.
+        (5) beta [Float]: Speed coefficient.
+        (6) d_cutoff [Float]: Cut-off frequency of the derivative in Hz.
+        
+    Returns:
+        (1) parameter [Float or Float Vector]: Output value of the filter.
+    """
+
+    if state[0] is None:
+        # The first value initializes the filter (no ramp from zero).
+        state[0] = value; state[1] = value * 0.0
+
+        return value
+
+    # Filtered derivative of the signal
+    alpha_d = 1.0 / (1.0 + 1.0 / (2.0 * np.pi * d_cutoff * t_s))
+    state[1] = alpha_d * ((value - state[0]) / t_s) + (1.0 - alpha_d) * state[1]
+
+    # Filtered signal with the adaptive cut-off frequency
+    alpha = 1.0 / (1.0 + 1.0 / (2.0 * np.pi * (min_cutoff + beta * np.abs(state[1])) * t_s))
+    state[0] = alpha * value + (1.0 - alpha) * state[0]
+
+    return state[0]
+
+def Kalman_Step(state, value, t_s, q, r):
+    """
+    Description:
+        One step of the Kalman filter with the constant velocity model. The value and the state can be scalars or
+        vectors (NumPy) of the same length.
+
+        Model:
+            x{k} = F * x{k-1} + w,  z{k} = H * x{k} + v
+
+            x = [position, velocity], F = [[1, t_s], [0, 1]], H = [1, 0]
+            Q = q * [[t_s^4/4, t_s^3/2], [t_s^3/2, t_s^2]] (white noise acceleration), R = r
+
+    Args:
+        (1) state [List]: State of the filter ([position, velocity, P_00, P_01, P_11], [None] * 5 before 
+                          the first value). The state is updated in place.
+        (2) value [Float or Float Vector]: Measured position.
+        (3) t_s [Float]: Sampling period in seconds.
+        (4) q [Float]: Variance of the process noise (acceleration).
+        (5) r [Float]: Variance of the measurement noise.
+        
+    Returns:
+        (1) parameter [Float or Float Vector]: Estimated position.
+    """
+
+    if state[0] is None:
+        # The first value initializes the filter (no ramp from zero).
+        zero = value * 0.0
+        state[0] = value; state[1] = zero
+        state[2] = zero + r; state[3] = zero; state[4] = zero + r / (t_s**2)
+
+        return value
+
+    p, v, P_00, P_01, P_11 = state
+
+    # Prediction
+    p = p + t_s * v
+    P_00 = P_00 + t_s * (2.0 * P_01 + t_s * P_11) + q * (t_s**4) / 4.0
+    P_01 = P_01 + t_s * P_11 + q * (t_s**3) / 2.0
+    P_11 = P_11 + q * (t_s**2)
+
+    # Update
+    K_0 = P_00 / (P_00 + r); K_1 = P_01 / (P_00 + r)
+    e = value - p
+
+    state[0] = p + K_0 * e
+    state[1] = v + K_1 * e
+    state[2] = (1.0 - K_0) * P_00
+    state[3] = (1.0 - K_0) * P_01
+    state[4] = P_11 - K_1 * P_01
+
+    return state[0]
+
+def State_To_Bytes(name, arrays):
+    """
+    Description:
+        Function to serialize the state of a filter to a compact binary blob.
+
+        Format (little-endian):
+            Header: CONST_STATE_MAGIC, length of the name [uint8], name of the class [ASCII]
+            Arrays: length of the dtype [uint8], dtype [ASCII], number of dimensions [uint8], 
+                    shape [uint32 * ndim], data [bytes]
+
+    Args:
+        (1) name [String]: Name of the filter class.
+        (2) arrays [List of Arrays]: State of the filter.
+        
+    Returns:
+        (1) parameter [Bytes]: Binary blob.
+    """
+
+    blob = [CONST_STATE_MAGIC, struct.pack('<B', len(name)), name.encode('ascii')]
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        dtype = array.dtype.str.encode('ascii')
+        blob.append(struct.pack('<B', len(dtype)) + dtype + struct.pack(f'<B{array.ndim}I', array.ndim, *array.shape))
+        blob.append(array.tobytes())
+
+    return b''.join(blob)
+
+def State_From_Bytes(name, blob):
+    """
+    Description:
+        Function to deserialize the state of a filter from a binary blob (State_To_Bytes).
+
+    Args:
+        (1) name [String]: Name of the filter class.
+        (2) blob [Bytes]: Binary blob.
+        
+    Returns:
+        (1) parameter [List of Arrays]: State of the filter.
+    """
+
+    blob = memoryview(blob)
+
+    # Header (the blob is checked before each read, a truncated or corrupted blob raises ValueError)
+    name = name.encode('ascii')
+    if len(blob) < 5 or bytes(blob[0:4]) != CONST_STATE_MAGIC or bytes(blob[5:5 + blob[4]]) != name:
+        raise ValueError('The header of the state does not match.')
+
+    arrays = []; i = 5 + len(name)
+    try:
+        while i < len(blob):
+            dtype = np.dtype(bytes(blob[i + 1:i + 1 + blob[i]]).decode('ascii')); i += 1 + blob[i]
+            if i >= len(blob) or i + 1 + 4 * blob[i] > len(blob):
+                raise ValueError('The state is truncated.')
+            shape = struct.unpack_from(f'<{blob[i]}I', blob, i + 1); i += 1 + 4 * len(shape)
+            size  = int(np.prod(shape)) * dtype.itemsize
+            if i + size > len(blob):
+                raise ValueError('The state is truncated.')
+            arrays.append(np.frombuffer(blob[i:i + size], dtype=dtype).reshape(shape).copy()); i += size
+    except (struct.error, TypeError, UnicodeDecodeError) as error:
+        raise ValueError('The state is corrupted.') from error
+
+    return arrays
+
+class Ring_Buffer(object):
+    """
+    Description:
+        A fixed-capacity circular buffer of float values preallocated in a NumPy array. 
+        
+        The data are stored twice (mirrored), so the values in chronological order are always 
+        available as a contiguous view of the array, without any copying (Get_Data).
+
+    Initialization of the Class:
+        Args:
+            (1) num_of_data [INT]: Capacity of the buffer.
+            (2) num_of_channels [INT]: Number of channels. If None, each value is a scalar, otherwise
+                                       each value is a vector of length {num_of_channels}.
+
+        Example:
+            Initialization:
+                Cls = Ring_Buffer(num_of_data = 100, num_of_channels = None)
+
+            Calculation:
+                Cls.Append(value{0})
+                ...
+                Cls.Append(value{n})
+
+            Returns:
+                Cls.Get_Data()              # Values in chronological order (oldest first)
+                Cls[-1]                     # The newest value
+    """
+
+    def __init__(self, num_of_data = 100, num_of_channels = None):
+        # << PRIVATE >> #
+        # Capacity of the buffer
+        self.__num_of_data = num_of_data
+        # Data of the buffer (mirrored)
+        #   Note: Shape {2 * num_of_data} or {num_of_channels, 2 * num_of_data}.
+        self.__data = np.zeros(2 * num_of_data if num_of_channels is None else (num_of_channels, 2 * num_of_data), dtype=np.float64)
+        # Index of the next value to be written
+        self.__index = 0
+        # Number of values in the buffer
+        self.__length = 0
+
+    def __len__(self):
+        return self.__length
+
+    def __getitem__(self, index):
+        return self.Get_Data()[..., index]
+
+    def Append(self, value):
+        """
+        Description:
+            Function to add a new value to the buffer. If the buffer is full, the oldest value is overwritten.
+
+        Args:
+            (1) value [Float or Float Vector]: New value.
+        
+        Returns:
+            (1) parameter [Float or Float Vector]: The removed (oldest) value, or 0.0 if the buffer was not full.
+        """
+
+        removed_value = self.__data[..., self.__index].copy() if self.__length == self.__num_of_data else 0.0
+
+        self.__data[..., self.__index] = value
+        self.__data[..., self.__index + self.__num_of_data] = value
+
+        self.__index = (self.__index + 1) % self.__num_of_data
+        if self.__length < self.__num_of_data:
+            self.__length += 1
+
+        return removed_value
+
+    def Get_Data(self):
+        """
+        Description:
+            Function to get the values of the buffer in chronological order (oldest first).
         
-        # Return the modified value.
-        return data_stack[-1] + offset if data_stack else offset
+        Returns:
+            (1) parameter [Float Vector or Matrix]: View of the buffer data (no copy).
+                                                    Note: The last axis is the time axis.
+        """
+
+        i = self.__index + self.__num_of_data - self.__length
+
+        return self.__data[..., i:i + self.__length]
+
+    def Clear(self):
+        """
+        Description:
+            Function to remove all values from the buffer.
+        """
+
+        self.__index  = 0
+        self.__length = 0
+
+    def Fill(self, value):
+        """
+        Description:
+            Function to fill the whole buffer with one value (e.g. warm start of a filter).
+
+        Args:
+            (1) value [Float or Float Vector]: Value.
+        """
+
+        self.__data[...] = np.asarray(value, dtype=np.float64)[..., np.newaxis] 
+        self.__index  = 0
+        self.__length = self.__num_of_data
+
+    def Set_Data(self, data):
+        """
+        Description:
+            Function to replace the content of the buffer with the data in chronological order (oldest first).
+
+        Args:
+            (1) data [Float Vector or Matrix]: Data (the last axis is the time axis).
+        """
+
+        if data.ndim == 0 or data.shape[0:-1] != self.__data.shape[0:-1] or data.shape[-1] > self.__num_of_data:
+            raise ValueError('The shape of the data does not match the buffer.')
+
+        self.Clear()
+        for i in range(data.shape[-1]):
+            self.Append(data[..., i])
+
+class Sorted_Window(object):
+    """
+    Description:
+        A sorted multiset of float values with the access to the k-th smallest value (e.g. the median and the quartiles 
+        of a sliding window), implemented as an indexable skip list.
+
+        Each link of the list stores its width (the number of values it skips), so the insertion, the removal and 
+        the access by the index are O(log n) (expected), without moving the other values.
+
+    Initialization of the Class:
+        Args:
+            (1) num_of_data [INT]: Expected (maximum) number of values, it sets the number of levels of the list.
+
+        Example:
+            Initialization:
+                Cls = Sorted_Window(num_of_data = 9)
+
+            Calculation:
+                Cls.Insert(value{n})
+                Cls.Remove(value{n - num_of_data})
+
+            Returns:
+                Cls[k]                      # The k-th smallest value
+    """
+
+    def __init__(self, num_of_data = 100):
+        # << PRIVATE >> #
+        # Number of levels of the list
+        self.__num_of_levels = 1 + int(math.log2(max(num_of_data, 2)))
+        # Generator of the levels of the new nodes (fixed seed, reproducible)
+        self.__random = random.Random(CONST_SKIP_LIST_SEED)
+        self.Clear()
+
+    def __len__(self):
+        return self.__length
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self.__length
+        if not 0 <= index < self.__length:
+            raise IndexError('The index is out of range.')
+
+        # Node: [value, next nodes, widths of the links] (one item per level)
+        node = self.__head; index += 1
+        for level in reversed(range(self.__num_of_levels)):
+            while node[2][level] <= index:
+                index -= node[2][level]
+                node = node[1][level]
+
+        return node[0]
+
+    def Clear(self):
+        """
+        Description:
+            Function to remove all values from the list.
+        """
+
+        # The head and the end of the list (the end is greater than any value)
+        self.__tail = [math.inf, [], []]
+        self.__head = [None, [self.__tail] * self.__num_of_levels, [1] * self.__num_of_levels]
+        self.__length = 0
+
+    def Insert(self, value):
+        """
+        Description:
+            Function to insert a new value.
+
+        Args:
+            (1) value [Float]: New value.
+        """
+
+        # The last node before the value at each level and the number of values between the nodes
+        chain = [None] * self.__num_of_levels; steps = [0] * self.__num_of_levels
+        node = self.__head
+        for level in reversed(range(self.__num_of_levels)):
+            while node[1][level][0] <= value:
+                steps[level] += node[2][level]
+                node = node[1][level]
+            chain[level] = node
+
+        # Level of the new node (geometric distribution, p = 0.5)
+        num_of_levels = min(self.__num_of_levels, 1 - int(math.log2(1.0 - self.__random.random())))
+        new_node = [value, [None] * num_of_levels, [None] * num_of_levels]
+        step = 0
+        for level in range(num_of_levels):
+            previous_node = chain[level]
+            new_node[1][level] = previous_node[1][level]
+            previous_node[1][level] = new_node
+            new_node[2][level] = previous_node[2][level] - step
+            previous_node[2][level] = step + 1
+            step += steps[level]
+        for level in range(num_of_levels, self.__num_of_levels):
+            chain[level][2][level] += 1
+
+        self.__length += 1
+
+    def Remove(self, value):
+        """
+        Description:
+            Function to remove one occurrence of the value.
+
+        Args:
+            (1) value [Float]: The value to be removed.
+        """
+
+        # The last node before the value at each level
+        chain = [None] * self.__num_of_levels
+        node = self.__head
+        for level in reversed(range(self.__num_of_levels)):
+            while node[1][level][0] < value:
+                node = node[1][level]
+            chain[level] = node
+
+        node = chain[0][1][0]
+        if node is self.__tail or node[0] != value:
+            raise ValueError('The value is not in the list.')
+
+        for level in range(len(node[1])):
+            previous_node = chain[level]
+            previous_node[2][level] += node[2][level] - 1
+            previous_node[1][level] = node[1][level]
+        for level in range(len(node[1]), self.__num_of_levels):
+            chain[level][2][level] -= 1
+
+        self.__length -= 1
 
 class Butterworth_Low_Pass_Moving_Average(object):
     """
@@ -71,10 +605,15 @@ class Butterworth_Low_Pass_Moving_Average(object):
             (4) frq_s [INT]: Sample frequency in Hz.
             (5) frq_c [Float]: Cut-off frequency in Hz.
             (6) order [INT]: Order of the butterworth filter.
+            (7) mode [INT]: Filter mode (CONST_BLP_MODE_WINDOW or CONST_BLP_MODE_STREAM).
+                            Note: 
+                                The tolerance between the modes is described in the Butterworth_Window_Tolerance() function.
+            (8) warm_start [Bool]: Seed the state of the filter from the first value (no ramp from zero).
 
         Example:
             Initialization:
-                Cls = Butterworth_Low_Pass_Moving_Average(limit = [-25.0, 25.0], num_of_data_blp = 100, num_of_data_avg = 10, frq_s = 100, frq_c = 1.0, order = 2)
+                Cls = Butterworth_Low_Pass_Moving_Average(limit = [-25.0, 25.0], num_of_data_blp = 100, num_of_data_avg = 10, frq_s = 100, frq_c = 1.0, order = 2, 
+                                                          mode = CONST_BLP_MODE_WINDOW)
 
             Calculation:
                 Cls.Compute(value{0})
@@ -82,10 +621,13 @@ class Butterworth_Low_Pass_Moving_Average(object):
                 Cls.Compute(value{n})
     """
 
-    def __init__(self, limit = [-25.0, 25.0], num_of_data_blp = 100, num_of_data_avg = 10, frq_s = 100, frq_c = 1.0, order = 2):
+    def __init__(self, limit = [-25.0, 25.0], num_of_data_blp = 100, num_of_data_avg = 10, frq_s = 100, frq_c = 1.0, order = 2, 
+                 mode = CONST_BLP_MODE_WINDOW, warm_start = False):
         # << PRIVATE >> #
         # Simple moving average (SMA): More information below
-        self.__SMA = Simple_Moving_Average(limit, num_of_data_avg)
+        self.__SMA = Simple_Moving_Average(limit, num_of_data_avg, warm_start)
+        # Seed the state from the first value
+        self.__warm_start = warm_start
         # Number of total periods
         self.__num_of_data = num_of_data_blp
         # The normalized value of a frequency variable: f_c/f_s
@@ -93,10 +635,20 @@ class Butterworth_Low_Pass_Moving_Average(object):
         self.__w_c_normalized = frq_c / (frq_s/2)
         # Order of the butterworth filter
         self.__order = order
+        # Filter mode (Window or Stream)
+        self.__mode = mode
+        # Transfer function coefficients of the filter (Window mode)
+        self.__b, self.__a = scipy.signal.butter(self.__order, self.__w_c_normalized, btype='lowpass', analog=False)
+        #   Initial condition of the window for a unit input (Warm start)
+        self.__zi_window = scipy.signal.lfilter_zi(self.__b, self.__a)
+        # Second-order sections and the state of the filter (Stream mode)
+        self.__sos = scipy.signal.butter(self.__order, self.__w_c_normalized, btype='lowpass', analog=False, output='sos').tolist()
+        self.__zi  = [[0.0, 0.0] for _ in self.__sos]
         # New value after limit check
         self.__new_value = 0
         # Data stack of values
-        self.__data_stack  = []
+        #   Note: Only the last value is kept in the stream mode.
+        self.__data_stack = Ring_Buffer(self.__num_of_data if self.__mode == CONST_BLP_MODE_WINDOW else 1)
     
     def Compute(self, value):
         """
@@ -113,19 +665,62 @@ class Butterworth_Low_Pass_Moving_Average(object):
         # Calculate the simple moving average (SMA) from the input raw variable.
         self.__new_value = self.__SMA.Compute(value)
 
+        if self.__warm_start == True and len(self.__data_stack) == 0:
+            # Warm start: The filter is in the steady state for the first value.
+            Butterworth_Warm_Start(self.__data_stack, self.__sos, self.__zi, self.__new_value)
+
         # Add new data to the stack
-        self.__data_stack.append(self.__new_value)
+        self.__data_stack.Append(self.__new_value)
 
-        if len(self.__data_stack) > self.__num_of_data:
-            # Remove of the first element of the stack
-            self.__data_stack.pop(0)
+        if self.__mode == CONST_BLP_MODE_STREAM:
+            return Sos_Filter_Step(self.__sos, self.__zi, self.__new_value)
         
         """
         Note:
             b, a = scipy.signal.butter() -> Transfer function coefficients of the filter.
         """
-        return scipy.signal.lfilter(*scipy.signal.butter(self.__order, self.__w_c_normalized, btype='lowpass', analog=False), 
-                                    self.__data_stack)[-1]
+        if self.__warm_start == True:
+            # The signal before the window is equal to the oldest value of the window (no ramp from zero).
+            data = self.__data_stack.Get_Data()
+            return scipy.signal.lfilter(self.__b, self.__a, data, zi=self.__zi_window * data[0])[0][-1]
+
+        return scipy.signal.lfilter(self.__b, self.__a, self.__data_stack.Get_Data())[-1]
+
+    def Get_State(self):
+        """
+        Description:
+            Function to get the state of the filter (e.g. hot restart of the controller).
+
+        Returns:
+            (1) parameter [Bytes]: Binary blob of the state.
+        """
+
+        return State_To_Bytes(self.__class__.__name__, [np.frombuffer(self.__SMA.Get_State(), dtype=np.uint8), self.__data_stack.Get_Data(), np.array(self.__zi)])
+
+    def Set_State(self, blob):
+        """
+        Description:
+            Function to set the state of the filter from the binary blob (Get_State).
+
+        Args:
+            (1) blob [Bytes]: Binary blob of the state.
+
+        Returns:
+            (1) parameter [Bool]: The state has been successfully set.
+        """
+
+        try:
+            sma, data, zi = State_From_Bytes(self.__class__.__name__, blob)
+            if zi.shape != np.shape(self.__zi) or self.__SMA.Set_State(sma.tobytes()) == False:
+                raise ValueError('The shape of the state does not match the filter.')
+            self.__data_stack.Set_Data(data)
+            self.__zi = zi.tolist()
+
+            return True
+        except (ValueError, struct.error):
+            print('[ERROR] The state does not match the filter.')
+
+            return False
 
 
 class Butterworth_Low_Pass(object):
@@ -141,10 +736,14 @@ class Butterworth_Low_Pass(object):
             (3) frq_s [INT]: Sample frequency in Hz.
             (4) frq_c [Float]: Cut-off frequency in Hz.
             (5) order [INT]: Order of the butterworth filter.
+            (6) mode [INT]: Filter mode (CONST_BLP_MODE_WINDOW or CONST_BLP_MODE_STREAM).
+                            Note: 
+                                The tolerance between the modes is described in the Butterworth_Window_Tolerance() function.
+            (7) warm_start [Bool]: Seed the state of the filter from the first value (no ramp from zero).
 
         Example:
             Initialization:
-                Cls = Butterworth_Low_Pass(limit = [-25.0, 25.0], num_of_data = 100, frq_s = 100, frq_c = 1.0, order = 2)
+                Cls = Butterworth_Low_Pass(limit = [-25.0, 25.0], num_of_data = 100, frq_s = 100, frq_c = 1.0, order = 2, mode = CONST_BLP_MODE_WINDOW)
 
             Calculation:
                 Cls.Compute(value{0})
@@ -152,10 +751,13 @@ class Butterworth_Low_Pass(object):
                 Cls.Compute(value{n})
     """
 
-    def __init__(self, limit = [-25.0, 25.0], num_of_data = 100, frq_s = 100, frq_c = 1.0, order = 2):
+    def __init__(self, limit = [-25.0, 25.0], num_of_data = 100, frq_s = 100, frq_c = 1.0, order = 2, mode = CONST_BLP_MODE_WINDOW, 
+                 warm_start = False):
         # << PRIVATE >> #
         # Limit (Boundaries [low(-),high(+)])
         self.__limit = limit
+        # Seed the state from the first value
+        self.__warm_start = warm_start
         # Number of total periods
         self.__num_of_data = num_of_data
         # The normalized value of a frequency variable: f_c/f_s
@@ -163,10 +765,20 @@ class Butterworth_Low_Pass(object):
         self.__w_c_normalized = frq_c / (frq_s/2)
         # Order of the butterworth filter
         self.__order = order
+        # Filter mode (Window or Stream)
+        self.__mode = mode
+        # Transfer function coefficients of the filter (Window mode)
+        self.__b, self.__a = scipy.signal.butter(self.__order, self.__w_c_normalized, btype='lowpass', analog=False)
+        #   Initial condition of the window for a unit input (Warm start)
+        self.__zi_window = scipy.signal.lfilter_zi(self.__b, self.__a)
+        # Second-order sections and the state of the filter (Stream mode)
+        self.__sos = scipy.signal.butter(self.__order, self.__w_c_normalized, btype='lowpass', analog=False, output='sos').tolist()
+        self.__zi  = [[0.0, 0.0] for _ in self.__sos]
         # New value after limit check
         self.__new_value = 0
         # Data stack of values
-        self.__data_stack  = []
+        #   Note: Only the last value is needed for the limit check in the stream mode.
+        self.__data_stack = Ring_Buffer(self.__num_of_data if self.__mode == CONST_BLP_MODE_WINDOW else 1)
 
     def Compute(self, value):
         """
@@ -183,19 +795,62 @@ class Butterworth_Low_Pass(object):
         # Input data limit check
         self.__new_value = Check_Limit(value, self.__limit, self.__data_stack)
 
+        if self.__warm_start == True and len(self.__data_stack) == 0:
+            # Warm start: The filter is in the steady state for the first value.
+            Butterworth_Warm_Start(self.__data_stack, self.__sos, self.__zi, self.__new_value)
+
         # Add new data to the stack
-        self.__data_stack.append(self.__new_value)
+        self.__data_stack.Append(self.__new_value)
+
+        if self.__mode == CONST_BLP_MODE_STREAM:
+            return Sos_Filter_Step(self.__sos, self.__zi, self.__new_value)
 
-        if len(self.__data_stack) > self.__num_of_data:
-            # Remove of the first element of the stack
-            self.__data_stack.pop(0)
-        
         """
         Note:
             b, a = scipy.signal.butter() -> Transfer function coefficients of the filter.
         """
-        return scipy.signal.lfilter(*scipy.signal.butter(self.__order, self.__w_c_normalized, btype='lowpass', analog=False), 
-                                    self.__data_stack)[-1]
+        if self.__warm_start == True:
+            # The signal before the window is equal to the oldest value of the window (no ramp from zero).
+            data = self.__data_stack.Get_Data()
+            return scipy.signal.lfilter(self.__b, self.__a, data, zi=self.__zi_window * data[0])[0][-1]
+
+        return scipy.signal.lfilter(self.__b, self.__a, self.__data_stack.Get_Data())[-1]
+
+    def Get_State(self):
+        """
+        Description:
+            Function to get the state of the filter (e.g. hot restart of the controller).
+
+        Returns:
+            (1) parameter [Bytes]: Binary blob of the state.
+        """
+
+        return State_To_Bytes(self.__class__.__name__, [self.__data_stack.Get_Data(), np.array(self.__zi)])
+
+    def Set_State(self, blob):
+        """
+        Description:
+            Function to set the state of the filter from the binary blob (Get_State).
+
+        Args:
+            (1) blob [Bytes]: Binary blob of the state.
+
+        Returns:
+            (1) parameter [Bool]: The state has been successfully set.
+        """
+
+        try:
+            data, zi = State_From_Bytes(self.__class__.__name__, blob)
+            if zi.shape != np.shape(self.__zi):
+                raise ValueError('The shape of the state does not match the filter.')
+            self.__data_stack.Set_Data(data)
+            self.__zi = zi.tolist()
+
+            return True
+        except (ValueError, struct.error):
+            print('[ERROR] The state does not match the filter.')
+
+            return False
 
 class Simple_Moving_Average(object):
     """
@@ -213,6 +868,7 @@ class Simple_Moving_Average(object):
         Args:
             (1) limit [Float Vector]: Limit (Boundaries: [Lower Value{-}, Upper Value{+}]).
             (2) num_of_data [INT]: Number of total periods.
+            (3) warm_start [Bool]: Seed the state of the filter from the first value (no ramp from zero).
 
         Example:
             Initialization:
@@ -224,18 +880,22 @@ class Simple_Moving_Average(object):
                 Cls.Compute(value{n})
     """
 
-    def __init__(self, limit = [-25.0, 25.0], num_of_data = 100):
+    def __init__(self, limit = [-25.0, 25.0], num_of_data = 100, warm_start = False):
         # << PRIVATE >> #
         # Limit (Boundaries [low(-),high(+)])
         self.__limit = limit
         # Number of total periods
         self.__num_of_data = num_of_data
+        # Seed the state from the first value
+        self.__warm_start = warm_start
         # New value after limit check
         self.__new_value = 0
         # Sum of all values
-        self.__sum = 0
+        self.__sum = 0.0
+        # Number of samples since the last recalculation of the sum
+        self.__sum_counter = 0
         # Data stack of values
-        self.__data_stack  = []
+        self.__data_stack = Ring_Buffer(self.__num_of_data)
 
     def Compute(self, value):
         """
@@ -252,13 +912,880 @@ class Simple_Moving_Average(object):
         # Input data limit check
         self.__new_value = Check_Limit(value, self.__limit, self.__data_stack)
 
-        # Add new data to the stack
-        self.__data_stack.append(self.__new_value)
-        # Calculation of the sum of the current data
-        self.__sum += self.__new_value 
+        if self.__warm_start == True and len(self.__data_stack) == 0:
+            # Warm start: The data stack is full of the first value.
+            self.__data_stack.Fill(self.__new_value)
+            self.__sum = float(np.sum(self.__data_stack.Get_Data()))
 
-        if len(self.__data_stack) > self.__num_of_data:
-            # Remove of the first element and recalculate the sum of the new stack
-            self.__sum -= self.__data_stack.pop(0)  
+        # Add new data to the stack and recalculate the sum of the new stack
+        #   Note: If the stack is full, the first (oldest) element is removed.
+        self.__sum += self.__new_value - self.__data_stack.Append(self.__new_value)
+
+        self.__sum_counter += 1
+        if self.__sum_counter == CONST_SMA_SUM_RECALCULATION_PERIOD:
+            # Recalculation of the sum from the current data (floating-point drift)
+            self.__sum = float(np.sum(self.__data_stack.Get_Data()))
+            self.__sum_counter = 0
 
         return np.float64(self.__sum) / len(self.__data_stack)
+
+    def Get_State(self):
+        """
+        Description:
+            Function to get the state of the filter (e.g. hot restart of the controller).
+
+        Returns:
+            (1) parameter [Bytes]: Binary blob of the state.
+        """
+
+        return State_To_Bytes(self.__class__.__name__, [self.__data_stack.Get_Data()])
+
+    def Set_State(self, blob):
+        """
+        Description:
+            Function to set the state of the filter from the binary blob (Get_State).
+
+        Args:
+            (1) blob [Bytes]: Binary blob of the state.
+
+        Returns:
+            (1) parameter [Bool]: The state has been successfully set.
+        """
+
+        try:
+            data, = State_From_Bytes(self.__class__.__name__, blob)
+            self.__data_stack.Set_Data(data)
+            # Recalculation of the sum from the current data
+            self.__sum = float(np.sum(self.__data_stack.Get_Data()))
+            self.__sum_counter = 0
+
+            return True
+        except (ValueError, struct.error):
+            print('[ERROR] The state does not match the filter.')
+
+            return False
+
+class One_Euro_Filter(object):
+    """
+    Description:
+        The One Euro filter is an adaptive first-order low-pass filter. At low speeds, a low cut-off frequency 
+        reduces the jitter, and at high speeds, the cut-off frequency is increased to reduce the lag.
+        More information in the One_Euro_Step() function.
+
+    Initialization of the Class:
+        Args:
+            (1) limit [Float Vector]: Limit (Boundaries: [Lower Value{-}, Upper Value{+}]).
+            (2) frq_s [INT]: Sample frequency in Hz.
+            (3) min_cutoff [Float]: Minimum cut-off frequency in Hz.
+            (4) beta [Float]: Speed coefficient.
+            (5) d_cutoff [Float]: Cut-off frequency of the derivative in Hz.
+
+        Example:
+            Initialization:
+                Cls = One_Euro_Filter(limit = [-25.0, 25.0], frq_s = 100, min_cutoff = 1.0, beta = 0.05, d_cutoff = 1.0)
+
+            Calculation:
+                Cls.Compute(value{0})
+                ...
+                Cls.Compute(value{n})
+    """
+
+    def __init__(self, limit = [-25.0, 25.0], frq_s = 100, min_cutoff = 1.0, beta = 0.05, d_cutoff = 1.0):
+        # << PRIVATE >> #
+        # Limit (Boundaries [low(-),high(+)])
+        self.__limit = limit
+        # Sampling period
+        self.__t_s = 1.0 / frq_s
+        # Parameters of the filter
+        self.__min_cutoff = min_cutoff
+        self.__beta       = beta
+        self.__d_cutoff   = d_cutoff
+        # State of the filter [x, dx/dt]
+        self.__state = [None, None]
+        # New value after limit check
+        self.__new_value = 0
+        # Data stack of values
+        #   Note: Only the last value is needed for the limit check.
+        self.__data_stack = Ring_Buffer(1)
+
+    def Compute(self, value):
+        """
+        Description:
+            Main function to calculate the One Euro filter.
+
+        Args:
+            (1) value [Float]: Raw value from the sensor.
+        
+        Returns:
+            (1) parameter [Float]: The new value of the filter.
+        """
+
+        # Input data limit check
+        self.__new_value = Check_Limit(value, self.__limit, self.__data_stack)
+
+        # Add new data to the stack
+        self.__data_stack.Append(self.__new_value)
+
+        return One_Euro_Step(self.__state, self.__new_value, self.__t_s, self.__min_cutoff, self.__beta, self.__d_cutoff)
+
+    def Get_State(self):
+        """
+        Description:
+            Function to get the state of the filter (e.g. hot restart of the controller).
+
+        Returns:
+            (1) parameter [Bytes]: Binary blob of the state.
+        """
+
+        return State_To_Bytes(self.__class__.__name__, [np.array(self.__state if self.__state[0] is not None else [], dtype=np.float64)])
+
+    def Set_State(self, blob):
+        """
+        Description:
+            Function to set the state of the filter from the binary blob (Get_State).
+
+        Args:
+            (1) blob [Bytes]: Binary blob of the state.
+
+        Returns:
+            (1) parameter [Bool]: The state has been successfully set.
+        """
+
+        try:
+            state, = State_From_Bytes(self.__class__.__name__, blob)
+            if state.size not in [0, len(self.__state)]:
+                raise ValueError('The shape of the state does not match the filter.')
+            self.__state[:] = state.tolist() if state.size != 0 else [None] * len(self.__state)
+            if state.size != 0:
+                self.__data_stack.Fill(state[0])
+
+            return True
+        except (ValueError, struct.error):
+            print('[ERROR] The state does not match the filter.')
+
+            return False
+
+class Kalman_Filter(object):
+    """
+    Description:
+        The Kalman filter with the constant velocity model. The filter estimates the position and the velocity 
+        of the signal, so the lag of the estimated position is low even if the measurement noise is high.
+        More information in the Kalman_Step() function.
+
+    Initialization of the Class:
+        Args:
+            (1) limit [Float Vector]: Limit (Boundaries: [Lower Value{-}, Upper Value{+}]).
+            (2) frq_s [INT]: Sample frequency in Hz.
+            (3) process_noise [Float]: Standard deviation of the process noise (acceleration in units/s^2).
+            (4) measurement_noise [Float]: Standard deviation of the measurement noise (units).
+
+        Example:
+            Initialization:
+                Cls = Kalman_Filter(limit = [-25.0, 25.0], frq_s = 100, process_noise = 200.0, measurement_noise = 0.3)
+
+            Calculation:
+                Cls.Compute(value{0})
+                ...
+                Cls.Compute(value{n})
+
+            Returns:
+                Cls.Get_Velocity()      # The estimated velocity (units/s)
+    """
+
+    def __init__(self, limit = [-25.0, 25.0], frq_s = 100, process_noise = 200.0, measurement_noise = 0.3):
+        # << PRIVATE >> #
+        # Limit (Boundaries [low(-),high(+)])
+        self.__limit = limit
+        # Sampling period
+        self.__t_s = 1.0 / frq_s
+        # Variance of the process noise and the measurement noise
+        self.__q = process_noise**2
+        self.__r = measurement_noise**2
+        # State of the filter [position, velocity, P_00, P_01, P_11]
+        self.__state = [None] * 5
+        # New value after limit check
+        self.__new_value = 0
+        # Data stack of values
+        #   Note: Only the last value is needed for the limit check.
+        self.__data_stack = Ring_Buffer(1)
+
+    def Compute(self, value):
+        """
+        Description:
+            Main function to calculate the Kalman filter.
+
+        Args:
+            (1) value [Float]: Raw value from the sensor.
+        
+        Returns:
+            (1) parameter [Float]: The estimated position.
+        """
+
+        # Input data limit check
+        self.__new_value = Check_Limit(value, self.__limit, self.__data_stack)
+
+        # Add new data to the stack
+        self.__data_stack.Append(self.__new_value)
+
+        return Kalman_Step(self.__state, self.__new_value, self.__t_s, self.__q, self.__r)
+
+    def Get_Velocity(self):
+        """
+        Description:
+            Function to get the estimated velocity.
+
+        Returns:
+            (1) parameter [Float]: The estimated velocity (units/s).
+        """
+
+        return self.__state[1] if self.__state[1] is not None else 0.0
+
+    def Get_State(self):
+        """
+        Description:
+            Function to get the state of the filter (e.g. hot restart of the controller).
+
+        Returns:
+            (1) parameter [Bytes]: Binary blob of the state.
+        """
+
+        return State_To_Bytes(self.__class__.__name__, [np.array(self.__state if self.__state[0] is not None else [], dtype=np.float64)])
+
+    def Set_State(self, blob):
+        """
+        Description:
+            Function to set the state of the filter from the binary blob (Get_State).
+
+        Args:
+            (1) blob [Bytes]: Binary blob of the state.
+
+        Returns:
+            (1) parameter [Bool]: The state has been successfully set.
+        """
+
+        try:
+            state, = State_From_Bytes(self.__class__.__name__, blob)
+            if state.size not in [0, len(self.__state)]:
+                raise ValueError('The shape of the state does not match the filter.')
+            self.__state[:] = state.tolist() if state.size != 0 else [None] * len(self.__state)
+            if state.size != 0:
+                self.__data_stack.Fill(state[0])
+
+            return True
+        except (ValueError, struct.error):
+            print('[ERROR] The state does not match the filter.')
+
+            return False
+
+class Hampel_Filter(object):
+    """
+    Description:
+        Deterministic outlier rejection (e.g. IR occlusion spikes inside the limits). The stage is intended to be 
+        placed in front of the SMA, BLP or BLPMA filter.
+
+        (1) Hampel filter: The new value is compared with the median of the last {num_of_data} raw values. If the
+            deviation is greater than {num_of_sigmas} standard deviations (and {min_deviation}), the value is 
+            replaced by the median. The standard deviation is estimated from the interquartile range (IQR / 1.349).
+        (2) Rate-of-change gate: If the step from the previous output is greater than {max_rate} * T_s, the step 
+            is limited to {max_rate} * T_s, so a real fast movement is followed with a bounded lag.
+
+        The window is also kept sorted in an indexable skip list (Sorted_Window), so the removal of the oldest value, 
+        the insertion of the new one and the median and the quartiles are O(log n) per sample.
+
+    Initialization of the Class:
+        Args:
+            (1) num_of_data [INT]: Number of values in the window.
+            (2) num_of_sigmas [Float]: Threshold in standard deviations.
+            (3) min_deviation [Float]: Minimum threshold (units), e.g. the noise floor of a signal at rest.
+            (4) max_rate [Float]: Maximum rate of change (units/s), None: the gate is not used.
+            (5) frq_s [INT]: Sample frequency in Hz.
+
+        Example:
+            Initialization:
+                Cls = Hampel_Filter(num_of_data = 9, num_of_sigmas = 3.0, min_deviation = 0.5, max_rate = 100.0, frq_s = 250)
+
+            Calculation:
+                Cls.Compute(value{0})
+                ...
+                Cls.Compute(value{n})
+
+            Returns:
+                Cls.Get_Num_Of_Rejected()   # Number of rejected values (Hampel filter + gate)
+    """
+
+    def __init__(self, num_of_data = 9, num_of_sigmas = 3.0, min_deviation = 0.5, max_rate = None, frq_s = 100):
+        # << PRIVATE >> #
+        # Threshold of the Hampel filter
+        self.__num_of_sigmas = num_of_sigmas
+        self.__min_deviation = min_deviation
+        # Maximum step between two outputs (Rate-of-change gate)
+        self.__max_step = max_rate / frq_s if max_rate is not None else None
+        # Window of raw values: sorted and in the order of arrival
+        self.__num_of_data = num_of_data
+        self.__data_sorted = Sorted_Window(num_of_data)
+        self.__data_stack  = Ring_Buffer(num_of_data)
+        # The last output value
+        self.__last_value = None
+        # Number of rejected values
+        self.__num_of_rejected = 0
+
+    def __Quantile(self, q):
+        # Quantile of the sorted window (linear interpolation, the same as numpy.percentile)
+        position = (len(self.__data_sorted) - 1) * q
+        i = int(position); ratio = position - i
+
+        if ratio == 0.0:
+            return self.__data_sorted[i]
+
+        return self.__data_sorted[i] + ratio * (self.__data_sorted[i + 1] - self.__data_sorted[i])
+
+    def Compute(self, value):
+        """
+        Description:
+            Main function to reject the outliers.
+
+        Args:
+            (1) value [Float]: Raw value from the sensor (after the limit check).
+        
+        Returns:
+            (1) parameter [Float]: The value, or the replacement of the rejected value.
+        """
+
+        value = float(value); raw_value = value
+
+        # Update the sorted window: remove the oldest value and insert the new one.
+        if len(self.__data_stack) == self.__num_of_data:
+            self.__data_sorted.Remove(self.__data_stack[0])
+        self.__data_stack.Append(value)
+        self.__data_sorted.Insert(value)
+
+        # Hampel filter
+        median    = self.__Quantile(0.5)
+        threshold = max(self.__num_of_sigmas * (self.__Quantile(0.75) - self.__Quantile(0.25)) / 1.349, self.__min_deviation)
+        if abs(value - median) > threshold:
+            value = median
+
+        # Rate-of-change gate
+        if self.__max_step is not None and self.__last_value is not None and abs(value - self.__last_value) > self.__max_step:
+            value = self.__last_value + (self.__max_step if value > self.__last_value else -self.__max_step)
+
+        if value != raw_value:
+            self.__num_of_rejected += 1
+        self.__last_value = value
+
+        return value
+
+    def Get_State(self):
+        """
+        Description:
+            Function to get the state of the filter (e.g. hot restart of the controller).
+
+        Returns:
+            (1) parameter [Bytes]: Binary blob of the state.
+        """
+
+        return State_To_Bytes(self.__class__.__name__, [self.__data_stack.Get_Data(), 
+                                                        np.array([self.__last_value] if self.__last_value is not None else [], dtype=np.float64)])
+
+    def Set_State(self, blob):
+        """
+        Description:
+            Function to set the state of the filter from the binary blob (Get_State).
+
+        Args:
+            (1) blob [Bytes]: Binary blob of the state.
+
+        Returns:
+            (1) parameter [Bool]: The state has been successfully set.
+        """
+
+        try:
+            data, last_value = State_From_Bytes(self.__class__.__name__, blob)
+            if last_value.size not in [0, 1]:
+                raise ValueError('The shape of the state does not match the filter.')
+            self.__data_stack.Set_Data(data)
+            # The sorted window is rebuilt from the values in the order of arrival.
+            self.__data_sorted.Clear()
+            for value in self.__data_stack.Get_Data().tolist():
+                self.__data_sorted.Insert(value)
+            self.__last_value  = float(last_value[0]) if last_value.size != 0 else None
+
+            return True
+        except (ValueError, struct.error):
+            print('[ERROR] The state does not match the filter.')
+
+            return False
+
+    def Get_Num_Of_Rejected(self):
+        """
+        Description:
+            Function to get the number of rejected values.
+
+        Returns:
+            (1) parameter [INT]: Number of rejected values.
+        """
+
+        return self.__num_of_rejected
+
+class Filter_Bank(object):
+    """
+    Description:
+        A bank of filters (SMA, BLP, BLPMA, One Euro or Kalman) for multiple channels. The state of all channels is held 
+        in one set of NumPy arrays, so a vector of values (e.g. position {X, Y, Z} or fingers bend {T, I, M, R, L}) 
+        is filtered in one call.
+
+        The result of each channel is the same as the result of the corresponding single-channel class 
+        (Simple_Moving_Average, Butterworth_Low_Pass, Butterworth_Low_Pass_Moving_Average, One_Euro_Filter, 
+        Kalman_Filter).
+
+    Initialization of the Class:
+        Args:
+            (1) filter_type [INT]: Type of the filter (CONST_FILTER_TYPE_{SMA, BLP, BLPMA, ONE_EURO, KALMAN}).
+            (2) limit [Float Matrix]: Limit for each channel (Boundaries: [Lower Value{-}, Upper Value{+}]).
+                                      Note: 
+                                        The number of channels is equal to the number of limits.
+            (3) num_of_data [INT]: Number of total periods (SMA: moving average, BLP/BLPMA: butterworth filter).
+            (4) num_of_data_avg [INT]: Number of total periods of the moving average (BLPMA only).
+            (5) frq_s [INT]: Sample frequency in Hz.
+            (6) frq_c [Float]: Cut-off frequency in Hz (BLP/BLPMA only).
+            (7) order [INT]: Order of the butterworth filter (BLP/BLPMA only).
+            (8) mode [INT]: Filter mode (CONST_BLP_MODE_WINDOW or CONST_BLP_MODE_STREAM, BLP/BLPMA only).
+            (9) min_cutoff, beta, d_cutoff [Float]: Parameters of the One Euro filter (ONE_EURO only).
+            (10) process_noise, measurement_noise [Float]: Parameters of the Kalman filter (KALMAN only).
+            (11) warm_start [Bool]: Seed the state of the filter from the first value (no ramp from zero).
+            (12) outlier [Float Vector]: Parameters of the outlier rejection stage in front of the filter (Hampel_Filter), 
+                                         [num_of_data, num_of_sigmas, min_deviation, max_rate], None: the stage is not used.
+
+        Example:
+            Initialization:
+                Cls = Filter_Bank(filter_type = CONST_FILTER_TYPE_BLPMA, limit = Parameters.CONST_FILTER_POS_LIMIT, num_of_data = 100, 
+                                  num_of_data_avg = 20, frq_s = 250, frq_c = 1.95, order = 3, mode = CONST_BLP_MODE_WINDOW)
+
+            Calculation:
+                Cls.Compute([x{0}, y{0}, z{0}])
+                ...
+                Cls.Compute([x{n}, y{n}, z{n}])
+    """
+
+    def __init__(self, filter_type = CONST_FILTER_TYPE_SMA, limit = [[-25.0, 25.0]], num_of_data = 100, num_of_data_avg = 10, frq_s = 100, frq_c = 1.0, 
+                 order = 2, mode = CONST_BLP_MODE_WINDOW, min_cutoff = 1.0, beta = 0.05, d_cutoff = 1.0, process_noise = 200.0, measurement_noise = 0.3, 
+                 warm_start = False, outlier = None):
+        # << PRIVATE >> #
+        # Type of the filter
+        self.__filter_type = filter_type
+        # Seed the state from the first value
+        #   Note: The adaptive filters (One Euro, Kalman) are always initialized from the first value.
+        self.__warm_start = warm_start
+        # The first value has been processed
+        self.__is_started = False
+        # Limit for each channel (Boundaries [low(-),high(+)])
+        self.__limit = np.array(limit, dtype=np.float64)
+        # Number of channels
+        self.__num_of_channels = self.__limit.shape[0]
+        # The last values after limit check
+        self.__last_value = np.zeros(self.__num_of_channels, dtype=np.float64)
+        # Outlier rejection stage (one sorted window per channel)
+        self.__outlier = [Hampel_Filter(*outlier, frq_s) for _ in range(self.__num_of_channels)] if outlier is not None else None
+
+        # Simple moving average (SMA) stage: SMA, BLPMA
+        if self.__filter_type in [CONST_FILTER_TYPE_SMA, CONST_FILTER_TYPE_BLPMA]:
+            # Number of total periods
+            self.__num_of_data_avg = num_of_data if self.__filter_type == CONST_FILTER_TYPE_SMA else num_of_data_avg
+            # Sum of all values
+            self.__sum = np.zeros(self.__num_of_channels, dtype=np.float64)
+            # Number of samples since the last recalculation of the sum
+            self.__sum_counter = 0
+            # Data stack of values
+            self.__data_stack_avg = Ring_Buffer(self.__num_of_data_avg, self.__num_of_channels)
+
+        # Butterworth low-pass (BLP) stage: BLP, BLPMA
+        if self.__filter_type in [CONST_FILTER_TYPE_BLP, CONST_FILTER_TYPE_BLPMA]:
+            # The normalized value of a frequency variable: f_c/f_s
+            #   Note: Nyquist frequency f_s/2
+            w_c_normalized = frq_c / (frq_s/2)
+            # Filter mode (Window or Stream)
+            self.__mode = mode
+            # Transfer function coefficients of the filter (Window mode)
+            self.__b, self.__a = scipy.signal.butter(order, w_c_normalized, btype='lowpass', analog=False)
+            #   Initial condition of the window for a unit input (Warm start)
+            self.__zi_window = scipy.signal.lfilter_zi(self.__b, self.__a)
+            # Second-order sections and the state of the filter (Stream mode)
+            #   Note: State shape {number of sections, number of channels, 2}.
+            self.__sos = scipy.signal.butter(order, w_c_normalized, btype='lowpass', analog=False, output='sos')
+            self.__zi  = np.zeros((self.__sos.shape[0], self.__num_of_channels, 2), dtype=np.float64)
+            # Data stack of values
+            if self.__mode == CONST_BLP_MODE_WINDOW:
+                self.__data_stack_blp = Ring_Buffer(num_of_data, self.__num_of_channels)
+
+        # Adaptive filters: One Euro, Kalman
+        if self.__filter_type in [CONST_FILTER_TYPE_ONE_EURO, CONST_FILTER_TYPE_KALMAN]:
+            # Sampling period
+            self.__t_s = 1.0 / frq_s
+            # Parameters of the One Euro filter
+            self.__min_cutoff = min_cutoff; self.__beta = beta; self.__d_cutoff = d_cutoff
+            # Variance of the process noise and the measurement noise (Kalman)
+            self.__q = process_noise**2; self.__r = measurement_noise**2
+            # State of the filter (vectors, one value per channel)
+            self.__state = [None] * (2 if self.__filter_type == CONST_FILTER_TYPE_ONE_EURO else 5)
+
+    def __Warm_Start(self, value):
+        # Seed the state of all stages from the first value (steady state for a constant input)
+        if self.__filter_type in [CONST_FILTER_TYPE_SMA, CONST_FILTER_TYPE_BLPMA]:
+            self.__data_stack_avg.Fill(value)
+            self.__sum = np.sum(self.__data_stack_avg.Get_Data(), axis=-1)
+        if self.__filter_type in [CONST_FILTER_TYPE_BLP, CONST_FILTER_TYPE_BLPMA]:
+            Butterworth_Warm_Start(self.__data_stack_blp if self.__mode == CONST_BLP_MODE_WINDOW else None, self.__sos, self.__zi, value)
+
+    def __Compute_SMA(self, value):
+        # Add new data to the stack and recalculate the sum of the new stack
+        self.__sum += value - self.__data_stack_avg.Append(value)
+
+        self.__sum_counter += 1
+        if self.__sum_counter == CONST_SMA_SUM_RECALCULATION_PERIOD:
+            # Recalculation of the sum from the current data (floating-point drift)
+            self.__sum = np.sum(self.__data_stack_avg.Get_Data(), axis=-1)
+            self.__sum_counter = 0
+
+        return self.__sum / len(self.__data_stack_avg)
+
+    def __Compute_BLP(self, value):
+        if self.__mode == CONST_BLP_MODE_STREAM:
+            # Transposed direct form II of each section (all channels at once)
+            for i, (b_0, b_1, b_2, _, a_1, a_2) in enumerate(self.__sos):
+                z = self.__zi[i]
+                y = b_0 * value + z[:, 0]
+                z[:, 0] = b_1 * value - a_1 * y + z[:, 1]
+                z[:, 1] = b_2 * value - a_2 * y
+                value = y
+
+            return value
+
+        # Add new data to the stack
+        self.__data_stack_blp.Append(value)
+
+        if self.__warm_start == True:
+            # The signal before the window is equal to the oldest value of the window (no ramp from zero).
+            data = self.__data_stack_blp.Get_Data()
+            return scipy.signal.lfilter(self.__b, self.__a, data, axis=-1, zi=self.__zi_window[np.newaxis, :] * data[:, 0:1])[0][:, -1]
+
+        return scipy.signal.lfilter(self.__b, self.__a, self.__data_stack_blp.Get_Data(), axis=-1)[:, -1]
+
+    def Compute(self, value):
+        """
+        Description:
+            Main function to calculate the filtered values of all channels.
+
+        Args:
+            (1) value [Float Vector]: Raw values from the sensor (one value per channel).
+        
+        Returns:
+            (1) parameter [Float Vector]: The new values of the filter model.
+        """
+
+        # Input data limit check
+        value = Check_Limit_Vector(np.asarray(value, dtype=np.float64), self.__limit, self.__last_value)
+        self.__last_value = value
+
+        # Outlier rejection
+        if self.__outlier is not None:
+            value = np.array([H.Compute(v) for H, v in zip(self.__outlier, value)])
+
+        if self.__warm_start == True and self.__is_started == False:
+            self.__Warm_Start(value)
+        self.__is_started = True
+
+        if self.__filter_type == CONST_FILTER_TYPE_SMA:
+            return self.__Compute_SMA(value)
+        elif self.__filter_type == CONST_FILTER_TYPE_BLP:
+            return self.__Compute_BLP(value)
+        elif self.__filter_type == CONST_FILTER_TYPE_BLPMA:
+            return self.__Compute_BLP(self.__Compute_SMA(value))
+        elif self.__filter_type == CONST_FILTER_TYPE_ONE_EURO:
+            return One_Euro_Step(self.__state, value, self.__t_s, self.__min_cutoff, self.__beta, self.__d_cutoff)
+        else:
+            return Kalman_Step(self.__state, value, self.__t_s, self.__q, self.__r)
+
+    def Get_Velocity(self):
+        """
+        Description:
+            Function to get the estimated velocity of all channels (Kalman filter only).
+
+        Returns:
+            (1) parameter [Float Vector]: The estimated velocity (units/s), zeros for other types of filters.
+        """
+
+        if self.__filter_type == CONST_FILTER_TYPE_KALMAN and self.__state[1] is not None:
+            return self.__state[1]
+
+        return np.zeros(self.__num_of_channels, dtype=np.float64)
+
+    def Get_Num_Of_Rejected(self):
+        """
+        Description:
+            Function to get the number of values rejected by the outlier rejection stage.
+
+        Returns:
+            (1) parameter [INT Vector]: Number of rejected values of each channel.
+        """
+
+        if self.__outlier is not None:
+            return np.array([H.Get_Num_Of_Rejected() for H in self.__outlier])
+
+        return np.zeros(self.__num_of_channels, dtype=np.int64)
+
+    def Get_State(self):
+        """
+        Description:
+            Function to get the state of all channels (e.g. hot restart of the controller).
+
+        Returns:
+            (1) parameter [Bytes]: Binary blob of the state.
+        """
+
+        # The last values after limit check and the state of each stage
+        state = [self.__last_value]
+        if self.__outlier is not None:
+            state += [np.frombuffer(H.Get_State(), dtype=np.uint8) for H in self.__outlier]
+        if self.__filter_type in [CONST_FILTER_TYPE_SMA, CONST_FILTER_TYPE_BLPMA]:
+            state.append(self.__data_stack_avg.Get_Data())
+        if self.__filter_type in [CONST_FILTER_TYPE_BLP, CONST_FILTER_TYPE_BLPMA]:
+            state.append(self.__data_stack_blp.Get_Data() if self.__mode == CONST_BLP_MODE_WINDOW else np.zeros((self.__num_of_channels, 0)))
+            state.append(self.__zi)
+        if self.__filter_type in [CONST_FILTER_TYPE_ONE_EURO, CONST_FILTER_TYPE_KALMAN]:
+            state.append(np.array(self.__state if self.__state[0] is not None else np.zeros((0, self.__num_of_channels)), dtype=np.float64))
+
+        return State_To_Bytes(f'{self.__class__.__name__}_{self.__filter_type}', state)
+
+    def Set_State(self, blob):
+        """
+        Description:
+            Function to set the state of all channels from the binary blob (Get_State).
+
+        Args:
+            (1) blob [Bytes]: Binary blob of the state.
+
+        Returns:
+            (1) parameter [Bool]: The state has been successfully set.
+        """
+
+        try:
+            state = State_From_Bytes(f'{self.__class__.__name__}_{self.__filter_type}', blob)
+            if len(state) == 0 or state[0].shape != self.__last_value.shape:
+                raise ValueError('The shape of the state does not match the filter.')
+            self.__last_value = state.pop(0)
+            if self.__outlier is not None:
+                for H in self.__outlier:
+                    if len(state) == 0 or state[0].dtype != np.uint8 or H.Set_State(state.pop(0).tobytes()) == False:
+                        raise ValueError('The state of the outlier rejection stage does not match the filter.')
+            if self.__filter_type in [CONST_FILTER_TYPE_SMA, CONST_FILTER_TYPE_BLPMA]:
+                self.__data_stack_avg.Set_Data(state.pop(0))
+                # Recalculation of the sum from the current data
+                self.__sum = np.sum(self.__data_stack_avg.Get_Data(), axis=-1)
+                self.__sum_counter = 0
+            if self.__filter_type in [CONST_FILTER_TYPE_BLP, CONST_FILTER_TYPE_BLPMA]:
+                data = state.pop(0)
+                if self.__mode == CONST_BLP_MODE_WINDOW:
+                    self.__data_stack_blp.Set_Data(data)
+                zi = state.pop(0)
+                if zi.shape != self.__zi.shape:
+                    raise ValueError('The shape of the state does not match the filter.')
+                self.__zi = zi
+            if self.__filter_type in [CONST_FILTER_TYPE_ONE_EURO, CONST_FILTER_TYPE_KALMAN]:
+                data = state.pop(0)
+                if data.shape[0] not in [0, len(self.__state)]:
+                    raise ValueError('The shape of the state does not match the filter.')
+                self.__state = list(data) if data.shape[0] != 0 else [None] * len(self.__state)
+            if len(state) != 0:
+                raise ValueError('The number of the stages does not match the filter.')
+            self.__is_started = True
+
+            return True
+        except (ValueError, IndexError, struct.error):
+            print('[ERROR] The state does not match the filter.')
+
+            return False
+
+"""
+Offline (batch) filtering:
+    The functions below reproduce the output sequence of the streaming classes (SMA, BLP, BLPMA) over 
+    a whole recording at once. The input can be any 1-D array, including a memory-mapped column (numpy.memmap).
+
+    Example:
+        data = pd.read_csv('Evaluation/P5_Results/Experiment_Position.txt')['X_DATA_RT'].to_numpy()
+        data_filtered = Butterworth_Low_Pass_Moving_Average_Batch(data, [-22.5, 22.5], 100, 50, 250, 2.5, 3)
+"""
+
+def Check_Limit_Batch(data, limit):
+    """
+    Description:
+        Input data limit check over the whole recording (vectorized version of the Check_Limit function).
+
+        An out-of-range value is replaced by the last value within the limits (0.0 if there is no such value), 
+        the same as in the streaming classes.
+
+    Args:
+        (1) data [Float Vector]: Raw values from the sensor.
+        (2) limit [Float Vector]: Limit (Boundaries [low(-),high(+)]).
+        
+    Returns:
+        (1) parameter [Float Vector]: New values after limit check.
+
+    """
+
+    data = np.asarray(data, dtype=np.float64)
+
+    in_range = (limit[0] <= data) & (data <= limit[1])
+
+    if in_range.all():
+        # Return input values (everything is fine).
+        return data.copy()
+
+    # Index of the last value within the limits (-1: no such value, the previous value is 0.0)
+    index = np.maximum.accumulate(np.where(in_range, np.arange(data.shape[0]), -1))
+
+    return np.where(index >= 0, data[np.maximum(index, 0)], 0.0)
+
+def Hampel_Filter_Batch(data, num_of_data = 9, num_of_sigmas = 3.0, min_deviation = 0.5, max_rate = None, frq_s = 100):
+    """
+    Description:
+        Outlier rejection over the whole recording (vectorized version of the Hampel_Filter class).
+
+        The median and the quartiles of all windows are calculated at once (sliding window view). The first 
+        windows are shorter (the same as in the streaming class). The rate-of-change gate depends on the previous 
+        output, so it is calculated sample by sample (only if {max_rate} is not None).
+
+    Args:
+        (1) data [Float Vector]: Raw values from the sensor (after the limit check).
+        (2 - 6) num_of_data, num_of_sigmas, min_deviation, max_rate, frq_s: More information in the Hampel_Filter class.
+        
+    Returns:
+        (1) parameter [Float Vector]: The values, rejected values are replaced.
+        (2) parameter [Bool Vector]: The value was rejected.
+
+    """
+
+    data = np.asarray(data, dtype=np.float64)
+
+    def Quantile(data_sorted, q):
+        # Quantile of the sorted windows (linear interpolation, the same as in the Hampel_Filter class)
+        position = (data_sorted.shape[-1] - 1) * q
+        i = int(position); ratio = position - i
+
+        if ratio == 0.0:
+            return data_sorted[..., i]
+
+        return data_sorted[..., i] + ratio * (data_sorted[..., i + 1] - data_sorted[..., i])
+
+    # Sorted windows of the last {num_of_data} values
+    #   Note: The first (num_of_data - 1) windows are not full yet.
+    q_25, median, q_75 = np.zeros((3, data.shape[0]))
+    for i in range(min(num_of_data - 1, data.shape[0])):
+        window = np.sort(data[0:i + 1])
+        q_25[i], median[i], q_75[i] = Quantile(window, 0.25), Quantile(window, 0.5), Quantile(window, 0.75)
+    if data.shape[0] >= num_of_data:
+        window = np.sort(np.lib.stride_tricks.sliding_window_view(data, num_of_data), axis=-1)
+        q_25[num_of_data - 1:], median[num_of_data - 1:], q_75[num_of_data - 1:] = Quantile(window, 0.25), Quantile(window, 0.5), Quantile(window, 0.75)
+
+    # Hampel filter
+    threshold = np.maximum(num_of_sigmas * (q_75 - q_25) / 1.349, min_deviation)
+    data_filtered = np.where(np.abs(data - median) > threshold, median, data)
+
+    # Rate-of-change gate
+    if max_rate is not None:
+        max_step = max_rate / frq_s; i = 0
+        for index in np.flatnonzero(np.abs(np.diff(data_filtered)) > max_step) + 1:
+            # Limit the steps until the output is within the maximum step from the input again.
+            i = max(i, index)
+            while i < data_filtered.shape[0] and abs(data_filtered[i] - data_filtered[i-1]) > max_step:
+                data_filtered[i] = data_filtered[i-1] + (max_step if data_filtered[i] > data_filtered[i-1] else -max_step)
+                i += 1
+
+    return data_filtered, data_filtered != data
+
+def Simple_Moving_Average_Batch(data, limit = [-25.0, 25.0], num_of_data = 100):
+    """
+    Description:
+        Simple moving average (SMA) of the whole recording. Equivalent to the Simple_Moving_Average class.
+
+    Args:
+        (1) data [Float Vector]: Raw values from the sensor.
+        (2) limit [Float Vector]: Limit (Boundaries: [Lower Value{-}, Upper Value{+}]).
+        (3) num_of_data [INT]: Number of total periods.
+        
+    Returns:
+        (1) parameter [Float Vector]: The values of the SMA model.
+    """
+
+    data = Check_Limit_Batch(data, limit)
+
+    # Cumulative sum of the values (the first element is zero)
+    data_sum = np.concatenate(([0.0], np.cumsum(data)))
+
+    index = np.arange(1, data.shape[0] + 1)
+    # Number of values in the data stack
+    length = np.minimum(index, num_of_data)
+
+    return (data_sum[index] - data_sum[index - length]) / length
+
+def Butterworth_Low_Pass_Batch(data, limit = [-25.0, 25.0], num_of_data = 100, frq_s = 100, frq_c = 1.0, order = 2, mode = CONST_BLP_MODE_WINDOW):
+    """
+    Description:
+        Butterworth low-pass filter (BLP) of the whole recording. Equivalent to the Butterworth_Low_Pass class.
+
+        Note:
+            The window mode is equal to the convolution of the input with the impulse response of the filter 
+            truncated to {num_of_data} samples, the stream mode is a standard IIR filter.
+
+    Args:
+        (1) data [Float Vector]: Raw values from the sensor.
+        (2) limit [Float Vector]: Limit (Boundaries: [Lower Value{-}, Upper Value{+}]).
+        (3) num_of_data [INT]: Number of total periods.
+        (4) frq_s [INT]: Sample frequency in Hz.
+        (5) frq_c [Float]: Cut-off frequency in Hz.
+        (6) order [INT]: Order of the butterworth filter.
+        (7) mode [INT]: Filter mode (CONST_BLP_MODE_WINDOW or CONST_BLP_MODE_STREAM).
+        
+    Returns:
+        (1) parameter [Float Vector]: The values of the BLP model.
+    """
+
+    data = Check_Limit_Batch(data, limit)
+
+    # The normalized value of a frequency variable: f_c/f_s
+    #   Note: Nyquist frequency f_s/2
+    w_c_normalized = frq_c / (frq_s/2)
+
+    if mode == CONST_BLP_MODE_STREAM:
+        return scipy.signal.sosfilt(scipy.signal.butter(order, w_c_normalized, btype='lowpass', analog=False, output='sos'), data)
+
+    # Impulse response of the filter truncated to the window size
+    impulse = np.zeros(num_of_data)
+    impulse[0] = 1.0
+    h = scipy.signal.lfilter(*scipy.signal.butter(order, w_c_normalized, btype='lowpass', analog=False), impulse)
+
+    return scipy.signal.oaconvolve(data, h)[:data.shape[0]]
+
+def Butterworth_Low_Pass_Moving_Average_Batch(data, limit = [-25.0, 25.0], num_of_data_blp = 100, num_of_data_avg = 10, frq_s = 100, frq_c = 1.0, order = 2, 
+                                              mode = CONST_BLP_MODE_WINDOW):
+    """
+    Description:
+        Butterworth low-pass moving average (BLPMA) of the whole recording. Equivalent to the 
+        Butterworth_Low_Pass_Moving_Average class.
+
+    Args:
+        (1) data [Float Vector]: Raw values from the sensor.
+        (2) limit [Float Vector]: Limit (Boundaries: [Lower Value{-}, Upper Value{+}]).
+        (3) num_of_data_blp [INT]: Number of total periods (BLP).
+        (4) num_of_data_avg [INT]: Number of total periods (SMA).
+        (5) frq_s [INT]: Sample frequency in Hz.
+        (6) frq_c [Float]: Cut-off frequency in Hz.
+        (7) order [INT]: Order of the butterworth filter.
+        (8) mode [INT]: Filter mode (CONST_BLP_MODE_WINDOW or CONST_BLP_MODE_STREAM).
+        
+    Returns:
+        (1) parameter [Float Vector]: The values of the BLPMA model.
+    """
+
+    # The output of the SMA is not checked again (as in the streaming class).
+    return Butterworth_Low_Pass_Batch(Simple_Moving_Average_Batch(data, limit, num_of_data_avg), [-np.inf, np.inf], num_of_data_blp, 
+                                      frq_s, frq_c, order, mode)
@@ -0,0 +1,271 @@
+"""
+## =========================================================================== ##
+MIT License
+Copyright (c) 2021 Roman Parak
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+## =========================================================================== ##
+Author   : Roman Parak
+Email    : Roman.Parak@outlook.com
+Github   : https://github.com/rparak
+File Name: Filter_Analysis.py
+## =========================================================================== ##
+"""
+
+# System (Default)
+import sys
+# OS (Operating system interfaces)
+import os
+# CSV (File reading and writing)
+import csv
+# Numpy (Array computing) [pip3 install numpy]
+import numpy as np
+# Scipy (Mathematics, science, etc.) [pip install scipy]
+import scipy.signal
+import scipy.linalg
+# Lib.Signal.Filter (Filters: SMA, BLP, BLPMA, One Euro, Kalman)
+import Lib.Signal.Filter as Filter
+# Lib.Parameters (Main Control Parameters)
+import Lib.Parameters as Parameters
+
+"""
+Description:
+    Latency / phase-lag analysis of the filter configurations.
+
+    For each configuration the following values are reported:
+        - Delay: Group delay at the frequency of the hand motion (CONST_ANALYSIS_FRQ_MOTION) in ms.
+        - Settling: Step-response settling time (CONST_ANALYSIS_SETTLING_BAND of the final value) in ms.
+        - Attenuation: Attenuation of the glove noise band (CONST_ANALYSIS_NOISE_BAND) in dB.
+
+    Each value is calculated analytically from the transfer function of the filter (where the filter allows it) and
+    empirically by driving the streaming filter (Filter_Bank) with synthetic signals:
+        - Delay: Phase of the output for a sine wave input (least-squares fit).
+        - Settling: Step input.
+        - Attenuation: Power spectral density (Welch) of the output for a white noise input.
+
+    Notes:
+        The One Euro filter is nonlinear, its analytic values are calculated at rest (cut-off frequency = min_cutoff).
+        The Kalman filter is analysed in the steady state (constant Kalman gain).
+
+    Run (from the ../src/ folder):
+        $ python -m Lib.Signal.Filter_Analysis
+
+    The lag-vs-noise table is written to the console and saved to the ../src/Evaluation/Benchmark_Results/ folder (.csv).
+"""
+
+# Initialization of Constants:
+#   Sample frequency in Hz
+CONST_ANALYSIS_FRQ_S = 1/Parameters.CONST_TIME_STEP
+#   Frequency of the hand motion in Hz
+CONST_ANALYSIS_FRQ_MOTION = 0.5
+#   Glove noise band in Hz [low, high]
+CONST_ANALYSIS_NOISE_BAND = [10.0, 100.0]
+#   Settling band (relative to the final value)
+CONST_ANALYSIS_SETTLING_BAND = 0.02
+#   End-to-end latency budget of the filter in ms
+CONST_ANALYSIS_LATENCY_BUDGET = 50.0
+#   Number of samples of the synthetic signals
+CONST_ANALYSIS_NUM_OF_SAMPLES = 5000
+#   Candidate configurations (Filter_Bank arguments)
+CONST_ANALYSIS_CONFIGURATIONS = [
+    {'name': 'SMA (N: 20)', 'filter_type': Filter.CONST_FILTER_TYPE_SMA, 'num_of_data': 20},
+    {'name': 'SMA (N: 100)', 'filter_type': Filter.CONST_FILTER_TYPE_SMA, 'num_of_data': 100},
+    {'name': 'BLP (N: 100, 2.5 Hz, 3, Window)', 'filter_type': Filter.CONST_FILTER_TYPE_BLP, 'num_of_data': 100, 'frq_c': 2.5, 'order': 3,
+     'mode': Filter.CONST_BLP_MODE_WINDOW},
+    {'name': 'BLP (2.5 Hz, 3, Stream)', 'filter_type': Filter.CONST_FILTER_TYPE_BLP, 'frq_c': 2.5, 'order': 3, 'mode': Filter.CONST_BLP_MODE_STREAM},
+    {'name': 'BLPMA (N: 100/20, 1.95 Hz, 3, Window)', 'filter_type': Filter.CONST_FILTER_TYPE_BLPMA, 'num_of_data': 100, 'num_of_data_avg': 20,
+     'frq_c': 1.95, 'order': 3, 'mode': Filter.CONST_BLP_MODE_WINDOW},
+    {'name': 'BLPMA (N: 20, 1.95 Hz, 3, Stream)', 'filter_type': Filter.CONST_FILTER_TYPE_BLPMA, 'num_of_data_avg': 20, 'frq_c': 1.95, 'order': 3,
+     'mode': Filter.CONST_BLP_MODE_STREAM},
+    {'name': 'BLPMA (N: 5, 5.0 Hz, 2, Stream)', 'filter_type': Filter.CONST_FILTER_TYPE_BLPMA, 'num_of_data_avg': 5, 'frq_c': 5.0, 'order': 2,
+     'mode': Filter.CONST_BLP_MODE_STREAM},
+    {'name': 'One Euro (1.0 Hz, 0.05, 1.0 Hz)', 'filter_type': Filter.CONST_FILTER_TYPE_ONE_EURO, 'min_cutoff': 1.0, 'beta': 0.05, 'd_cutoff': 1.0},
+    {'name': 'Kalman (200.0, 0.3)', 'filter_type': Filter.CONST_FILTER_TYPE_KALMAN, 'process_noise': 200.0, 'measurement_noise': 0.3},
+]
+#   Output file name
+CONST_ANALYSIS_FILE_NAME = 'Filter_Analysis'
+
+def Transfer_Function(configuration, frq_s):
+    """
+    Description:
+        Function to get the transfer function (b, a) of the filter configuration.
+
+    Args:
+        (1) configuration [Dictionary]: Filter configuration (Filter_Bank arguments).
+        (2) frq_s [Float]: Sample frequency in Hz.
+
+    Returns:
+        (1) parameter [Float Vector, Float Vector]: Numerator and denominator of the transfer function.
+    """
+
+    filter_type = configuration['filter_type']
+
+    if filter_type in [Filter.CONST_FILTER_TYPE_SMA, Filter.CONST_FILTER_TYPE_BLPMA]:
+        # Moving average: FIR filter
+        #   Note: The Filter_Bank uses {num_of_data} for the SMA and {num_of_data_avg} for the BLPMA.
+        num_of_data_avg = configuration.get('num_of_data', 100) if filter_type == Filter.CONST_FILTER_TYPE_SMA else configuration.get('num_of_data_avg', 10)
+        b_avg = np.ones(num_of_data_avg) / num_of_data_avg
+
+        if filter_type == Filter.CONST_FILTER_TYPE_SMA:
+            return b_avg, np.array([1.0])
+
+    if filter_type in [Filter.CONST_FILTER_TYPE_BLP, Filter.CONST_FILTER_TYPE_BLPMA]:
+        b, a = scipy.signal.butter(configuration.get('order', 2), configuration.get('frq_c', 1.0) / (frq_s/2), btype='lowpass', analog=False)
+
+        if configuration.get('mode', Filter.CONST_BLP_MODE_WINDOW) == Filter.CONST_BLP_MODE_WINDOW:
+            # Window mode: FIR filter with the impulse response truncated to {num_of_data} samples
+            impulse = np.zeros(configuration.get('num_of_data', 100))
+            impulse[0] = 1.0
+            b, a = scipy.signal.lfilter(b, a, impulse), np.array([1.0])
+
+        if filter_type == Filter.CONST_FILTER_TYPE_BLPMA:
+            b = np.convolve(b_avg, b)
+
+        return b, a
+
+    if filter_type == Filter.CONST_FILTER_TYPE_ONE_EURO:
+        # At rest: First-order low-pass filter with the minimum cut-off frequency
+        alpha = 1.0 / (1.0 + frq_s / (2.0 * np.pi * configuration.get('min_cutoff', 1.0)))
+
+        return np.array([alpha]), np.array([1.0, -(1.0 - alpha)])
+
+    # Steady-state Kalman filter (constant velocity model)
+    t_s = 1.0 / frq_s
+    q = configuration.get('process_noise', 200.0)**2; r = configuration.get('measurement_noise', 0.3)**2
+    F = np.array([[1.0, t_s], [0.0, 1.0]]); H = np.array([[1.0, 0.0]])
+    Q = q * np.array([[t_s**4/4.0, t_s**3/2.0], [t_s**3/2.0, t_s**2]])
+    #   Solution of the discrete algebraic Riccati equation (prediction covariance)
+    P = scipy.linalg.solve_discrete_are(F.T, H.T, Q, np.array([[r]]))
+    K = P @ H.T / (H @ P @ H.T + r)[0, 0]
+    #   x{k} = A * x{k-1} + K * z{k}, y{k} = H * x{k}
+    A = (np.eye(2) - K @ H) @ F
+    b, a = scipy.signal.ss2tf(A, K, H @ A, H @ K)
+
+    return b[0], a
+
+def Analytic(configuration, frq_s):
+    """
+    Description:
+        Function to calculate the group delay, settling time and noise attenuation from the transfer function.
+
+    Args:
+        (1) configuration [Dictionary]: Filter configuration (Filter_Bank arguments).
+        (2) frq_s [Float]: Sample frequency in Hz.
+
+    Returns:
+        (1) parameter [Float Vector]: Delay (ms), Settling time (ms), Attenuation (dB).
+    """
+
+    b, a = Transfer_Function(configuration, frq_s)
+
+    # Group delay at the frequency of the hand motion
+    _, delay = scipy.signal.group_delay((b, a), w=[CONST_ANALYSIS_FRQ_MOTION], fs=frq_s)
+
+    # Step response
+    step = scipy.signal.lfilter(b, a, np.ones(CONST_ANALYSIS_NUM_OF_SAMPLES))
+
+    # Mean power gain in the noise band
+    _, h = scipy.signal.freqz(b, a, worN=np.linspace(CONST_ANALYSIS_NOISE_BAND[0], CONST_ANALYSIS_NOISE_BAND[1], 256), fs=frq_s)
+
+    return [delay[0] / frq_s * 1000.0, Settling_Time(step, frq_s), 10.0 * np.log10(np.mean(np.abs(h)**2))]
+
+def Settling_Time(step, frq_s):
+    """
+    Description:
+        Function to calculate the settling time of the step response.
+
+    Args:
+        (1) step [Float Vector]: Step response.
+        (2) frq_s [Float]: Sample frequency in Hz.
+
+    Returns:
+        (1) parameter [Float]: Settling time (ms).
+    """
+
+    error = np.abs(step - step[-1]) > CONST_ANALYSIS_SETTLING_BAND * np.abs(step[-1])
+
+    return (np.flatnonzero(error)[-1] + 1 if error.any() else 0) / frq_s * 1000.0
+
+def Empirical(configuration, frq_s):
+    """
+    Description:
+        Function to calculate the delay, settling time and noise attenuation by driving the streaming filter
+        (Filter_Bank) with synthetic signals.
+
+    Args:
+        (1) configuration [Dictionary]: Filter configuration (Filter_Bank arguments).
+        (2) frq_s [Float]: Sample frequency in Hz.
+
+    Returns:
+        (1) parameter [Float Vector]: Delay (ms), Settling time (ms), Attenuation (dB).
+    """
+
+    def Run(data):
+        # Single-channel filter without limits
+        arguments = {key: value for key, value in configuration.items() if key != 'name'}
+        FILTER = Filter.Filter_Bank(limit = [[-np.inf, np.inf]], frq_s = frq_s, **arguments)
+
+        return np.array([FILTER.Compute([value])[0] for value in data])
+
+    t = np.arange(CONST_ANALYSIS_NUM_OF_SAMPLES) / frq_s
+
+    # Delay: Phase of the output for a sine wave input (the first half is the transient)
+    w = 2.0 * np.pi * CONST_ANALYSIS_FRQ_MOTION
+    y = Run(10.0 * np.sin(w * t))
+    i = CONST_ANALYSIS_NUM_OF_SAMPLES // 2
+    (c_sin, c_cos, _), *_ = np.linalg.lstsq(np.column_stack((np.sin(w * t[i:]), np.cos(w * t[i:]), np.ones(t[i:].shape))), y[i:], rcond=None)
+    delay = -np.arctan2(c_cos, c_sin) / w * 1000.0
+
+    # Settling: Step input
+    settling = Settling_Time(Run(np.concatenate(([0.0], np.ones(CONST_ANALYSIS_NUM_OF_SAMPLES - 1))))[1:], frq_s)
+
+    # Attenuation: White noise input
+    noise = np.random.default_rng(0).normal(0.0, 0.3, CONST_ANALYSIS_NUM_OF_SAMPLES)
+    f, p_in = scipy.signal.welch(noise, fs=frq_s, nperseg=256)
+    _, p_out = scipy.signal.welch(Run(noise), fs=frq_s, nperseg=256)
+    band = (f >= CONST_ANALYSIS_NOISE_BAND[0]) & (f <= CONST_ANALYSIS_NOISE_BAND[1])
+
+    return [delay, settling, 10.0 * np.log10(np.sum(p_out[band]) / np.sum(p_in[band]))]
+
+def main():
+    header = ['Configuration', 'Delay A (ms)', 'Delay E (ms)', 'Settling A (ms)', 'Settling E (ms)', 'Attenuation A (dB)', 'Attenuation E (dB)', 'Budget']
+
+    table = []
+    for configuration in CONST_ANALYSIS_CONFIGURATIONS:
+        analytic  = Analytic(configuration, CONST_ANALYSIS_FRQ_S)
+        empirical = Empirical(configuration, CONST_ANALYSIS_FRQ_S)
+
+        # The configuration meets the latency budget if both delays are within the budget.
+        budget = 'OK' if np.maximum(analytic[0], empirical[0]) <= CONST_ANALYSIS_LATENCY_BUDGET else '-'
+        table.append([configuration['name'], analytic[0], empirical[0], analytic[1], empirical[1], analytic[2], empirical[2], budget])
+
+    # Writing data to the console (Lag-vs-noise table)
+    print(f'[INFO] Motion: {CONST_ANALYSIS_FRQ_MOTION} Hz, Noise band: {CONST_ANALYSIS_NOISE_BAND} Hz, Latency budget: {CONST_ANALYSIS_LATENCY_BUDGET} ms')
+    print(f'{header[0]:40s}' + ''.join(f'{h:>20s}' for h in header[1:]))
+    for row in table:
+        print(f'{row[0]:40s}' + ''.join(f'{v:20.2f}' for v in row[1:-1]) + f'{row[-1]:>20s}')
+
+    directory_name = os.path.join(os.getcwd(), 'Evaluation', 'Benchmark_Results')
+    os.makedirs(directory_name, exist_ok=True)
+    with open(os.path.join(directory_name, CONST_ANALYSIS_FILE_NAME + '.csv'), 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(table)
+
+    print('[INFO] The data has been successfully saved.')
+
+if __name__ == '__main__':
+    sys.exit(main())
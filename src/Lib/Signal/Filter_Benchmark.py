@@ -0,0 +1,192 @@
+"""
+## =========================================================================== ##
+MIT License
+Copyright (c) 2021 Roman Parak
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+## =========================================================================== ##
+Author   : Roman Parak
+Email    : Roman.Parak@outlook.com
+Github   : https://github.com/rparak
+File Name: Filter_Benchmark.py
+## =========================================================================== ##
+"""
+
+# System (Default)
+import sys
+# Time (Time access and conversions)
+import time
+# OS (Operating system interfaces)
+import os
+# Platform (Access to underlying platform's identifying data)
+import platform
+# JSON (JSON encoder and decoder)
+import json
+# Itertools (Functions creating iterators for efficient looping)
+import itertools
+# Numpy (Array computing) [pip3 install numpy]
+import numpy as np
+# Scipy (Mathematics, science, etc.) [pip install scipy]
+import scipy
+# Lib.Signal.Filter (Filters: SMA, BLP, BLPMA)
+import Lib.Signal.Filter as Filter
+# Lib.Parameters (Main Control Parameters)
+import Lib.Parameters as Parameters
+
+"""
+Description:
+    Micro-benchmark of the streaming filters (SMA, BLP, BLPMA). No sensor or robot is needed, the input
+    is a synthetic random walk.
+
+    For each configuration, the per-tick latency (one tick = one value for each channel) is measured and
+    the mean, p50, p99 and max latency (in microseconds) and the throughput (samples per second) are reported.
+    The channels are filtered either by a list of single-channel objects (IMPL: Objects) or by one
+    Filter_Bank (IMPL: Bank).
+
+    Run (from the ../src/ folder):
+        $ python -m Lib.Signal.Filter_Benchmark
+
+    The results are saved to the ../src/Evaluation/Benchmark_Results/ folder (.json) and can be compared between runs.
+"""
+
+# Initialization of Constants:
+#   Sweep parameters
+CONST_BENCHMARK_NUM_OF_DATA     = [25, 100, 400]
+CONST_BENCHMARK_ORDER           = [2, 3]
+CONST_BENCHMARK_NUM_OF_CHANNELS = [1, 3, 5]
+#   Number of ticks per configuration (Warm-up, Measurement)
+CONST_BENCHMARK_NUM_OF_WARM_UP = 100
+CONST_BENCHMARK_NUM_OF_TICKS   = 1000
+#   Filter parameters
+CONST_BENCHMARK_LIMIT = [-25.0, 25.0]
+CONST_BENCHMARK_FRQ_S = 1/Parameters.CONST_TIME_STEP
+CONST_BENCHMARK_FRQ_C = 1.95
+CONST_BENCHMARK_NUM_OF_DATA_AVG = 20
+#   Output file name
+CONST_BENCHMARK_FILE_NAME = 'Filter_Benchmark'
+
+def Create_Filters(filter_type, mode, num_of_data, order, num_of_channels, bank):
+    """
+    Description:
+        Function to create the filters for a single configuration.
+
+    Args:
+        (1) filter_type [INT]: Type of the filter (Filter.CONST_FILTER_TYPE_{SMA, BLP, BLPMA}).
+        (2) mode [INT]: Filter mode (Filter.CONST_BLP_MODE_{WINDOW, STREAM}).
+        (3) num_of_data [INT]: Number of total periods.
+        (4) order [INT]: Order of the butterworth filter.
+        (5) num_of_channels [INT]: Number of channels.
+        (6) bank [Bool]: Filter_Bank (True) or a list of single-channel objects (False).
+
+    Returns:
+        (1) parameter [Function]: Function to filter one tick (a vector of values).
+    """
+
+    if bank == True:
+        BANK = Filter.Filter_Bank(filter_type, [CONST_BENCHMARK_LIMIT] * num_of_channels, num_of_data, CONST_BENCHMARK_NUM_OF_DATA_AVG,
+                                  CONST_BENCHMARK_FRQ_S, CONST_BENCHMARK_FRQ_C, order, mode)
+        return BANK.Compute
+
+    if filter_type == Filter.CONST_FILTER_TYPE_SMA:
+        FILTERS = [Filter.Simple_Moving_Average(CONST_BENCHMARK_LIMIT, num_of_data) for _ in range(num_of_channels)]
+    elif filter_type == Filter.CONST_FILTER_TYPE_BLP:
+        FILTERS = [Filter.Butterworth_Low_Pass(CONST_BENCHMARK_LIMIT, num_of_data, CONST_BENCHMARK_FRQ_S, CONST_BENCHMARK_FRQ_C, order, mode)
+                   for _ in range(num_of_channels)]
+    else:
+        FILTERS = [Filter.Butterworth_Low_Pass_Moving_Average(CONST_BENCHMARK_LIMIT, num_of_data, CONST_BENCHMARK_NUM_OF_DATA_AVG, CONST_BENCHMARK_FRQ_S,
+                                                              CONST_BENCHMARK_FRQ_C, order, mode)
+                   for _ in range(num_of_channels)]
+
+    return lambda value: [F.Compute(v) for F, v in zip(FILTERS, value)]
+
+def Measure(compute, data):
+    """
+    Description:
+        Function to measure the latency of each tick.
+
+    Args:
+        (1) compute [Function]: Function to filter one tick.
+        (2) data [Float Matrix]: Input data {number of ticks, number of channels}.
+
+    Returns:
+        (1) parameter [Dictionary]: Latency statistics (in microseconds) and throughput (samples per second).
+    """
+
+    for value in data[:CONST_BENCHMARK_NUM_OF_WARM_UP]:
+        compute(value)
+
+    data = data[CONST_BENCHMARK_NUM_OF_WARM_UP:]
+    latency = np.zeros(data.shape[0], dtype=np.int64)
+    for i, value in enumerate(data):
+        t_0 = time.perf_counter_ns()
+        compute(value)
+        latency[i] = time.perf_counter_ns() - t_0
+
+    latency_us = latency / 1000.0
+
+    return {'mean_us': float(np.mean(latency_us)), 'p50_us': float(np.percentile(latency_us, 50)),
+            'p99_us': float(np.percentile(latency_us, 99)), 'max_us': float(np.max(latency_us)),
+            'throughput_sps': float(data.size / (np.sum(latency) / 1e9))}
+
+def Configurations():
+    """
+    Description:
+        Function to generate all the configurations of the sweep.
+
+    Returns:
+        (1) parameter [Generator]: Configurations (Filter name, type, mode, number of data, order, number of channels, bank).
+    """
+
+    for num_of_data, num_of_channels, bank in itertools.product(CONST_BENCHMARK_NUM_OF_DATA, CONST_BENCHMARK_NUM_OF_CHANNELS, [False, True]):
+        # The order and the mode are not used by the SMA.
+        yield ('SMA', Filter.CONST_FILTER_TYPE_SMA, None, num_of_data, None, num_of_channels, bank)
+
+        for (name, filter_type), mode, order in itertools.product([('BLP', Filter.CONST_FILTER_TYPE_BLP), ('BLPMA', Filter.CONST_FILTER_TYPE_BLPMA)],
+                                                                  [Filter.CONST_BLP_MODE_WINDOW, Filter.CONST_BLP_MODE_STREAM], CONST_BENCHMARK_ORDER):
+            yield (name, filter_type, mode, num_of_data, order, num_of_channels, bank)
+
+def main():
+    # Synthetic input data (random walk) for the maximum number of channels
+    #   Note: Some of the values are out of the limits.
+    rng = np.random.default_rng(0)
+    data = np.cumsum(rng.normal(0.0, 0.5, (CONST_BENCHMARK_NUM_OF_WARM_UP + CONST_BENCHMARK_NUM_OF_TICKS, np.max(CONST_BENCHMARK_NUM_OF_CHANNELS))), axis=0)
+
+    results = []
+    for name, filter_type, mode, num_of_data, order, num_of_channels, bank in Configurations():
+        statistics = Measure(Create_Filters(filter_type, mode, num_of_data, order, num_of_channels, bank), data[:, 0:num_of_channels])
+
+        results.append({'filter': name, 'mode': {None: None, Filter.CONST_BLP_MODE_WINDOW: 'WINDOW', Filter.CONST_BLP_MODE_STREAM: 'STREAM'}[mode],
+                        'num_of_data': num_of_data, 'order': order, 'num_of_channels': num_of_channels,
+                        'implementation': 'Bank' if bank == True else 'Objects', **statistics})
+
+        print(f'[{name:5s}, MODE: {str(results[-1]["mode"]):6s}, N: {num_of_data:3d}, ORDER: {str(order):4s}, CH: {num_of_channels}, IMPL: {results[-1]["implementation"]:7s}] '
+              f'Mean: {statistics["mean_us"]:8.2f} us, p50: {statistics["p50_us"]:8.2f} us, p99: {statistics["p99_us"]:8.2f} us, Max: {statistics["max_us"]:9.2f} us, '
+              f'Throughput: {statistics["throughput_sps"]:12.1f} samples/s')
+
+    # Save the results (and information about the environment) to a file.
+    output = {'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'), 'platform': platform.platform(), 'python': platform.python_version(),
+              'numpy': np.__version__, 'scipy': scipy.__version__, 'num_of_ticks': CONST_BENCHMARK_NUM_OF_TICKS, 'results': results}
+
+    directory_name = os.path.join(os.getcwd(), 'Evaluation', 'Benchmark_Results')
+    os.makedirs(directory_name, exist_ok=True)
+    file_path = os.path.join(directory_name, CONST_BENCHMARK_FILE_NAME + '_' + time.strftime('%Y%m%d_%H%M%S') + '.json')
+    with open(file_path, 'w') as f:
+        json.dump(output, f, indent=2)
+
+    print(f'[INFO] The results have been successfully saved: {file_path}')
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,144 @@
+"""
+## =========================================================================== ##
+MIT License
+Copyright (c) 2021 Roman Parak
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+## =========================================================================== ##
+Author   : Roman Parak
+Email    : Roman.Parak@outlook.com
+Github   : https://github.com/rparak
+File Name: Interpolation.py
+## =========================================================================== ##
+"""
+
+# Numpy (Array computing) [pip3 install numpy]
+import numpy as np
+
+# Initialization of Constants:
+#   Setpoint mode:
+#       INTERPOLATE: Linear interpolation between the samples, the output is delayed by {delay} seconds.
+#       EXTRAPOLATE: Linear extrapolation from the last two samples (no delay), limited by {max_extrapolation} seconds.
+CONST_SETPOINT_MODE_INTERPOLATE = 0
+CONST_SETPOINT_MODE_EXTRAPOLATE = 1
+#   Number of the last samples kept for the interpolation
+CONST_SETPOINT_NUM_OF_DATA = 4
+
+class Setpoint_Interpolator(object):
+    """
+    Description:
+        A rate-conversion stage between the input samples (e.g. 250 Hz glove data) and a faster output loop
+        (e.g. 500 Hz servo loop). The input samples are added with their timestamps and a setpoint can be
+        requested at any time, so the output loop gets a new (smooth) value on every tick.
+
+        The extrapolation is limited: if no new sample arrives within {max_extrapolation} seconds after the last
+        sample, the setpoint is held at the extrapolated value for the limit.
+
+    Initialization of the Class:
+        Args:
+            (1) mode [INT]: Setpoint mode (CONST_SETPOINT_MODE_INTERPOLATE or CONST_SETPOINT_MODE_EXTRAPOLATE).
+            (2) max_extrapolation [Float]: Maximum extrapolation time in seconds.
+            (3) delay [Float]: Delay of the output in seconds (INTERPOLATE only, usually one input period).
+
+        Example:
+            Initialization:
+                Cls = Setpoint_Interpolator(mode = CONST_SETPOINT_MODE_EXTRAPOLATE, max_extrapolation = 0.008, delay = 0.004)
+
+            Calculation:
+                Cls.Add(t{0}, value{0})
+                ...
+                Cls.Add(t{n}, value{n})
+
+            Returns:
+                Cls.Get_Value(t)    # Setpoint at the time {t}, None if there is no sample
+    """
+
+    def __init__(self, mode = CONST_SETPOINT_MODE_EXTRAPOLATE, max_extrapolation = 0.008, delay = 0.004):
+        # << PRIVATE >> #
+        # Setpoint mode
+        self.__mode = mode
+        # Maximum extrapolation time
+        self.__max_extrapolation = max_extrapolation
+        # Delay of the output (Interpolation)
+        self.__delay = delay if mode == CONST_SETPOINT_MODE_INTERPOLATE else 0.0
+        # The last samples: timestamps and values (oldest first)
+        self.__timestamp = []
+        self.__value     = []
+
+    def Add(self, timestamp, value):
+        """
+        Description:
+            Function to add a new input sample.
+
+        Args:
+            (1) timestamp [Float]: Time of the sample in seconds (monotonic clock).
+            (2) value [Float Vector]: Value of the sample.
+        """
+
+        if self.__timestamp and timestamp <= self.__timestamp[-1]:
+            # A sample with the same (or older) timestamp replaces the last one.
+            self.__timestamp.pop(); self.__value.pop()
+
+        self.__timestamp.append(timestamp)
+        self.__value.append(np.asarray(value, dtype=np.float64))
+
+        if len(self.__timestamp) > CONST_SETPOINT_NUM_OF_DATA:
+            self.__timestamp.pop(0); self.__value.pop(0)
+
+    def Get_Value(self, timestamp):
+        """
+        Description:
+            Function to get the setpoint at the time {timestamp}.
+
+        Args:
+            (1) timestamp [Float]: Time in seconds (monotonic clock).
+
+        Returns:
+            (1) parameter [Float Vector]: Setpoint, or None if there is no sample.
+        """
+
+        if not self.__timestamp:
+            return None
+
+        # Time of the output
+        t = timestamp - self.__delay
+
+        if len(self.__timestamp) == 1 or t <= self.__timestamp[0]:
+            return self.__value[0]
+
+        if t <= self.__timestamp[-1]:
+            # Interpolation between two samples
+            i = 1
+            while self.__timestamp[i] < t:
+                i += 1
+
+            ratio = (t - self.__timestamp[i-1]) / (self.__timestamp[i] - self.__timestamp[i-1])
+
+            return self.__value[i-1] + ratio * (self.__value[i] - self.__value[i-1])
+
+        # Extrapolation from the last two samples (limited)
+        ratio = np.minimum(t - self.__timestamp[-1], self.__max_extrapolation) / (self.__timestamp[-1] - self.__timestamp[-2])
+
+        return self.__value[-1] + ratio * (self.__value[-1] - self.__value[-2])
+
+    def Clear(self):
+        """
+        Description:
+            Function to remove all samples.
+        """
+
+        self.__timestamp = []
+        self.__value     = []
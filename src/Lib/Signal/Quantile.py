@@ -0,0 +1,145 @@
+"""
+## =========================================================================== ##
+MIT License
+Copyright (c) 2021 Roman Parak
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+## =========================================================================== ##
+Author   : Roman Parak
+Email    : Roman.Parak@outlook.com
+Github   : https://github.com/rparak
+File Name: Quantile.py
+## =========================================================================== ##
+"""
+
+class P2_Quantile(object):
+    """
+    Description:
+        A streaming estimator of the quantile {p} (the P-Square algorithm, R. Jain and I. Chlamtac, 1985). The estimator 
+        keeps only five markers (heights and positions), so the memory and the cost per value are constant however many 
+        values are added. The heights of the markers are adjusted by a piecewise-parabolic (or linear) formula.
+
+        Note:
+            The result is exact for the first five values.
+
+    Initialization of the Class:
+        Args:
+            (1) p [Float]: Quantile (0.0 - 1.0), e.g. 0.5: median.
+
+        Example:
+            Initialization:
+                Cls = P2_Quantile(0.98)
+
+            Calculation:
+                Cls.Add(x{0})
+                ...
+                Cls.Add(x{n})
+
+            Returns:
+                Cls.Get_Value()     # Estimate of the quantile, None if there is no value
+    """
+
+    def __init__(self, p):
+        # << PRIVATE >> #
+        # Quantile
+        self.__p = p
+        # Increments of the desired positions of the markers
+        self.__dn = [0.0, p/2.0, p, (1.0 + p)/2.0, 1.0]
+        self.Clear()
+
+    def Clear(self):
+        """
+        Description:
+            Function to remove all values from the estimator.
+        """
+
+        # Heights, positions and desired positions of the markers
+        self.__q  = []
+        self.__n  = [1, 2, 3, 4, 5]
+        self.__nd = [1.0, 1.0 + 2.0*self.__p, 1.0 + 4.0*self.__p, 3.0 + 2.0*self.__p, 5.0]
+        # Number of values
+        self.__count = 0
+
+    def __len__(self):
+        return self.__count
+
+    def Add(self, x):
+        """
+        Description:
+            Function to add a new value.
+
+        Args:
+            (1) x [Float]: Input value.
+        """
+
+        self.__count += 1
+        q = self.__q; n = self.__n
+
+        if self.__count <= 5:
+            # The first five values are the initial heights of the markers (sorted).
+            q.append(float(x)); q.sort()
+            return
+
+        # Cell of the value (and the update of the extreme markers)
+        if x < q[0]:
+            q[0] = float(x); k = 0
+        elif x >= q[4]:
+            q[4] = float(x); k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+
+        # Positions of the markers
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self.__nd[i] += self.__dn[i]
+
+        # Adjustment of the heights of the middle markers
+        for i in range(1, 4):
+            d = self.__nd[i] - n[i]
+            if (d >= 1.0 and n[i+1] - n[i] > 1) or (d <= -1.0 and n[i-1] - n[i] < -1):
+                d = 1 if d > 0.0 else -1
+
+                # Piecewise-parabolic prediction
+                q_i = q[i] + d / (n[i+1] - n[i-1]) * ((n[i] - n[i-1] + d) * (q[i+1] - q[i]) / (n[i+1] - n[i]) 
+                                                    + (n[i+1] - n[i] - d) * (q[i] - q[i-1]) / (n[i] - n[i-1]))
+                if not q[i-1] < q_i < q[i+1]:
+                    # Linear prediction
+                    q_i = q[i] + d * (q[i+d] - q[i]) / (n[i+d] - n[i])
+
+                q[i] = q_i; n[i] += d
+
+    def Get_Value(self):
+        """
+        Description:
+            Function to get the estimate of the quantile.
+
+        Returns:
+            (1) parameter [Float]: Estimate of the quantile, None if there is no value.
+        """
+
+        if self.__count == 0:
+            return None
+
+        if self.__count <= 5:
+            # Exact quantile of the first values (linear interpolation)
+            position = self.__p * (len(self.__q) - 1)
+            i = int(position)
+            return self.__q[i] if i + 1 >= len(self.__q) else self.__q[i] + (position - i) * (self.__q[i+1] - self.__q[i])
+
+        return self.__q[2]
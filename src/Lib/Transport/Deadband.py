@@ -0,0 +1,128 @@
+"""
+## =========================================================================== ##
+MIT License
+Copyright (c) 2021 Roman Parak
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+## =========================================================================== ##
+Author   : Roman Parak
+Email    : Roman.Parak@outlook.com
+Github   : https://github.com/rparak
+File Name: Deadband.py
+## =========================================================================== ##
+"""
+
+# Initialization of Constants:
+#   Publish policy:
+#       ALWAYS  : The message is sent on every tick of the publisher.
+#       DEADBAND: The message is sent only if a value changes by more than the deadband (or a state changes), 
+#                 and at least every {heartbeat} seconds, so the subscriber can tell a still hand from a dead publisher.
+CONST_PUBLISH_POLICY_ALWAYS   = 0
+CONST_PUBLISH_POLICY_DEADBAND = 1
+
+class Deadband(object):
+    """
+    Description:
+        Decision of the publisher whether to send the message of a glove (publish policy) and the accounting 
+        of the sent and suppressed messages.
+
+        The values are compared with the last sent values (not with the previous tick), so a slow drift 
+        is sent as soon as it exceeds the deadband.
+
+    Initialization of the Class:
+        Args:
+            (1) policy [INT]: Publish policy (CONST_PUBLISH_POLICY_ALWAYS or CONST_PUBLISH_POLICY_DEADBAND).
+            (2) deadband [Float Vector]: Deadband of the position and of the fingers bend.
+            (3) heartbeat [Float]: Maximum time between two messages in seconds.
+
+        Example:
+            Initialization:
+                Cls = Deadband(CONST_PUBLISH_POLICY_DEADBAND, [0.05, 1.0], 0.04)
+
+            Calculation:
+                if Cls.Is_Required(timestamp, position, fingers_bend, states) == True:
+                    ... (send the message)
+
+            Returns:
+                Cls.Get_Num_Of_Sent()
+                Cls.Get_Num_Of_Suppressed()
+    """
+
+    def __init__(self, policy = CONST_PUBLISH_POLICY_DEADBAND, deadband = [0.05, 1.0], heartbeat = 0.04):
+        # << PRIVATE >> #
+        self.__policy    = policy
+        self.__deadband  = deadband
+        self.__heartbeat = heartbeat
+        # The last sent values (None: nothing has been sent)
+        self.__timestamp    = None
+        self.__position     = None
+        self.__fingers_bend = None
+        self.__states       = None
+        # Number of the messages: Sent, Suppressed
+        self.__num_of_sent       = 0
+        self.__num_of_suppressed = 0
+
+    def Is_Required(self, timestamp, position, fingers_bend, states):
+        """
+        Description:
+            Function to decide whether the message has to be sent. If so, the values are stored as the last sent values.
+
+        Args:
+            (1) timestamp [Float]: Time in seconds.
+            (2) position [Float Vector]: Position {X, Y, Z}.
+            (3) fingers_bend [Float Vector]: Fingers bend {T, I, M, R, L}.
+            (4) states [Bool Vector]: States (e.g. gripper, movement, quit, valid), any change is sent.
+
+        Returns:
+            (1) parameter [Bool]: The message has to be sent.
+        """
+
+        if (self.__policy == CONST_PUBLISH_POLICY_DEADBAND and self.__timestamp is not None and 
+            timestamp - self.__timestamp < self.__heartbeat and states == self.__states and 
+            all(abs(v - v_last) <= self.__deadband[0] for v, v_last in zip(position, self.__position)) and 
+            all(abs(v - v_last) <= self.__deadband[1] for v, v_last in zip(fingers_bend, self.__fingers_bend))):
+            self.__num_of_suppressed += 1
+            return False
+
+        self.__timestamp    = timestamp
+        self.__position     = tuple(position)
+        self.__fingers_bend = tuple(fingers_bend)
+        self.__states       = states
+        self.__num_of_sent += 1
+
+        return True
+
+    def Get_Num_Of_Sent(self):
+        """
+        Description:
+            Function to get the number of sent messages.
+
+        Returns:
+            (1) parameter [INT]: Number of the messages.
+        """
+
+        return self.__num_of_sent
+
+    def Get_Num_Of_Suppressed(self):
+        """
+        Description:
+            Function to get the number of suppressed messages (DEADBAND policy).
+
+        Returns:
+            (1) parameter [INT]: Number of the messages.
+        """
+
+        return self.__num_of_suppressed
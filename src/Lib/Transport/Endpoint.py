@@ -0,0 +1,118 @@
+"""
+## =========================================================================== ##
+MIT License
+Copyright (c) 2021 Roman Parak
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+## =========================================================================== ##
+Author   : Roman Parak
+Email    : Roman.Parak@outlook.com
+Github   : https://github.com/rparak
+File Name: Endpoint.py
+## =========================================================================== ##
+"""
+
+# ZeroMQ (Universal messaging library) [pip install zmq]
+import zmq
+
+"""
+Description:
+    Endpoints of the glove messages (ZeroMQ), see Parameters.CONST_PUBLISHER_ENDPOINTS / CONST_SUBSCRIBER_ENDPOINT:
+        tcp://    : Network (or the loopback on a single machine), e.g. bind: 'tcp://*:2224', connect: 'tcp://127.0.0.1:2224'.
+        ipc://    : Local socket of the OS (a single machine, Linux / macOS), e.g. 'ipc:///tmp/p5_glove'.
+        inproc:// : Between the threads of one process (the same zmq.Context), e.g. 'inproc://p5_glove'.
+        pgm://, epgm:// : Multicast for many subscribers (ZeroMQ built with OpenPGM), e.g. 'epgm://eth0;239.192.1.1:2224'.
+
+    The publisher can bind more endpoints at once (e.g. 'tcp://*:2224' and 'ipc:///tmp/p5_glove'), so each subscriber 
+    can use the transport that suits it.
+"""
+
+# Initialization of Constants:
+#   Transports and the capability of the ZeroMQ library required by them (None: always available)
+CONST_ENDPOINT_TRANSPORTS = {'tcp': None, 'ipc': 'ipc', 'inproc': None, 'pgm': 'pgm', 'epgm': 'pgm'}
+#   Multicast (pgm, epgm): Maximum rate in kbit/s (the default of ZeroMQ is 100 kbit/s)
+CONST_ENDPOINT_MULTICAST_RATE = 10000
+
+def Is_Supported(endpoint):
+    """
+    Description:
+        Function to check whether the transport of the endpoint is supported by the ZeroMQ library.
+
+    Args:
+        (1) endpoint [String]: Endpoint, e.g. 'tcp://127.0.0.1:2224'.
+
+    Returns:
+        (1) parameter [Bool]: The transport is supported.
+    """
+
+    transport, separator, _ = endpoint.partition('://')
+
+    if separator == '' or transport not in CONST_ENDPOINT_TRANSPORTS:
+        return False
+
+    return CONST_ENDPOINT_TRANSPORTS[transport] is None or zmq.has(CONST_ENDPOINT_TRANSPORTS[transport])
+
+def _Attach(socket, endpoints, bind):
+    for endpoint in endpoints:
+        if Is_Supported(endpoint) == False:
+            print(f'[ERROR] The transport of the endpoint is not supported: {endpoint} (ZeroMQ {zmq.zmq_version()}).')
+            return False
+
+        if endpoint.startswith(('pgm://', 'epgm://')):
+            socket.setsockopt(zmq.RATE, CONST_ENDPOINT_MULTICAST_RATE)
+
+        try:
+            if bind == True:
+                socket.bind(endpoint)
+            else:
+                socket.connect(endpoint)
+        except zmq.ZMQError as error:
+            print(f'[ERROR] The endpoint {endpoint} could not be used: {error}')
+            return False
+
+        print(f'[INFO] {"Bind" if bind == True else "Connect"}: {endpoint}')
+
+    return True
+
+def Bind(socket, endpoints):
+    """
+    Description:
+        Function to bind the socket (publisher) to one or more endpoints.
+
+    Args:
+        (1) socket [zmq.Socket]: Socket.
+        (2) endpoints [String or String Vector]: Endpoint(s).
+
+    Returns:
+        (1) parameter [Bool]: The socket has been successfully bound to all endpoints.
+    """
+
+    return _Attach(socket, [endpoints] if isinstance(endpoints, str) else endpoints, True)
+
+def Connect(socket, endpoints):
+    """
+    Description:
+        Function to connect the socket (subscriber) to one or more endpoints.
+
+    Args:
+        (1) socket [zmq.Socket]: Socket.
+        (2) endpoints [String or String Vector]: Endpoint(s).
+
+    Returns:
+        (1) parameter [Bool]: The socket has been successfully connected to all endpoints.
+    """
+
+    return _Attach(socket, [endpoints] if isinstance(endpoints, str) else endpoints, False)
@@ -0,0 +1,160 @@
+"""
+## =========================================================================== ##
+MIT License
+Copyright (c) 2021 Roman Parak
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+## =========================================================================== ##
+Author   : Roman Parak
+Email    : Roman.Parak@outlook.com
+Github   : https://github.com/rparak
+File Name: Message.py
+## =========================================================================== ##
+"""
+
+# Struct (Interpret bytes as packed binary data)
+import struct
+# Collections (Container datatypes)
+import collections
+# Numpy (Array computing) [pip3 install numpy]
+import numpy as np
+
+"""
+Description:
+    Wire format of the glove messages (pub_p5_glove_stream.py -> subscribers). One message is one ZeroMQ frame 
+    of a fixed size (CONST_MESSAGE_SIZE, little-endian, no padding), the topic of the glove is sent in the frame before.
+
+        Offset  Size  Type       Field
+        0       2     char[2]    magic: b'P5'
+        2       1     uint8      version: CONST_MESSAGE_VERSION
+        3       1     uint8      flags: CONST_MESSAGE_FLAG_{GRIPPER, MOVEMENT, QUIT, VALID}
+        4       2     uint16     glove: Identification number of the glove
+        6       2     uint16     reserved (0)
+        8       4     uint32     sequence: Sequence number of the message (each glove)
+        12      4     uint32     sample_sequence: Sequence number of the glove sample (acquisition, Essential_Reality.P5_Sample)
+        16      8     float64    timestamp: Time of the glove sample in seconds (acquisition, time.perf_counter() of the publisher)
+        24      24    float64[3] position: Desired position {X, Y, Z}
+        48      20    float32[5] fingers_bend: Fingers bend {T, I, M, R, L}
+
+    Versions:
+        1: The first version (without the sample_sequence, 64 bytes).
+        2: The sequence number of the glove sample (sample_sequence) for the end-to-end latency tracing (68 bytes).
+
+    A new version of the format must change CONST_MESSAGE_VERSION, the message with the other version (or size) is rejected.
+"""
+
+# Initialization of Constants:
+#   Magic and version of the format
+CONST_MESSAGE_MAGIC   = b'P5'
+CONST_MESSAGE_VERSION = 2
+#   Flags
+CONST_MESSAGE_FLAG_GRIPPER  = 0x01
+CONST_MESSAGE_FLAG_MOVEMENT = 0x02
+CONST_MESSAGE_FLAG_QUIT     = 0x04
+CONST_MESSAGE_FLAG_VALID    = 0x08
+#   Layout of the message: struct and NumPy dtype (the same layout)
+CONST_MESSAGE_STRUCT = struct.Struct('<2sBBHHIId3d5f')
+CONST_MESSAGE_DTYPE  = np.dtype([('magic', 'S2'), ('version', 'u1'), ('flags', 'u1'), ('glove', '<u2'), ('reserved', '<u2'), 
+                                 ('sequence', '<u4'), ('sample_sequence', '<u4'), ('timestamp', '<f8'), ('position', '<f8', (3,)), ('fingers_bend', '<f4', (5,))])
+CONST_MESSAGE_SIZE   = CONST_MESSAGE_STRUCT.size
+
+"""
+Description:
+    Decoded glove message.
+
+        glove [INT]: Identification number of the glove.
+        sequence [INT]: Sequence number of the message.
+        sample_sequence [INT]: Sequence number of the glove sample.
+        timestamp [Float]: Time of the glove sample in seconds (publisher).
+        position [Float Tuple]: Desired position {X, Y, Z}.
+        fingers_bend [Float Tuple]: Fingers bend {T, I, M, R, L}.
+        gripper [Bool]: Gripper State.
+        movement [Bool]: Movement State.
+        quit [Bool]: Quit State.
+        valid [Bool]: Valid State (False: the IR tracking of the position is lost).
+        received [Float]: Time of the glove sample on the clock of the subscriber in seconds (Subscriber.Glove_Subscriber), 
+                          0.0 if the message is not received by the subscriber (not part of the wire format).
+"""
+Glove_Message = collections.namedtuple('Glove_Message', ['glove', 'sequence', 'sample_sequence', 'timestamp', 'position', 'fingers_bend', 
+                                                         'gripper', 'movement', 'quit', 'valid', 'received'])
+
+#   Message before the first received message
+CONST_MESSAGE_EMPTY = Glove_Message(0, 0, 0, 0.0, (0.0, 0.0, 0.0), (0.0,) * 5, False, False, False, False, 0.0)
+
+def Encode(glove, sequence, sample_sequence, timestamp, position, fingers_bend, gripper, movement, quit, valid):
+    """
+    Description:
+        Function to encode the glove message.
+
+    Args:
+        (1) glove [INT]: Identification number of the glove.
+        (2) sequence [INT]: Sequence number of the message.
+        (3) sample_sequence [INT]: Sequence number of the glove sample.
+        (4) timestamp [Float]: Time of the glove sample in seconds.
+        (5) position [Float Vector]: Desired position {X, Y, Z}.
+        (6) fingers_bend [Float Vector]: Fingers bend {T, I, M, R, L}.
+        (7 - 10) gripper, movement, quit, valid [Bool]: States.
+
+    Returns:
+        (1) parameter [Bytes]: Message (CONST_MESSAGE_SIZE bytes).
+    """
+
+    flags = ((CONST_MESSAGE_FLAG_GRIPPER if gripper else 0) | (CONST_MESSAGE_FLAG_MOVEMENT if movement else 0) | 
+             (CONST_MESSAGE_FLAG_QUIT if quit else 0) | (CONST_MESSAGE_FLAG_VALID if valid else 0))
+
+    return CONST_MESSAGE_STRUCT.pack(CONST_MESSAGE_MAGIC, CONST_MESSAGE_VERSION, flags, glove, 0, sequence & 0xFFFFFFFF, sample_sequence & 0xFFFFFFFF, timestamp, 
+                                     *position, *fingers_bend)
+
+def Decode(buffer):
+    """
+    Description:
+        Function to decode the glove message. The values are read directly from the buffer (e.g. the buffer 
+        of the ZeroMQ frame: socket.recv(copy = False).buffer), the buffer is not copied.
+
+    Args:
+        (1) buffer [Bytes-like Object]: Message.
+
+    Returns:
+        (1) parameter [Glove_Message]: Decoded message, None if the message is not valid (size, magic or version).
+    """
+
+    if len(buffer) != CONST_MESSAGE_SIZE:
+        return None
+
+    # Values: magic, version, flags, glove, reserved, sequence, sample sequence, timestamp, position {3}, fingers bend {5}
+    value = CONST_MESSAGE_STRUCT.unpack_from(buffer)
+
+    if value[0] != CONST_MESSAGE_MAGIC or value[1] != CONST_MESSAGE_VERSION:
+        return None
+
+    flags = value[2]
+
+    return Glove_Message(value[3], value[5], value[6], value[7], value[8:11], value[11:16], (flags & CONST_MESSAGE_FLAG_GRIPPER) != 0, 
+                         (flags & CONST_MESSAGE_FLAG_MOVEMENT) != 0, (flags & CONST_MESSAGE_FLAG_QUIT) != 0, (flags & CONST_MESSAGE_FLAG_VALID) != 0, 0.0)
+
+def View(buffer):
+    """
+    Description:
+        Function to get a NumPy view of one or more messages (e.g. a recording of the messages) without copying.
+
+    Args:
+        (1) buffer [Bytes-like Object]: Messages (a multiple of CONST_MESSAGE_SIZE bytes).
+
+    Returns:
+        (1) parameter [Structured Array]: View of the messages (CONST_MESSAGE_DTYPE).
+    """
+
+    return np.frombuffer(buffer, dtype=CONST_MESSAGE_DTYPE)
@@ -0,0 +1,211 @@
+"""
+## =========================================================================== ##
+MIT License
+Copyright (c) 2021 Roman Parak
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+## =========================================================================== ##
+Author   : Roman Parak
+Email    : Roman.Parak@outlook.com
+Github   : https://github.com/rparak
+File Name: Message_Benchmark.py
+## =========================================================================== ##
+"""
+
+# System (Default)
+import sys
+# Time (Time access and conversions)
+import time
+# OS (Operating system interfaces)
+import os
+# Platform (Access to underlying platform's identifying data)
+import platform
+# JSON (JSON encoder and decoder)
+import json
+# Pickle (Python object serialization)
+import pickle
+# Numpy (Array computing) [pip3 install numpy]
+import numpy as np
+# ZeroMQ (Universal messaging library) [pip install zmq]
+import zmq
+# Lib.Transport.Message (Wire format of the glove messages)
+import Lib.Transport.Message as Message
+
+"""
+Description:
+    Micro-benchmark of the glove messages: the previous pickle path (send_pyobj / recv_pyobj of a Python list) 
+    and the fixed-size binary message (Message.Encode / Message.Decode).
+
+    Both formats carry the same values (the pickle path as a flat Python list, as sent by send_pyobj).
+
+    Measured paths (one tick = one message):
+        Codec: Encode + decode only (no socket).
+        Socket: Topic + message sent through a pair of ZeroMQ sockets (inproc) and received in the same thread:
+            Pickle         : send_pyobj / recv_pyobj.
+            Binary (copy)  : send / recv (bytes) + Message.Decode.
+            Binary (frame) : send / recv(copy = False) + Message.Decode of the frame buffer (zero-copy).
+
+    For each path, the per-tick latency (mean, p50, p99, max in microseconds) and the size of the message are reported.
+
+    Note:
+        For a message of this size, the zero-copy frame (a zmq.Frame object per message) is slower than the copy
+        of the message, so the subscribers use the Binary (copy) path.
+
+    Run (from the ../src/ folder):
+        $ python -m Lib.Transport.Message_Benchmark
+
+    The results are saved to the ../src/Evaluation/Benchmark_Results/ folder (.json).
+"""
+
+# Initialization of Constants:
+#   Number of ticks (Warm-up, Measurement)
+CONST_BENCHMARK_NUM_OF_WARM_UP = 1000
+CONST_BENCHMARK_NUM_OF_TICKS   = 50000
+#   Topic of the messages
+CONST_BENCHMARK_TOPIC = 'P5_GLOVE_00'
+#   Content of the message (the same values in both formats): 
+#       Glove, Sequence, Sample Sequence, Timestamp, Position {X, Y, Z}, Fingers Bend {T, I, M, R, L}, Gripper, Movement, Quit, Valid
+CONST_BENCHMARK_MESSAGE = [0, 1, 1, 1.0, [1.0, 2.0, 3.0], [10.0, 20.0, 30.0, 40.0, 50.0], False, True, False, True]
+CONST_BENCHMARK_MESSAGE_PICKLE = [0, 1, 1, 1.0, 1.0, 2.0, 3.0, 10.0, 20.0, 30.0, 40.0, 50.0, False, True, False, True]
+#   Output file name
+CONST_BENCHMARK_FILE_NAME = 'Message_Benchmark'
+
+def Create_Codec(binary):
+    """
+    Description:
+        Function to create the encode + decode tick (no socket).
+
+    Args:
+        (1) binary [Bool]: Binary message (True) or pickle (False).
+
+    Returns:
+        (1) parameter [Function]: Function of one tick.
+        (2) parameter [INT]: Size of the message in bytes.
+    """
+
+    if binary == True:
+        def Tick():
+            Message.Decode(Message.Encode(*CONST_BENCHMARK_MESSAGE))
+
+        return Tick, Message.CONST_MESSAGE_SIZE
+
+    def Tick():
+        pickle.loads(pickle.dumps(CONST_BENCHMARK_MESSAGE_PICKLE, pickle.DEFAULT_PROTOCOL))
+
+    return Tick, len(pickle.dumps(CONST_BENCHMARK_MESSAGE_PICKLE, pickle.DEFAULT_PROTOCOL))
+
+def Create_Socket(context, path):
+    """
+    Description:
+        Function to create the socket tick (send + receive through the inproc pair).
+
+    Args:
+        (1) context [zmq.Context]: ZeroMQ context.
+        (2) path [String]: 'Pickle', 'Binary (copy)' or 'Binary (frame)'.
+
+    Returns:
+        (1) parameter [Function]: Function of one tick.
+        (2) parameter [List]: Sockets (to close them).
+    """
+
+    address = f'inproc://message_benchmark_{id(path)}'
+    socket_tx = context.socket(zmq.PAIR); socket_tx.bind(address)
+    socket_rx = context.socket(zmq.PAIR); socket_rx.connect(address)
+
+    if path == 'Pickle':
+        def Tick():
+            socket_tx.send_string(CONST_BENCHMARK_TOPIC, zmq.SNDMORE)
+            socket_tx.send_pyobj(CONST_BENCHMARK_MESSAGE_PICKLE)
+            socket_rx.recv_string()
+            socket_rx.recv_pyobj()
+    elif path == 'Binary (copy)':
+        def Tick():
+            socket_tx.send_string(CONST_BENCHMARK_TOPIC, zmq.SNDMORE)
+            socket_tx.send(Message.Encode(*CONST_BENCHMARK_MESSAGE))
+            socket_rx.recv_string()
+            Message.Decode(socket_rx.recv())
+    else:
+        def Tick():
+            socket_tx.send_string(CONST_BENCHMARK_TOPIC, zmq.SNDMORE)
+            socket_tx.send(Message.Encode(*CONST_BENCHMARK_MESSAGE))
+            socket_rx.recv_string()
+            Message.Decode(socket_rx.recv(copy=False).buffer)
+
+    return Tick, [socket_tx, socket_rx]
+
+def Measure(tick):
+    """
+    Description:
+        Function to measure the latency of each tick.
+
+    Args:
+        (1) tick [Function]: Function of one tick.
+
+    Returns:
+        (1) parameter [Dictionary]: Latency statistics (in microseconds).
+    """
+
+    for _ in range(CONST_BENCHMARK_NUM_OF_WARM_UP):
+        tick()
+
+    latency = np.zeros(CONST_BENCHMARK_NUM_OF_TICKS, dtype=np.int64)
+
+    for i in range(CONST_BENCHMARK_NUM_OF_TICKS):
+        t_0 = time.perf_counter_ns()
+        tick()
+        latency[i] = time.perf_counter_ns() - t_0
+
+    latency_us = latency / 1000.0
+
+    return {'mean_us': float(np.mean(latency_us)), 'p50_us': float(np.percentile(latency_us, 50)),
+            'p99_us': float(np.percentile(latency_us, 99)), 'max_us': float(np.max(latency_us))}
+
+def main():
+    results = []
+
+    # Codec only
+    for name, binary in [('Pickle', False), ('Binary', True)]:
+        tick, size = Create_Codec(binary)
+        results.append({'path': 'Codec', 'implementation': name, 'size_bytes': size, **Measure(tick)})
+
+    # Socket (inproc)
+    context = zmq.Context()
+    for name in ['Pickle', 'Binary (copy)', 'Binary (frame)']:
+        tick, sockets = Create_Socket(context, name)
+        size = results[0 if name == 'Pickle' else 1]['size_bytes']
+        results.append({'path': 'Socket', 'implementation': name, 'size_bytes': size, **Measure(tick)})
+        for socket in sockets:
+            socket.close(linger=0)
+    context.term()
+
+    for result in results:
+        print(f'[{result["path"]:6s}, {result["implementation"]:14s}, {result["size_bytes"]:3d} B] Mean: {result["mean_us"]:6.2f} us, '
+              f'p50: {result["p50_us"]:6.2f} us, p99: {result["p99_us"]:6.2f} us, Max: {result["max_us"]:8.2f} us')
+
+    # Save the results (and information about the environment) to a file.
+    output = {'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'), 'platform': platform.platform(), 'python': platform.python_version(),
+              'zmq': zmq.zmq_version(), 'pyzmq': zmq.__version__, 'num_of_ticks': CONST_BENCHMARK_NUM_OF_TICKS, 'results': results}
+
+    directory_name = os.path.join(os.getcwd(), 'Evaluation', 'Benchmark_Results')
+    os.makedirs(directory_name, exist_ok=True)
+    file_path = os.path.join(directory_name, CONST_BENCHMARK_FILE_NAME + '_' + time.strftime('%Y%m%d_%H%M%S') + '.json')
+    with open(file_path, 'w') as f:
+        json.dump(output, f, indent=2)
+
+    print(f'[INFO] The results have been successfully saved: {file_path}')
+
+if __name__ == '__main__':
+    sys.exit(main())
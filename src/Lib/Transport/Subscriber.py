@@ -0,0 +1,298 @@
+"""
+## =========================================================================== ##
+MIT License
+Copyright (c) 2021 Roman Parak
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+## =========================================================================== ##
+Author   : Roman Parak
+Email    : Roman.Parak@outlook.com
+Github   : https://github.com/rparak
+File Name: Subscriber.py
+## =========================================================================== ##
+"""
+
+# Time (Time access and conversions)
+import time
+# Lib.Transport.Message (Binary wire format of the glove messages)
+import Lib.Transport.Message as Message
+
+# Initialization of Constants:
+#   Subscriber mode:
+#       QUEUE: All received messages are processed in order.
+#       LATEST: Only the newest message is processed, the older messages in the queue are skipped (drain-to-latest).
+#   Note: 
+#       The ZeroMQ option zmq.CONFLATE does not support multipart messages (topic + message), so the queue 
+#       is drained by the subscriber.
+CONST_SUBSCRIBER_MODE_QUEUE  = 0
+CONST_SUBSCRIBER_MODE_LATEST = 1
+#   Maximum number of messages received in one call (the publisher can not starve the loop)
+CONST_SUBSCRIBER_MAX_NUM_OF_MESSAGES = 1000
+
+class Glove_Subscriber(object):
+    """
+    Description:
+        Receiver of the glove messages (one topic) from a ZeroMQ SUB socket with the accounting of the messages:
+            Received: All valid messages (format).
+            Skipped: Messages drained from the queue without processing (LATEST mode).
+            Lost: Messages missing in the sequence (e.g. dropped by the high water mark of the socket).
+
+        Each message is stamped with the time of the receipt on the clock of the subscriber (Glove_Message.received). 
+        The timestamp of the publisher (time.perf_counter() of another process, possibly on another host, e.g. pgm/epgm 
+        multicast) is not comparable with the local clock, only the differences of two timestamps of the publisher are 
+        used (the spacing of the samples). A backlog received at once keeps the spacing of the publisher, anchored 
+        at the receipt of the newest message.
+
+        The age of the newest message is the time from its receipt (local clock) to now. A message older than {max_age} 
+        seconds is stale, the robot should not move to its position. The local time of the samples (received) is also 
+        the timeline of the setpoint of the robot.
+            Note: The time from the glove sample to the receipt (transport) is not part of the age.
+
+        Reconstruction (the publisher sends only the changes, Deadband.CONST_PUBLISH_POLICY_DEADBAND): The samples 
+        suppressed by the publisher are reconstructed as copies of the last message (sample and hold) every {period} 
+        seconds after the last message, so the filters of the subscriber get a continuous stream. A copy is created 
+        one period after its time (a new message can be on the way) and at most {max_age} seconds after the last message.
+
+    Initialization of the Class:
+        Args:
+            (1) socket [zmq.Socket]: Connected SUB socket (subscribed to the topic of one glove).
+            (2) mode [INT]: Subscriber mode (CONST_SUBSCRIBER_MODE_QUEUE or CONST_SUBSCRIBER_MODE_LATEST).
+            (3) max_age [Float]: Maximum age of the message in seconds.
+            (4) period [Float]: Period of the publisher in seconds for the reconstruction of the suppressed samples, 
+                                None: without the reconstruction.
+            (5) clock [Function]: Local clock in seconds (default: time.perf_counter).
+
+        Example:
+            Initialization:
+                Cls = Glove_Subscriber(socket, CONST_SUBSCRIBER_MODE_LATEST, 0.05)
+
+            Calculation:
+                for message in Cls.Receive():
+                    ...
+
+            Returns:
+                Cls.Get_Message()
+                Cls.Get_Age()
+                Cls.Is_Stale()
+                Cls.Get_Num_Of_Skipped()
+    """
+
+    def __init__(self, socket, mode = CONST_SUBSCRIBER_MODE_LATEST, max_age = 0.05, period = None, clock = time.perf_counter):
+        # << PRIVATE >> #
+        self.__socket  = socket
+        self.__mode    = mode
+        self.__max_age = max_age
+        self.__period  = period
+        self.__clock   = clock
+        # Reconstruction: The last received message, number of the copies of the message (reconstructed samples), 
+        # number of all reconstructed samples
+        self.__held        = None
+        self.__num_of_held = 0
+        self.__num_of_reconstructed = 0
+        # The newest message (before the first received message: Message.CONST_MESSAGE_EMPTY)
+        self.__message = Message.CONST_MESSAGE_EMPTY
+        # Number of the messages: Received, Skipped, Lost
+        self.__num_of_received = 0
+        self.__num_of_skipped  = 0
+        self.__num_of_lost     = 0
+
+    def Receive(self, timeout = 0):
+        """
+        Description:
+            Function to receive the messages waiting in the queue of the socket.
+
+        Args:
+            (1) timeout [INT]: Time to wait for the first message in milliseconds (0: no wait, None: wait forever).
+
+        Returns:
+            (1) parameter [List]: Messages to be processed (Message.Glove_Message): 
+                                  QUEUE - all messages in order (including the reconstructed samples), 
+                                  LATEST - only the newest message.
+        """
+
+        messages = []
+
+        for _ in range(CONST_SUBSCRIBER_MAX_NUM_OF_MESSAGES if self.__socket.poll(timeout) != 0 else 0):
+            # The first frame is the topic of the glove, the message with an unknown format is ignored.
+            self.__socket.recv()
+            message = Message.Decode(self.__socket.recv())
+
+            if message is not None:
+                previous = messages[-1] if len(messages) > 0 else self.__message
+                if self.__num_of_received > 0:
+                    # Note: The sequence that goes back (e.g. a restart of the publisher) is not counted.
+                    difference = (message.sequence - previous.sequence) & 0xFFFFFFFF
+                    if 1 < difference <= 0x7FFFFFFF:
+                        self.__num_of_lost += difference - 1
+                self.__num_of_received += 1
+                # Time of the receipt (local clock)
+                messages.append(message._replace(received = self.__clock()))
+
+            if self.__socket.poll(0) == 0:
+                break
+
+        if len(messages) > 0:
+            # Local time of the samples: The spacing of the publisher from the receipt of the newest message back, 
+            # not later than the receipt of each message and not earlier than the previous message.
+            newest = messages[-1]; t_previous = self.__message.received
+            for i, message in enumerate(messages):
+                t_previous = max(min(message.received, newest.received - (newest.timestamp - message.timestamp)), t_previous)
+                messages[i] = message._replace(received = t_previous)
+            self.__message = messages[-1]
+
+        if self.__mode == CONST_SUBSCRIBER_MODE_LATEST and len(messages) > 1:
+            self.__num_of_skipped += len(messages) - 1
+
+        if self.__period is not None:
+            messages = self.__Reconstruct(messages)
+
+        if self.__mode == CONST_SUBSCRIBER_MODE_LATEST:
+            messages = messages[-1:]
+
+        return messages
+
+    def __Reconstruct(self, messages):
+        """
+        Description:
+            Function to insert the reconstructed samples (copies of the last message) before the received messages 
+            and after them up to the current time.
+
+        Args:
+            (1) messages [List]: Received messages.
+
+        Returns:
+            (1) parameter [List]: Received and reconstructed messages in order.
+        """
+
+        # Maximum number of the reconstructed samples after the last message
+        max_num_of_samples = int(self.__max_age / self.__period)
+
+        output = []
+        for message in messages:
+            if self.__held is not None:
+                # The samples suppressed before the message (the spacing of the publisher): The last values are held.
+                num_of_samples = min(int(round((message.timestamp - self.__held.timestamp) / self.__period)) - 1, max_num_of_samples)
+                while self.__num_of_held < num_of_samples:
+                    output.append(self.__Hold())
+
+            output.append(message)
+            self.__held = message; self.__num_of_held = 0
+
+        # No new message: The last values are held up to the current time (minus one period, the next message can be on the way), 
+        # but at most {max_age} seconds after the last message.
+        if self.__held is not None:
+            t = min(self.__clock() - self.__period, self.__held.received + self.__max_age)
+            while self.__held.received + (self.__num_of_held + 1) * self.__period <= t:
+                output.append(self.__Hold())
+
+        self.__num_of_reconstructed += len(output) - len(messages)
+
+        return output
+
+    def __Hold(self):
+        # The next copy of the last message (one period after the previous sample on both clocks)
+        self.__num_of_held += 1
+        t = self.__num_of_held * self.__period
+
+        return self.__held._replace(timestamp = self.__held.timestamp + t, received = self.__held.received + t)
+
+    def Get_Message(self):
+        """
+        Description:
+            Function to get the newest received message.
+
+        Returns:
+            (1) parameter [Glove_Message]: The newest message.
+        """
+
+        return self.__message
+
+    def Get_Age(self, timestamp = None):
+        """
+        Description:
+            Function to get the age of the newest message (from the receipt, local clock).
+
+        Args:
+            (1) timestamp [Float]: Time in seconds (local clock), None: now.
+
+        Returns:
+            (1) parameter [Float]: Age of the message in seconds, None if no message has been received.
+        """
+
+        if self.__num_of_received == 0:
+            return None
+
+        return (self.__clock() if timestamp is None else timestamp) - self.__message.received
+
+    def Is_Stale(self, timestamp = None):
+        """
+        Description:
+            Function to check the age of the newest message.
+
+        Args:
+            (1) timestamp [Float]: Time in seconds (local clock), None: now.
+
+        Returns:
+            (1) parameter [Bool]: The message is older than {max_age} seconds (or no message has been received).
+        """
+
+        age = self.Get_Age(timestamp)
+
+        return age is None or age > self.__max_age
+
+    def Get_Num_Of_Received(self):
+        """
+        Description:
+            Function to get the number of received messages.
+
+        Returns:
+            (1) parameter [INT]: Number of the messages.
+        """
+
+        return self.__num_of_received
+
+    def Get_Num_Of_Skipped(self):
+        """
+        Description:
+            Function to get the number of messages skipped in the LATEST mode.
+
+        Returns:
+            (1) parameter [INT]: Number of the messages.
+        """
+
+        return self.__num_of_skipped
+
+    def Get_Num_Of_Reconstructed(self):
+        """
+        Description:
+            Function to get the number of reconstructed samples (suppressed by the publisher).
+
+        Returns:
+            (1) parameter [INT]: Number of the samples.
+        """
+
+        return self.__num_of_reconstructed
+
+    def Get_Num_Of_Lost(self):
+        """
+        Description:
+            Function to get the number of messages missing in the sequence.
+
+        Returns:
+            (1) parameter [INT]: Number of the messages.
+        """
+
+        return self.__num_of_lost
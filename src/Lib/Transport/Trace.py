@@ -0,0 +1,217 @@
+"""
+## =========================================================================== ##
+MIT License
+Copyright (c) 2021 Roman Parak
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+## =========================================================================== ##
+Author   : Roman Parak
+Email    : Roman.Parak@outlook.com
+Github   : https://github.com/rparak
+File Name: Trace.py
+## =========================================================================== ##
+"""
+
+# Time (Time access and conversions)
+import time
+# OS (Operating system interfaces)
+import os
+# JSON (JSON encoder and decoder)
+import json
+# Lib.Parameters (Main Control Parameters)
+import Lib.Parameters as Parameters
+# Lib.Histogram (Fixed-size histogram of time values)
+import Lib.Histogram as Histogram
+
+# Initialization of Constants:
+#   Stages of the path from the glove sample to the robot command (sub_ur_ctrl.py):
+#       RECEIVE   : From the acquisition of the sample (the DLL read in Essential_Reality) to the processing by the subscriber 
+#                   (the wait of the publisher, the transport and the queue of the subscriber).
+#       FILTER    : Filter of the position.
+#       MAPPING   : Mapping of the sensor position to the robot workspace and the setpoint stage.
+#       SERVO     : Call of the servo command (servoL).
+#       END_TO_END: From the acquisition of the newest sample to the return of the servo command.
+CONST_TRACE_STAGE_RECEIVE    = 0
+CONST_TRACE_STAGE_FILTER     = 1
+CONST_TRACE_STAGE_MAPPING    = 2
+CONST_TRACE_STAGE_SERVO      = 3
+CONST_TRACE_STAGE_END_TO_END = 4
+CONST_TRACE_STAGES = ['receive', 'filter', 'mapping', 'servo', 'end_to_end']
+
+class Latency_Trace(object):
+    """
+    Description:
+        Latency of the stages of a path (e.g. from the glove sample to the robot command) in fixed-size histograms 
+        and the accounting of the sequence numbers of the samples:
+            Gaps: Number of the jumps in the sequence.
+            Missing: Number of the samples missing in the gaps (never processed).
+            Repeated: Number of the samples processed more than once.
+
+        The histograms are the same as in the loop statistics (Lib.Histogram, in ms): the cost of one value is constant, 
+        the values above the range are counted in the last bin (the exact maximum is kept separately). The summary can 
+        be read while the trace is running (live).
+
+    Initialization of the Class:
+        Args:
+            (1) name [String]: Name of the trace.
+            (2) stages [String Vector]: Names of the stages.
+            (3) histogram [Float, INT]: Width of one bin in seconds and number of bins.
+
+        Example:
+            Initialization:
+                Cls = Latency_Trace('UR_Control')
+
+            Calculation:
+                Cls.Add(CONST_TRACE_STAGE_FILTER, t_1 - t_0)    # In seconds
+                Cls.Add_Sequence(sequence)
+
+            Returns:
+                Cls.Get_Summary()               # Mean, p50, p99, max (ms) of each stage, number of gaps, ...
+                Cls.Dump('UR_Control_Latency')  # Post-run report (print and .json file)
+    """
+
+    def __init__(self, name, stages = CONST_TRACE_STAGES, histogram = Parameters.CONST_TRACE_HISTOGRAM):
+        # << PUBLIC >> #
+        self.name = name
+
+        # << PRIVATE >> #
+        self.__stages = list(stages)
+        # Width of one bin in seconds and number of bins of the histograms
+        self.__histogram_parameters = histogram
+        self.Clear()
+
+    def Clear(self):
+        """
+        Description:
+            Function to remove all values from the trace.
+        """
+
+        # Histograms of the stages
+        self.__histogram = [Histogram.Histogram(self.__histogram_parameters[0], self.__histogram_parameters[1], 'ms') 
+                            for _ in self.__stages]
+        # Accounting of the sequence numbers
+        self.__sequence        = None
+        self.__num_of_samples  = 0
+        self.__num_of_gaps     = 0
+        self.__num_of_missing  = 0
+        self.__num_of_repeated = 0
+
+    def Add(self, stage, latency):
+        """
+        Description:
+            Function to add the latency of a stage.
+
+        Args:
+            (1) stage [INT]: Index of the stage (e.g. CONST_TRACE_STAGE_FILTER).
+            (2) latency [Float]: Latency in seconds (a negative value is counted as 0).
+        """
+
+        self.__histogram[stage].Add(int(latency * 1e9))
+
+    def Add_Sequence(self, sequence):
+        """
+        Description:
+            Function to add the sequence number of a processed sample.
+
+        Args:
+            (1) sequence [INT]: Sequence number of the sample (uint32, it can wrap around).
+        """
+
+        self.__num_of_samples += 1
+
+        if self.__sequence is not None:
+            difference = (sequence - self.__sequence) & 0xFFFFFFFF
+            if difference == 0:
+                self.__num_of_repeated += 1
+            elif difference > 0x7FFFFFFF:
+                # The sequence goes back (e.g. a restart of the publisher): a gap without the missing samples.
+                self.__num_of_gaps += 1
+            elif difference > 1:
+                self.__num_of_gaps    += 1
+                self.__num_of_missing += difference - 1
+
+        self.__sequence = sequence
+
+    def Get_Summary(self):
+        """
+        Description:
+            Function to get the summary of the trace (it can be called while the trace is running).
+
+        Returns:
+            (1) parameter [Dictionary]: Name, number of the samples, gaps, missing and repeated samples and for each stage 
+                                        the number of values and the mean, p50, p99 and max in ms (Histogram.Get_Summary).
+        """
+
+        summary = {'name': self.name, 'num_of_samples': self.__num_of_samples, 'num_of_gaps': self.__num_of_gaps, 
+                   'num_of_missing': self.__num_of_missing, 'num_of_repeated': self.__num_of_repeated}
+        for i, stage in enumerate(self.__stages):
+            summary[stage] = self.__histogram[i].Get_Summary()
+
+        return summary
+
+    def To_Dict(self):
+        """
+        Description:
+            Function to get the summary and all the histograms (e.g. to save them to a file).
+
+        Returns:
+            (1) parameter [Dictionary]: Summary, width of one bin (ms) and the counts of each stage.
+        """
+
+        return {**self.Get_Summary(), 'bin_width_ms': self.__histogram[0].Get_Bin_Width(), 
+                'histogram': {stage: self.__histogram[i].Get_Counts() for i, stage in enumerate(self.__stages)}}
+
+    def To_String(self):
+        """
+        Description:
+            Function to get a short summary of the trace (one line, e.g. the live output).
+
+        Returns:
+            (1) parameter [String]: p50 / p99 of each stage in ms and the number of gaps and missing samples.
+        """
+
+        summary = self.Get_Summary()
+
+        return (', '.join(f'{stage}: {summary[stage]["p50_ms"]:0.2f}/{summary[stage]["p99_ms"]:0.2f}' for stage in self.__stages) + 
+                f' ms (p50/p99), Gaps: {summary["num_of_gaps"]}, Missing: {summary["num_of_missing"]}')
+
+    def Dump(self, file_name = None):
+        """
+        Description:
+            Function to print the summary of the trace and to save the trace (including the histograms) to the 
+            ../src/Evaluation/Latency_Trace/ folder (.json), e.g. at the shutdown.
+
+        Args:
+            (1) file_name [String]: Output file name (without the extension and the time), None: the trace is only printed.
+        """
+
+        summary = self.Get_Summary()
+        print(f'[INFO] Latency: {summary["name"]}, Samples: {summary["num_of_samples"]}, Gaps: {summary["num_of_gaps"]}, '
+              f'Missing: {summary["num_of_missing"]}, Repeated: {summary["num_of_repeated"]}')
+        for stage in self.__stages:
+            print(f'[INFO]   {stage:10s} Mean: {summary[stage]["mean_ms"]:8.3f} ms, p50: {summary[stage]["p50_ms"]:8.3f} ms, '
+                  f'p99: {summary[stage]["p99_ms"]:8.3f} ms, Max: {summary[stage]["max_ms"]:8.3f} ms')
+
+        if file_name is None:
+            return
+
+        directory_name = os.path.join(os.getcwd(), 'Evaluation', 'Latency_Trace')
+        os.makedirs(directory_name, exist_ok=True)
+        file_path = os.path.join(directory_name, file_name + '_' + time.strftime('%Y%m%d_%H%M%S') + '.json')
+        with open(file_path, 'w') as f:
+            json.dump({'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'), **self.To_Dict()}, f, indent=2)
+
+        print(f'[INFO] The latency trace has been successfully saved: {file_path}')
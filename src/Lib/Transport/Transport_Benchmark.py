@@ -0,0 +1,232 @@
+"""
+## =========================================================================== ##
+MIT License
+Copyright (c) 2021 Roman Parak
+Permission is hereby granted, free of charge, to any person obtaining a copy
+of this software and associated documentation files (the "Software"), to deal
+in the Software without restriction, including without limitation the rights
+to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+copies of the Software, and to permit persons to whom the Software is
+furnished to do so, subject to the following conditions:
+The above copyright notice and this permission notice shall be included in all
+copies or substantial portions of the Software.
+THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+SOFTWARE.
+## =========================================================================== ##
+Author   : Roman Parak
+Email    : Roman.Parak@outlook.com
+Github   : https://github.com/rparak
+File Name: Transport_Benchmark.py
+## =========================================================================== ##
+"""
+
+# System (Default)
+import sys
+# Time (Time access and conversions)
+import time
+# OS (Operating system interfaces)
+import os
+# Platform (Access to underlying platform's identifying data)
+import platform
+# JSON (JSON encoder and decoder)
+import json
+# Threading (Thread-based parallelism)
+import threading
+# Numpy (Array computing) [pip3 install numpy]
+import numpy as np
+# ZeroMQ (Universal messaging library) [pip install zmq]
+import zmq
+# Lib.Transport.Message (Binary wire format of the glove messages)
+import Lib.Transport.Message as Message
+# Lib.Transport.Endpoint (Endpoints of the glove messages)
+import Lib.Transport.Endpoint as Endpoint
+
+"""
+Description:
+    Benchmark of the transports of the glove messages (PUB / SUB, topic + binary message) on the same machine: 
+    inproc, ipc, tcp (loopback) and multicast (epgm, only if the ZeroMQ library is built with OpenPGM).
+
+    Measured quantities (one transport at a time, the publisher runs in a thread of the same process):
+        Latency   : One-way latency (mean, p50, p99, max in microseconds) from the encoding of the message (timestamp) 
+                    to the decoding by the subscriber, messages sent every CONST_BENCHMARK_LATENCY_PERIOD seconds.
+        Throughput: A burst of messages (without the high water mark), the number of messages per second 
+                    and MB per second received by the subscriber.
+
+    Note:
+        Both sides are Python threads (GIL), the results include the cost of the Python code, which is the same 
+        for all transports, so the difference between the transports is what matters.
+
+    Run (from the ../src/ folder):
+        $ python -m Lib.Transport.Transport_Benchmark
+
+    The results are saved to the ../src/Evaluation/Benchmark_Results/ folder (.json).
+"""
+
+# Initialization of Constants:
+#   Transports: Name, Endpoint of the publisher (bind), Endpoint of the subscriber (connect)
+CONST_BENCHMARK_TRANSPORTS = [('inproc', 'inproc://transport_benchmark', 'inproc://transport_benchmark'),
+                              ('ipc', 'ipc:///tmp/transport_benchmark', 'ipc:///tmp/transport_benchmark'),
+                              ('tcp', 'tcp://127.0.0.1:5590', 'tcp://127.0.0.1:5590'),
+                              ('epgm', 'epgm://lo;239.192.1.1:5591', 'epgm://lo;239.192.1.1:5591')]
+#   Latency: Number of messages (Warm-up, Measurement), Period of the messages in seconds
+CONST_BENCHMARK_NUM_OF_WARM_UP     = 200
+CONST_BENCHMARK_NUM_OF_MESSAGES    = 5000
+CONST_BENCHMARK_LATENCY_PERIOD     = 0.0002
+#   Throughput: Number of messages in the burst
+CONST_BENCHMARK_NUM_OF_BURST = 100000
+#   Time for the subscription to reach the publisher in seconds (slow joiner)
+CONST_BENCHMARK_JOIN_TIME = 0.3
+#   Topic of the messages
+CONST_BENCHMARK_TOPIC = 'P5_GLOVE_00'
+#   Output file name
+CONST_BENCHMARK_FILE_NAME = 'Transport_Benchmark'
+
+def Create_Pair(context, endpoint_bind, endpoint_connect):
+    """
+    Description:
+        Function to create the publisher and the subscriber of one transport.
+
+    Args:
+        (1) context [zmq.Context]: ZeroMQ context (inproc: the same context for both sockets).
+        (2) endpoint_bind [String]: Endpoint of the publisher.
+        (3) endpoint_connect [String]: Endpoint of the subscriber.
+
+    Returns:
+        (1) parameter [zmq.Socket]: Publisher, None if the transport is not available.
+        (2) parameter [zmq.Socket]: Subscriber, None if the transport is not available.
+    """
+
+    socket_pub = context.socket(zmq.PUB); socket_sub = context.socket(zmq.SUB)
+    # Without the high water mark (no message is dropped in the burst)
+    socket_pub.setsockopt(zmq.SNDHWM, 0); socket_sub.setsockopt(zmq.RCVHWM, 0)
+    socket_sub.setsockopt_string(zmq.SUBSCRIBE, CONST_BENCHMARK_TOPIC)
+
+    if Endpoint.Bind(socket_pub, endpoint_bind) == False or Endpoint.Connect(socket_sub, endpoint_connect) == False:
+        socket_pub.close(linger=0); socket_sub.close(linger=0)
+        return None, None
+
+    time.sleep(CONST_BENCHMARK_JOIN_TIME)
+
+    return socket_pub, socket_sub
+
+def Publish(socket, num_of_messages, period):
+    """
+    Description:
+        Function to send the messages (the timestamp of each message is the time of the encoding).
+
+    Args:
+        (1) socket [zmq.Socket]: Publisher.
+        (2) num_of_messages [INT]: Number of messages.
+        (3) period [Float]: Period of the messages in seconds, 0.0: a burst.
+    """
+
+    for i in range(num_of_messages):
+        socket.send_string(CONST_BENCHMARK_TOPIC, zmq.SNDMORE)
+        socket.send(Message.Encode(0, i + 1, i, time.perf_counter(), [1.0, 2.0, 3.0], [10.0, 20.0, 30.0, 40.0, 50.0], False, True, False, True))
+        if period > 0.0:
+            time.sleep(period)
+
+def Measure_Latency(socket_pub, socket_sub):
+    """
+    Description:
+        Function to measure the one-way latency of the messages.
+
+    Args:
+        (1) socket_pub [zmq.Socket]: Publisher.
+        (2) socket_sub [zmq.Socket]: Subscriber.
+
+    Returns:
+        (1) parameter [Dictionary]: Latency statistics (in microseconds) and the number of lost messages.
+    """
+
+    num_of_messages = CONST_BENCHMARK_NUM_OF_WARM_UP + CONST_BENCHMARK_NUM_OF_MESSAGES
+    t_publish = threading.Thread(target=Publish, args=(socket_pub, num_of_messages, CONST_BENCHMARK_LATENCY_PERIOD))
+    t_publish.start()
+
+    latency = []; num_of_received = 0
+    while socket_sub.poll(1000) != 0:
+        socket_sub.recv()
+        message = Message.Decode(socket_sub.recv())
+        t = time.perf_counter()
+        num_of_received += 1
+        if message.sample_sequence >= CONST_BENCHMARK_NUM_OF_WARM_UP:
+            latency.append(t - message.timestamp)
+        if message.sequence == num_of_messages:
+            break
+    t_publish.join()
+
+    latency_us = np.array(latency) * 1e6
+
+    return {'mean_us': float(np.mean(latency_us)), 'p50_us': float(np.percentile(latency_us, 50)),
+            'p99_us': float(np.percentile(latency_us, 99)), 'max_us': float(np.max(latency_us)), 
+            'num_of_lost': num_of_messages - num_of_received}
+
+def Measure_Throughput(socket_pub, socket_sub):
+    """
+    Description:
+        Function to measure the throughput of a burst of messages.
+
+    Args:
+        (1) socket_pub [zmq.Socket]: Publisher.
+        (2) socket_sub [zmq.Socket]: Subscriber.
+
+    Returns:
+        (1) parameter [Dictionary]: Number of messages per second and MB per second (topic + message).
+    """
+
+    t_publish = threading.Thread(target=Publish, args=(socket_pub, CONST_BENCHMARK_NUM_OF_BURST, 0.0))
+
+    t_0 = time.perf_counter()
+    t_publish.start()
+    num_of_received = 0
+    while socket_sub.poll(1000) != 0:
+        socket_sub.recv(); socket_sub.recv()
+        num_of_received += 1
+        if num_of_received == CONST_BENCHMARK_NUM_OF_BURST:
+            break
+    t = time.perf_counter() - t_0
+    t_publish.join()
+
+    return {'throughput_msg_per_s': float(num_of_received / t), 
+            'throughput_mb_per_s': float(num_of_received * (len(CONST_BENCHMARK_TOPIC) + Message.CONST_MESSAGE_SIZE) / t / 1e6)}
+
+def main():
+    results = []
+
+    context = zmq.Context()
+    for name, endpoint_bind, endpoint_connect in CONST_BENCHMARK_TRANSPORTS:
+        socket_pub, socket_sub = Create_Pair(context, endpoint_bind, endpoint_connect)
+        if socket_pub is None:
+            print(f'[INFO] The transport {name} is skipped.')
+            continue
+
+        results.append({'transport': name, 'endpoint': endpoint_connect, **Measure_Latency(socket_pub, socket_sub), 
+                        **Measure_Throughput(socket_pub, socket_sub)})
+        socket_pub.close(linger=0); socket_sub.close(linger=0)
+    context.term()
+
+    for result in results:
+        print(f'[{result["transport"]:6s}] Latency Mean: {result["mean_us"]:7.2f} us, p50: {result["p50_us"]:7.2f} us, p99: {result["p99_us"]:7.2f} us, '
+              f'Max: {result["max_us"]:8.2f} us, Lost: {result["num_of_lost"]}, '
+              f'Throughput: {result["throughput_msg_per_s"]:10.1f} msg/s ({result["throughput_mb_per_s"]:6.2f} MB/s)')
+
+    # Save the results (and information about the environment) to a file.
+    output = {'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'), 'platform': platform.platform(), 'python': platform.python_version(),
+              'zmq': zmq.zmq_version(), 'pyzmq': zmq.__version__, 'num_of_messages': CONST_BENCHMARK_NUM_OF_MESSAGES, 
+              'num_of_burst': CONST_BENCHMARK_NUM_OF_BURST, 'results': results}
+
+    directory_name = os.path.join(os.getcwd(), 'Evaluation', 'Benchmark_Results')
+    os.makedirs(directory_name, exist_ok=True)
+    file_path = os.path.join(directory_name, CONST_BENCHMARK_FILE_NAME + '_' + time.strftime('%Y%m%d_%H%M%S') + '.json')
+    with open(file_path, 'w') as f:
+        json.dump(output, f, indent=2)
+
+    print(f'[INFO] The results have been successfully saved: {file_path}')
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -27,8 +27,6 @@ File Name: Utils.py
 
 # Pandas (Data analysis and manipulation) [pip3 install pandas]
 import pandas as pd
-# Time (Time access and conversions)
-import time
 # OS (Operating system interfaces)
 import os
 # Lib.P5.Essential_Reality (Library to control the Essential Reality P5 Glove)
@@ -37,6 +35,8 @@ import Lib.P5.Essential_Reality as Essential_Reality
 import Lib.Signal.Filter as Filter
 # Lib.Parameters (Main Control Parameters)
 import Lib.Parameters as Parameters
+# Lib.Scheduler (Scheduler of the periodic loops)
+import Lib.Scheduler as Scheduler
 
 # Initialization of Constants:
 #   Control State: SET, NULL (Inverting the individual value using the edge signal)
@@ -104,45 +104,43 @@ def Data_Collection_Position(P5_cls, file_name, num_of_data_collections):
     y_data_rt = []; y_data_f1_rt = []; y_data_f2_rt = []; y_data_f3_rt = []
     z_data_rt = []; z_data_f1_rt = []; z_data_f2_rt = []; z_data_f3_rt = []
 
-    SMA = []; BLP = []; BLPMA = []
-    # Initialization of filters for each part.
-    for _, limit in enumerate(Parameters.CONST_FILTER_POS_LIMIT):
-        # Simple Moving Average (SMA)
-        SMA.append(Filter.Simple_Moving_Average([limit[0], limit[1]], Parameters.CONST_FILTER_POS_NUM_OF_DATA))
-        # Butterworth Low Pass (BLP)
-        BLP.append(Filter.Butterworth_Low_Pass([limit[0], limit[1]], Parameters.CONST_FILTER_POS_NUM_OF_DATA, 1/Essential_Reality.CONST_TIME_STEP, 2.5, 3))
-        # Butterworth Low Pass Moving Average (BLPMA)
-        BLPMA.append(Filter.Butterworth_Low_Pass_Moving_Average([limit[0], limit[1]], Parameters.CONST_FILTER_POS_NUM_OF_DATA, 50, 1/Essential_Reality.CONST_TIME_STEP, 2.5, 3))
+    # Initialization of the filter banks for all parts {X, Y, Z}.
+    #   Simple Moving Average (SMA)
+    SMA   = Filter.Filter_Bank(Filter.CONST_FILTER_TYPE_SMA, Parameters.CONST_FILTER_POS_LIMIT, Parameters.CONST_FILTER_POS_NUM_OF_DATA)
+    #   Butterworth Low Pass (BLP)
+    BLP   = Filter.Filter_Bank(Filter.CONST_FILTER_TYPE_BLP, Parameters.CONST_FILTER_POS_LIMIT, Parameters.CONST_FILTER_POS_NUM_OF_DATA, 
+                               frq_s = 1/Essential_Reality.CONST_TIME_STEP, frq_c = 2.5, order = 3)
+    #   Butterworth Low Pass Moving Average (BLPMA)
+    BLPMA = Filter.Filter_Bank(Filter.CONST_FILTER_TYPE_BLPMA, Parameters.CONST_FILTER_POS_LIMIT, Parameters.CONST_FILTER_POS_NUM_OF_DATA, 50, 1/Essential_Reality.CONST_TIME_STEP, 2.5, 3)
 
-    while P5_cls.error != True and len(x_data_rt) <= num_of_data_collections:
-        # t_{0}: time start
-        t_0 = time.time()
+    # Scheduler of the loop (absolute deadlines, period: Essential_Reality.CONST_TIME_STEP)
+    RATE = Scheduler.Rate(Essential_Reality.CONST_TIME_STEP, name = 'Data_Collection_Position')
 
+    while P5_cls.error != True and len(x_data_rt) <= num_of_data_collections:
         # Actual Data (Raw)
-        x_data_rt.append(P5_cls.Get_Absolute_Position_ID(0))
-        y_data_rt.append(P5_cls.Get_Absolute_Position_ID(1))
-        z_data_rt.append(P5_cls.Get_Absolute_Position_ID(2))
+        data_rt = list(P5_cls.Get_Sample().position)
+        x_data_rt.append(data_rt[0])
+        y_data_rt.append(data_rt[1])
+        z_data_rt.append(data_rt[2])
         # Filtered Data
         #   SMA
-        x_data_f1_rt.append(SMA[0].Compute(P5_cls.Get_Absolute_Position_ID(0)))
-        y_data_f1_rt.append(SMA[1].Compute(P5_cls.Get_Absolute_Position_ID(1)))
-        z_data_f1_rt.append(SMA[2].Compute(P5_cls.Get_Absolute_Position_ID(2)))
+        data_filtered = SMA.Compute(data_rt)
+        x_data_f1_rt.append(data_filtered[0])
+        y_data_f1_rt.append(data_filtered[1])
+        z_data_f1_rt.append(data_filtered[2])
         #   BLP
-        x_data_f2_rt.append(BLP[0].Compute(P5_cls.Get_Absolute_Position_ID(0)))
-        y_data_f2_rt.append(BLP[1].Compute(P5_cls.Get_Absolute_Position_ID(1)))
-        z_data_f2_rt.append(BLP[2].Compute(P5_cls.Get_Absolute_Position_ID(2)))
+        data_filtered = BLP.Compute(data_rt)
+        x_data_f2_rt.append(data_filtered[0])
+        y_data_f2_rt.append(data_filtered[1])
+        z_data_f2_rt.append(data_filtered[2])
         #   BLPMA
-        x_data_f3_rt.append(BLPMA[0].Compute(P5_cls.Get_Absolute_Position_ID(0)))
-        y_data_f3_rt.append(BLPMA[1].Compute(P5_cls.Get_Absolute_Position_ID(1)))
-        z_data_f3_rt.append(BLPMA[2].Compute(P5_cls.Get_Absolute_Position_ID(2)))
+        data_filtered = BLPMA.Compute(data_rt)
+        x_data_f3_rt.append(data_filtered[0])
+        y_data_f3_rt.append(data_filtered[1])
+        z_data_f3_rt.append(data_filtered[2])
 
-        # t_{1}: time stop
-        #   t = t_{1} - t_{0}
-        t = time.time() - t_0
-        
-        # Recalculate the time
-        if t < Essential_Reality.CONST_TIME_STEP:
-            time.sleep(Essential_Reality.CONST_TIME_STEP - t)
+        # Wait for the next deadline
+        RATE.Sleep()
 
     if P5_cls.error != True:
         data_collection = pd.DataFrame(data = {'X_DATA_RT': x_data_rt, 'X_DATA_F1_RT': x_data_f1_rt, 'X_DATA_F2_RT': x_data_f2_rt, 'X_DATA_F3_RT': x_data_f3_rt,
@@ -152,6 +150,9 @@ def Data_Collection_Position(P5_cls, file_name, num_of_data_collections):
         data_collection.to_csv(current_directory_name + '\\Evaluation\\P5_Results\\' + file_name + '.txt')
         print('[INFO] The data has been successfully saved.')
 
+    # Statistics of the loops (acquisition, data collection)
+    Scheduler.Dump_Statistics(file_name)
+
 def Data_Collection_Finger_Bends(P5_cls, file_name, num_of_data_collections):
     """
     Description:
@@ -169,53 +170,51 @@ def Data_Collection_Finger_Bends(P5_cls, file_name, num_of_data_collections):
     r_data_rt = []; r_data_f1_rt = []; r_data_f2_rt = []; r_data_f3_rt = []
     l_data_rt = []; l_data_f1_rt = []; l_data_f2_rt = []; l_data_f3_rt = []
 
-    SMA = []; BLP = []; BLPMA = []
-    # Initialization of filters for each part.
-    for _, limit in enumerate(Parameters.CONST_FILTER_FINGERS_BEND_LIMIT):
-        # Simple Moving Average (SMA)
-        SMA.append(Filter.Simple_Moving_Average([limit[0], limit[1]], Parameters.CONST_FILTER_POS_NUM_OF_DATA))
-        # Butterworth Low Pass (BLP)
-        BLP.append(Filter.Butterworth_Low_Pass([limit[0], limit[1]], Parameters.CONST_FILTER_POS_NUM_OF_DATA, 1/Essential_Reality.CONST_TIME_STEP, 2.5, 3))
-        # Butterworth Low Pass Moving Average (BLPMA)
-        BLPMA.append(Filter.Butterworth_Low_Pass_Moving_Average([limit[0], limit[1]], Parameters.CONST_FILTER_POS_NUM_OF_DATA, 50, 1/Essential_Reality.CONST_TIME_STEP, 2.5, 3))
+    # Initialization of the filter banks for all parts {T, I, M, R, L}.
+    #   Simple Moving Average (SMA)
+    SMA   = Filter.Filter_Bank(Filter.CONST_FILTER_TYPE_SMA, Parameters.CONST_FILTER_FINGERS_BEND_LIMIT, Parameters.CONST_FILTER_POS_NUM_OF_DATA)
+    #   Butterworth Low Pass (BLP)
+    BLP   = Filter.Filter_Bank(Filter.CONST_FILTER_TYPE_BLP, Parameters.CONST_FILTER_FINGERS_BEND_LIMIT, Parameters.CONST_FILTER_POS_NUM_OF_DATA, 
+                               frq_s = 1/Essential_Reality.CONST_TIME_STEP, frq_c = 2.5, order = 3)
+    #   Butterworth Low Pass Moving Average (BLPMA)
+    BLPMA = Filter.Filter_Bank(Filter.CONST_FILTER_TYPE_BLPMA, Parameters.CONST_FILTER_FINGERS_BEND_LIMIT, Parameters.CONST_FILTER_POS_NUM_OF_DATA, 50, 1/Essential_Reality.CONST_TIME_STEP, 2.5, 3)
 
-    while P5_cls.error != True and len(t_data_rt) <= num_of_data_collections:
-         # t_{0}: time start
-        t_0 = time.time()
+    # Scheduler of the loop (absolute deadlines, period: Essential_Reality.CONST_TIME_STEP)
+    RATE = Scheduler.Rate(Essential_Reality.CONST_TIME_STEP, name = 'Data_Collection_Finger_Bends')
 
+    while P5_cls.error != True and len(t_data_rt) <= num_of_data_collections:
         # Actual Data (Raw)
-        t_data_rt.append(P5_cls.Get_Fingers_Bend_ID(0))
-        i_data_rt.append(P5_cls.Get_Fingers_Bend_ID(1))
-        m_data_rt.append(P5_cls.Get_Fingers_Bend_ID(2))
-        r_data_rt.append(P5_cls.Get_Fingers_Bend_ID(3))
-        l_data_rt.append(P5_cls.Get_Fingers_Bend_ID(4))
+        data_rt = list(P5_cls.Get_Sample().fingers_bend)
+        t_data_rt.append(data_rt[0])
+        i_data_rt.append(data_rt[1])
+        m_data_rt.append(data_rt[2])
+        r_data_rt.append(data_rt[3])
+        l_data_rt.append(data_rt[4])
         # Filtered Data
         #   SMA
-        t_data_f1_rt.append(SMA[0].Compute(P5_cls.Get_Fingers_Bend_ID(0)))
-        i_data_f1_rt.append(SMA[1].Compute(P5_cls.Get_Fingers_Bend_ID(1)))
-        m_data_f1_rt.append(SMA[2].Compute(P5_cls.Get_Fingers_Bend_ID(2)))
-        r_data_f1_rt.append(SMA[3].Compute(P5_cls.Get_Fingers_Bend_ID(3)))
-        l_data_f1_rt.append(SMA[4].Compute(P5_cls.Get_Fingers_Bend_ID(4)))
+        data_filtered = SMA.Compute(data_rt)
+        t_data_f1_rt.append(data_filtered[0])
+        i_data_f1_rt.append(data_filtered[1])
+        m_data_f1_rt.append(data_filtered[2])
+        r_data_f1_rt.append(data_filtered[3])
+        l_data_f1_rt.append(data_filtered[4])
         #   BLP
-        t_data_f2_rt.append(BLP[0].Compute(P5_cls.Get_Fingers_Bend_ID(0)))
-        i_data_f2_rt.append(BLP[1].Compute(P5_cls.Get_Fingers_Bend_ID(1)))
-        m_data_f2_rt.append(BLP[2].Compute(P5_cls.Get_Fingers_Bend_ID(2)))
-        r_data_f2_rt.append(BLP[3].Compute(P5_cls.Get_Fingers_Bend_ID(3)))
-        l_data_f2_rt.append(BLP[4].Compute(P5_cls.Get_Fingers_Bend_ID(4)))
+        data_filtered = BLP.Compute(data_rt)
+        t_data_f2_rt.append(data_filtered[0])
+        i_data_f2_rt.append(data_filtered[1])
+        m_data_f2_rt.append(data_filtered[2])
+        r_data_f2_rt.append(data_filtered[3])
+        l_data_f2_rt.append(data_filtered[4])
         #   BLPMA
-        t_data_f3_rt.append(BLPMA[0].Compute(P5_cls.Get_Fingers_Bend_ID(0)))
-        i_data_f3_rt.append(BLPMA[1].Compute(P5_cls.Get_Fingers_Bend_ID(1)))
-        m_data_f3_rt.append(BLPMA[2].Compute(P5_cls.Get_Fingers_Bend_ID(2)))
-        r_data_f3_rt.append(BLPMA[3].Compute(P5_cls.Get_Fingers_Bend_ID(3)))
-        l_data_f3_rt.append(BLPMA[4].Compute(P5_cls.Get_Fingers_Bend_ID(4)))
-
-        # t_{1}: time stop
-        #   t = t_{1} - t_{0}
-        t = time.time() - t_0
-        
-        # Recalculate the time
-        if t < Essential_Reality.CONST_TIME_STEP:
-            time.sleep(Essential_Reality.CONST_TIME_STEP - t)
+        data_filtered = BLPMA.Compute(data_rt)
+        t_data_f3_rt.append(data_filtered[0])
+        i_data_f3_rt.append(data_filtered[1])
+        m_data_f3_rt.append(data_filtered[2])
+        r_data_f3_rt.append(data_filtered[3])
+        l_data_f3_rt.append(data_filtered[4])
+
+        # Wait for the next deadline
+        RATE.Sleep()
 
     if P5_cls.error != True:
         data_collection = pd.DataFrame(data = {'T_DATA_RT': t_data_rt, 'T_DATA_F1_RT': t_data_f1_rt, 'T_DATA_F2_RT': t_data_f2_rt, 'T_DATA_F3_RT': t_data_f3_rt, 
@@ -226,3 +225,6 @@ def Data_Collection_Finger_Bends(P5_cls, file_name, num_of_data_collections):
         current_directory_name = os.getcwd()
         data_collection.to_csv(current_directory_name + '\\Evaluation\\P5_Results\\' + file_name + '.txt')
         print('[INFO] The data has been successfully saved.')
+
+    # Statistics of the loops (acquisition, data collection)
+    Scheduler.Dump_Statistics(file_name)
@@ -33,15 +33,31 @@ import time
 import threading
 # Lib.P5.Essential_Reality (Library to control the Essential Reality P5 Glove)
 import Lib.P5.Essential_Reality as Essential_Reality
+# Lib.P5.Calibration (Calibration of the workspace and of the gestures)
+import Lib.P5.Calibration as Calibration
 # Lib.Utils (Some useful functions)
 import Lib.Utils as Utils
 # Lib.Parameters (Main Control Parameters)
 import Lib.Parameters as Parameters
+# Lib.Scheduler (Scheduler of the periodic loops)
+import Lib.Scheduler as Scheduler
+# Lib.Transport.Message (Binary wire format of the glove messages)
+import Lib.Transport.Message as Message
+# Lib.Transport.Deadband (Publish policy of the glove messages)
+import Lib.Transport.Deadband as Deadband
+# Lib.Transport.Endpoint (Endpoints of the glove messages)
+import Lib.Transport.Endpoint as Endpoint
 # ZeroMQ (Universal messaging library) [pip install zmq]
 import zmq 
 # Keyboard (Simulate keyboard events) [pip install keyboard]
 import keyboard 
 
+# Initialization of Constants:
+#   Time step of the publisher (the simulated glove may run faster than real time)
+CONST_TIME_STEP = Essential_Reality.CONST_TIME_STEP / (Parameters.CONST_P5_SIMULATION_SPEED if Parameters.CONST_P5_BACKEND != 'DLL' else 1.0)
+#   Maximum time to wait for the connection of the gloves in seconds
+CONST_CONNECTION_TIMEOUT = 10.0
+
 def Main_Control(P5_cls):
     # Initiation of the process (Publisher: Server)
     #   Create a zmq Context.
@@ -50,60 +66,149 @@ def Main_Control(P5_cls):
     socket = context.socket(zmq.PUB)
     socket.linger = 0
 
-    # Initialization of the parameters:
-    # Reset P5 Glove (Sensor) Position {X, Y, Z} -> 3
-    sensor_position = [0.0] * 3
+    # Bind the socket to the endpoints (CONST_PUBLISHER_ENDPOINTS: tcp, ipc, inproc, multicast).
+    if Endpoint.Bind(socket, Parameters.CONST_PUBLISHER_ENDPOINTS) == False:
+        socket.close()
+        context.term()
+        P5_cls.Disconnect()
+        # Exit from Python.
+        sys.exit(1)
+
+    # Wait for the glove to run (P5_cls.Connect in the main thread)
+    #   Note: Without a connected glove, nothing would be published.
+    if P5_cls.Wait_For_Connection(CONST_CONNECTION_TIMEOUT) == False or len(P5_cls.Get_IDs()) == 0:
+        print('[ERROR] No P5 glove is connected.')
+        socket.close()
+        context.term()
+        P5_cls.Disconnect()
+        # Exit from Python.
+        sys.exit(1)
 
-    # Bind the socket to an address.
-    socket.bind('tcp://*:2224')
+    # Initialization of the parameters (each glove):
+    #   Topic of the glove: Parameters.CONST_P5_TOPIC + id, e.g. 'P5_GLOVE_00'
+    #   Sequence number of the messages (the subscribers can detect the lost messages)
+    #   Reset P5 Glove (Sensor) Position {X, Y, Z} -> 3
+    #   Initialization of the Class (Simple Edge Decetor)
+    #       SED_Move: The edge signal depends on the A button (index 0) on the hand.
+    #       SED_Gripper: The edge signal depends on the opening and closing of the hand
+    #   Publish policy (CONST_PUBLISH_POLICY): Every tick, or only the changes above the deadband and a heartbeat
+    gloves = [{'id': id, 'topic': f'{Parameters.CONST_P5_TOPIC}{id:02d}', 'sequence': 0, 'sensor_position': [0.0] * 3,
+               'SED_Move': Utils.Simple_Edge_Detector(), 'SED_Gripper': Utils.Simple_Edge_Detector(),
+               'DEADBAND': Deadband.Deadband(Parameters.CONST_PUBLISH_POLICY, Parameters.CONST_PUBLISH_DEADBAND, Parameters.CONST_PUBLISH_HEARTBEAT)} 
+              for id in P5_cls.Get_IDs()]
+    #   Time spent by the publish policy and by the sending of the messages in ns (the CPU saved by the DEADBAND policy)
+    t_policy = 0; t_send = 0; t_start = time.perf_counter()
 
-    # Initialization of the Class (Simple Edge Decetor)
-    #   The edge signal depends on the A button (index 0) on the hand.
-    SED_Move    = Utils.Simple_Edge_Detector()
-    #   The edge signal depends on the opening and closing of the hand
-    SED_Gripper = Utils.Simple_Edge_Detector()
+    # Calibration of the workspace: The operator sweeps the hand for CONST_CALIBRATION_TIME seconds.
+    #   Note: Only the valid positions of the glove used by the subscribers (CONST_P5_GLOVE_ID).
+    CALIBRATION = None; t_calibration = 0.0; calibration_sequence = -1
+    # Calibration of the gesture templates: The operator forms and holds each gesture (CONST_GESTURE_CALIBRATION_TIME).
+    #   Note: The fingers bend of the glove used by the subscribers (CONST_P5_GLOVE_ID), the templates are set to all gloves.
+    gesture_names = list(Parameters.CONST_GESTURE_TEMPLATES.keys())
+    GESTURE_CALIBRATION = None; t_gesture_calibration = 0.0; gesture_index = 0; gesture_sequence = -1
 
-    # Wait for the glove to run
-    time.sleep(2)
-    
+    print(f'[INFO] Topics: {[glove["topic"] for glove in gloves]}')
+    print('[INFO] Press the (c) button to calibrate the workspace.')
+    print('[INFO] Press the (g) button to calibrate the hand gestures.')
     print('[INFO] Press the (q) button to exit.')
 
+    # Scheduler of the loop (absolute deadlines, period: CONST_TIME_STEP)
+    RATE = Scheduler.Rate(CONST_TIME_STEP, name = 'P5_Publisher')
+
     while P5_cls.error != True:
-        # t_{0}: time start
-        t_0 = time.time()
-
-        enable_movement = SED_Move.Get_Value(P5_cls.Get_Buttons_Value_ID(0))
-        # Robot moves depending on the input parameters
-        if enable_movement == True:
-            sensor_position = [P5_cls.Get_Absolute_Position_ID(0), P5_cls.Get_Absolute_Position_ID(1), P5_cls.Get_Absolute_Position_ID(2)]
-
-        # Send a Python object as a message using pickle to serialize.
-        #   pub_msg: 
-        #       Desired robot position:
-        #           [0]: X - Position
-        #           [1]: Y - Position
-        #           [2]: Z - Position
-        #       Gripper:
-        #           [3]: Gripper State
-        #           [4]: Movement State
-        #           [5]: Quit State
-        socket.send_pyobj([sensor_position[0], sensor_position[1], sensor_position[2], 
-                           SED_Gripper.Get_Value(P5_cls.Get_Hand_Gesture()), enable_movement, 
-                           False])
+        for glove in gloves:
+            # The last snapshot of the glove data (position and buttons sampled together)
+            sample = P5_cls.Get_Sample(glove['id'])
+
+            enable_movement = glove['SED_Move'].Get_Value(sample.buttons[0])
+            # Robot moves depending on the input parameters
+            #   Note: The position is held if the IR tracking is lost.
+            if enable_movement == True and sample.valid == True:
+                glove['sensor_position'] = list(sample.position)
+
+            # Send the message in the binary wire format (the first frame is the topic of the glove).
+            #   pub_msg (Lib.Transport.Message): 
+            #       Glove ID, Sequence Number of the message, Sequence Number and Timestamp of the sample (acquisition)
+            #       Desired robot position {X, Y, Z}, Fingers bend {T, I, M, R, L}
+            #       Gripper State, Movement State, Quit State
+            #       Valid State (False: the IR tracking of the position is lost, the position is not valid)
+            #   Note: Only if the publish policy requires it (the subscribers reconstruct the suppressed samples).
+            gripper = glove['SED_Gripper'].Get_Value(P5_cls.Get_Hand_Gesture(glove['id']))
+            t_0 = time.perf_counter_ns()
+            required = glove['DEADBAND'].Is_Required(sample.timestamp, glove['sensor_position'], sample.fingers_bend, 
+                                                     (gripper, enable_movement, sample.valid))
+            t_1 = time.perf_counter_ns()
+            if required == True:
+                glove['sequence'] += 1
+                socket.send_string(glove['topic'], zmq.SNDMORE)
+                socket.send(Message.Encode(glove['id'], glove['sequence'], sample.sequence, sample.timestamp, glove['sensor_position'], 
+                                           sample.fingers_bend, gripper, enable_movement, False, sample.valid))
+                t_send += time.perf_counter_ns() - t_1
+            t_policy += t_1 - t_0
         
+        if CALIBRATION is None:
+            if keyboard.is_pressed('c'):
+                CALIBRATION = Calibration.Workspace_Calibration(Parameters.CONST_CALIBRATION_QUANTILES)
+                t_calibration = time.perf_counter()
+                print(f'[INFO] Calibration: Sweep the hand through the whole workspace ({Parameters.CONST_CALIBRATION_TIME} s).')
+        else:
+            # Each sample of the glove is added once.
+            sample = P5_cls.Get_Sample(Parameters.CONST_P5_GLOVE_ID)
+            if sample.valid == True and sample.sequence != calibration_sequence:
+                CALIBRATION.Add(sample.position)
+                calibration_sequence = sample.sequence
+
+            if time.perf_counter() - t_calibration >= Parameters.CONST_CALIBRATION_TIME:
+                if CALIBRATION.Save(Parameters.CONST_CALIBRATION_FILE_PATH) == True:
+                    print('[INFO] Restart the subscribers to use the calibrated workspace.')
+                CALIBRATION = None
+
+        if GESTURE_CALIBRATION is None:
+            if keyboard.is_pressed('g'):
+                GESTURE_CALIBRATION = Calibration.Gesture_Calibration(gesture_names)
+                t_gesture_calibration = time.perf_counter(); gesture_index = 0
+                print(f'[INFO] Gesture calibration: Form and hold the gesture {gesture_names[gesture_index]} ({sum(Parameters.CONST_GESTURE_CALIBRATION_TIME)} s).')
+        else:
+            # Each sample of the glove is added once (after the time to form the gesture).
+            t = time.perf_counter() - t_gesture_calibration
+            sample = P5_cls.Get_Sample(Parameters.CONST_P5_GLOVE_ID)
+            if t >= Parameters.CONST_GESTURE_CALIBRATION_TIME[0] and sample.sequence != gesture_sequence:
+                GESTURE_CALIBRATION.Add(gesture_names[gesture_index], sample.fingers_bend)
+                gesture_sequence = sample.sequence
+
+            if t >= sum(Parameters.CONST_GESTURE_CALIBRATION_TIME):
+                gesture_index += 1; t_gesture_calibration = time.perf_counter()
+                if gesture_index < len(gesture_names):
+                    print(f'[INFO] Gesture calibration: Form and hold the gesture {gesture_names[gesture_index]} ({sum(Parameters.CONST_GESTURE_CALIBRATION_TIME)} s).')
+                else:
+                    if GESTURE_CALIBRATION.Save(Parameters.CONST_GESTURE_CALIBRATION_FILE_PATH) == True:
+                        for glove in gloves:
+                            GESTURE_CALIBRATION.Apply(P5_cls.Get_Gesture_Classifier(glove['id']))
+                    GESTURE_CALIBRATION = None
+
         if keyboard.is_pressed('q'):
-            socket.send_pyobj([sensor_position[0], sensor_position[1], sensor_position[2], 
-                               False, False,
-                               True])
+            for glove in gloves:
+                glove['sequence'] += 1
+                socket.send_string(glove['topic'], zmq.SNDMORE)
+                socket.send(Message.Encode(glove['id'], glove['sequence'], 0, time.perf_counter(), glove['sensor_position'], [0.0] * 5, 
+                                           False, False,
+                                           True, False))
             break
 
-        # t_{1}: time stop
-        #   t = t_{1} - t_{0}
-        t = time.time() - t_0
-        
-        # Recalculate the time
-        if t < Essential_Reality.CONST_TIME_STEP:
-            time.sleep(Essential_Reality.CONST_TIME_STEP - t)
+        # Wait for the next deadline
+        RATE.Sleep()
+
+    # Savings of the publish policy: Bandwidth (topic + message + 2 bytes of the ZMTP header of each frame) and CPU of the publisher
+    t_run = time.perf_counter() - t_start
+    for glove in gloves:
+        num_of_sent = glove['DEADBAND'].Get_Num_Of_Sent(); num_of_suppressed = glove['DEADBAND'].Get_Num_Of_Suppressed()
+        size = len(glove['topic']) + Message.CONST_MESSAGE_SIZE + 4
+        print(f'[INFO] Topic: {glove["topic"]}, Messages: Sent: {num_of_sent}, Suppressed: {num_of_suppressed} '
+              f'({100.0 * num_of_suppressed / max(num_of_sent + num_of_suppressed, 1):0.1f} %), '
+              f'Bandwidth: {num_of_sent * size / t_run:0.0f} B/s (saved: {num_of_suppressed * size / t_run:0.0f} B/s)')
+    num_of_sent = sum(glove['DEADBAND'].Get_Num_Of_Sent() for glove in gloves); num_of_suppressed = sum(glove['DEADBAND'].Get_Num_Of_Suppressed() for glove in gloves)
+    print(f'[INFO] Publish CPU: Policy: {t_policy / 1e3 / max(num_of_sent + num_of_suppressed, 1):0.2f} us per tick, '
+          f'Send: {t_send / 1e3 / max(num_of_sent, 1):0.2f} us per message (saved: {t_send / 1e9 / max(num_of_sent, 1) * num_of_suppressed:0.3f} s in {t_run:0.1f} s)')
 
     print('[INFO] Disconnect: Socket')
     # Note:
@@ -119,6 +224,8 @@ def Main_Control(P5_cls):
     time.sleep(1)
     P5_cls.Disconnect()
     print('[INFO] Disconnect: Essential P5 Glove')
+    # Statistics of the loops (acquisition, publisher)
+    Scheduler.Dump_Statistics('P5_Publisher')
     print('[INFO] Press the keyboard shortcut Ctrl+c.')
     # Exit from Python.
     sys.exit(1)
@@ -127,7 +234,8 @@ def main():
     try: 
         # Initialization of the Class (Essential Reality P5 Glove)
         #   'P5DLL.dll' - must be in the same folder
-        P5_G = Essential_Reality.P5_Glove('P5DLL.dll')
+        #   Note: The backend (P5 glove or simulation) is selected by the CONST_P5_BACKEND parameter.
+        P5_G = Essential_Reality.Create_P5_Glove('P5DLL.dll')
 
         # Thread initialization:
         #   Main Control:
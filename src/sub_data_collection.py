@@ -37,6 +37,16 @@ import os
 import threading
 # Lib.Parameters (Main Control Parameters)
 import Lib.Parameters as Parameters
+# Lib.Scheduler (Scheduler of the periodic loops)
+import Lib.Scheduler as Scheduler
+# Lib.Transport.Message (Binary wire format of the glove messages)
+import Lib.Transport.Message as Message
+# Lib.Transport.Subscriber (Receiver of the glove messages)
+import Lib.Transport.Subscriber as Subscriber
+# Lib.Transport.Deadband (Publish policy of the glove messages)
+import Lib.Transport.Deadband as Deadband
+# Lib.Transport.Endpoint (Endpoints of the glove messages)
+import Lib.Transport.Endpoint as Endpoint
 # Lib.Signal.Filter (Filters: SMA, BLP)
 import Lib.Signal.Filter as Filter
 # ZeroMQ (Universal messaging library) [pip install zmq]
@@ -49,71 +59,86 @@ def Data_Stream(SAVE_FILE):
     #   Create a Socket associated with this Context.
     socket = context.socket(zmq.SUB)
     #   Set socket options with a unicode object.
-    socket.setsockopt_string(zmq.SUBSCRIBE,'')
-    #   Connect to a remote socket.
-    socket.connect('epgm://127.0.0.1:2224')
-
-    SMA = []; BLP = []; BLPMA = []
-    # Initialization of filters for each part.
-    for _, limit in enumerate(Parameters.CONST_FILTER_POS_LIMIT):
-        # Simple Moving Average (SMA)
-        SMA.append(Filter.Simple_Moving_Average([limit[0], limit[1]], Parameters.CONST_FILTER_POS_NUM_OF_DATA))
-        # Butterworth Low Pass (BLP)
-        BLP.append(Filter.Butterworth_Low_Pass([limit[0], limit[1]], Parameters.CONST_FILTER_POS_NUM_OF_DATA, 1/Parameters.CONST_TIME_STEP, 2.5, 3))
-        # Butterworth Low Pass Moving Average (BLPMA)
-        BLPMA.append(Filter.Butterworth_Low_Pass_Moving_Average([limit[0], limit[1]], Parameters.CONST_FILTER_POS_NUM_OF_DATA, 50, 1/Parameters.CONST_TIME_STEP, 2.5, 3))
+    #       Note: Only the messages of one glove (topic: Parameters.CONST_P5_TOPIC + id).
+    socket.setsockopt_string(zmq.SUBSCRIBE, f'{Parameters.CONST_P5_TOPIC}{Parameters.CONST_P5_GLOVE_ID:02d}')
+    #   Connect to the endpoint of the process (CONST_SUBSCRIBER_ENDPOINT: tcp, ipc, inproc, multicast).
+    if Endpoint.Connect(socket, Parameters.CONST_SUBSCRIBER_ENDPOINT['sub_data_collection']) == False:
+        socket.close()
+        context.term()
+        # Exit from Python.
+        sys.exit(1)
+    #   Receiver of the glove messages: All messages in order (QUEUE mode)
+    #       Note: The samples suppressed by the publisher (DEADBAND policy) are reconstructed (the last values are held).
+    SUBSCRIBER = Subscriber.Glove_Subscriber(socket, Subscriber.CONST_SUBSCRIBER_MODE_QUEUE, Parameters.CONST_SUBSCRIBER_MAX_AGE, 
+                                             Parameters.CONST_TIME_STEP if Parameters.CONST_PUBLISH_POLICY == Deadband.CONST_PUBLISH_POLICY_DEADBAND else None)
+
+    # Initialization of the filter banks for all parts {X, Y, Z}.
+    #   Simple Moving Average (SMA)
+    SMA   = Filter.Filter_Bank(Filter.CONST_FILTER_TYPE_SMA, Parameters.CONST_FILTER_POS_LIMIT, Parameters.CONST_FILTER_POS_NUM_OF_DATA)
+    #   Butterworth Low Pass (BLP)
+    BLP   = Filter.Filter_Bank(Filter.CONST_FILTER_TYPE_BLP, Parameters.CONST_FILTER_POS_LIMIT, Parameters.CONST_FILTER_POS_NUM_OF_DATA, 
+                               frq_s = 1/Parameters.CONST_TIME_STEP, frq_c = 2.5, order = 3)
+    #   Butterworth Low Pass Moving Average (BLPMA)
+    BLPMA = Filter.Filter_Bank(Filter.CONST_FILTER_TYPE_BLPMA, Parameters.CONST_FILTER_POS_LIMIT, Parameters.CONST_FILTER_POS_NUM_OF_DATA, 50, 1/Parameters.CONST_TIME_STEP, 2.5, 3)
     
     # Initialization of the parameters:
     #   Receive message
-    pub_msg = [0.0, 0.0, 0.0, False, False, False]
+    pub_msg = Message.CONST_MESSAGE_EMPTY
     #   File: Raw Data, Filter Data (1, 2, 3)
     x_data_rt = []; x_data_f1_rt = []; x_data_f2_rt = []; x_data_f3_rt = []
     y_data_rt = []; y_data_f1_rt = []; y_data_f2_rt = []; y_data_f3_rt = []
     z_data_rt = []; z_data_f1_rt = []; z_data_f2_rt = []; z_data_f3_rt = []
 
-    while pub_msg[5] != True:
+    # Scheduler of the loop (absolute deadlines, period: 0.002)
+    RATE = Scheduler.Rate(0.002, name = 'Sub_Data_Collection')
+
+    while pub_msg.quit != True:
         # t_{0}: time start
-        t_0 = time.time()
-
-        # Receive a Python object as a message using pickle to serialize.
-        #   pub_msg: 
-        #       Desired robot position:
-        #           [0]: X - Position
-        #           [1]: Y - Position
-        #           [2]: Z - Position
-        #       Gripper:
-        #           [3]: Gripper State
-        #           [4]: Movement State
-        #           [5]: Quit State
-        pub_msg = socket.recv_pyobj()
-
-        # Actual Data (Raw)
-        x_data_rt.append(pub_msg[0])
-        y_data_rt.append(pub_msg[1])
-        z_data_rt.append(pub_msg[2])
-        # Filtered Data
-        #   SMA
-        x_data_f1_rt.append(SMA[0].Compute(pub_msg[0]))
-        y_data_f1_rt.append(SMA[1].Compute(pub_msg[1]))
-        z_data_f1_rt.append(SMA[2].Compute(pub_msg[2]))
-        #   BLP
-        x_data_f2_rt.append(BLP[0].Compute(pub_msg[0]))
-        y_data_f2_rt.append(BLP[1].Compute(pub_msg[1]))
-        z_data_f2_rt.append(BLP[2].Compute(pub_msg[2]))
-        #   BLPMA
-        x_data_f3_rt.append(BLPMA[0].Compute(pub_msg[0]))
-        y_data_f3_rt.append(BLPMA[1].Compute(pub_msg[1]))
-        z_data_f3_rt.append(BLPMA[2].Compute(pub_msg[2]))         
+        t_0 = time.perf_counter()
+
+        # Wait for the messages (all messages in the queue).
+        #   Note: DEADBAND policy: At most one period of the glove, the reconstructed samples are created in the meantime.
+        for pub_msg in SUBSCRIBER.Receive(int(Parameters.CONST_TIME_STEP * 1000) if Parameters.CONST_PUBLISH_POLICY == Deadband.CONST_PUBLISH_POLICY_DEADBAND 
+                                          else None):
+            # The message in the binary wire format (Lib.Transport.Message).
+            #   pub_msg: 
+            #       Desired robot position: position {X, Y, Z}
+            #       Gripper: gripper, movement, quit (States)
+            #       Tracking: valid (State)
+
+            # Actual Data (Raw)
+            x_data_rt.append(pub_msg.position[0])
+            y_data_rt.append(pub_msg.position[1])
+            z_data_rt.append(pub_msg.position[2])
+            # Filtered Data
+            #   SMA
+            data_filtered = SMA.Compute(pub_msg.position)
+            x_data_f1_rt.append(data_filtered[0])
+            y_data_f1_rt.append(data_filtered[1])
+            z_data_f1_rt.append(data_filtered[2])
+            #   BLP
+            data_filtered = BLP.Compute(pub_msg.position)
+            x_data_f2_rt.append(data_filtered[0])
+            y_data_f2_rt.append(data_filtered[1])
+            z_data_f2_rt.append(data_filtered[2])
+            #   BLPMA
+            data_filtered = BLPMA.Compute(pub_msg.position)
+            x_data_f3_rt.append(data_filtered[0])
+            y_data_f3_rt.append(data_filtered[1])
+            z_data_f3_rt.append(data_filtered[2])
+
         # t_{1}: time stop
         #   t = t_{1} - t_{0}
-        t = time.time() - t_0
+        t = time.perf_counter() - t_0
 
         # Writing data to the console (Desired robot position)
         print(f'[Time:{t:0.03f}]')
 
-        # Recalculate the time
-        if t < 0.002:
-            time.sleep(0.002 - t)
+        # Wait for the next deadline
+        RATE.Sleep()
+
+    # Statistics of the loop (period, work time, jitter)
+    Scheduler.Dump_Statistics('Sub_Data_Collection')
 
     print('[INFO] Disconnect: Socket')
     # Note:
@@ -29,14 +29,34 @@ File Name: sub_ur_ctrl.py
 import sys
 # Time (Time access and conversions)
 import time
+# OS (Operating system interfaces)
+import os
 # Threading (Thread-based parallelism)
 import threading
+# Queue (A synchronized queue class)
+import queue
 # Numpy (Array computing) [pip3 install numpy]
 import numpy as np
 # Lib.Parameters (Main Control Parameters)
 import Lib.Parameters as Parameters
+# Lib.Scheduler (Scheduler of the periodic loops)
+import Lib.Scheduler as Scheduler
+# Lib.Transport.Message (Binary wire format of the glove messages)
+import Lib.Transport.Message as Message
+# Lib.Transport.Subscriber (Receiver of the glove messages)
+import Lib.Transport.Subscriber as Subscriber
+# Lib.Transport.Deadband (Publish policy of the glove messages)
+import Lib.Transport.Deadband as Deadband
+# Lib.Transport.Endpoint (Endpoints of the glove messages)
+import Lib.Transport.Endpoint as Endpoint
+# Lib.Transport.Trace (Latency tracing)
+import Lib.Transport.Trace as Trace
+# Lib.P5.Calibration (Calibration of the workspace)
+import Lib.P5.Calibration as Calibration
 # Lib.Signal.Filter (Filters: SMA, BLP)
 import Lib.Signal.Filter as Filter
+# Lib.Signal.Interpolation (Setpoint rate conversion)
+import Lib.Signal.Interpolation as Interpolation
 # RTDE Control interface (Universal Robots) [pip install ur-rtde]
 import rtde_control
 #   Note: https://sdurobotics.gitlab.io/ur_rtde/guides/guides.html
@@ -66,16 +86,80 @@ CONST_SERVOJ_GAIN           = 100
 #       UR-cb Version: 125 Hz -> 8 ms 
 #       UR-e Version: 500 Hz -> 2 ms
 CONST_SEVOJ_DT = 0.002
+#   Setpoint rate conversion (Glove: CONST_TIME_STEP -> Robot: CONST_SEVOJ_DT)
+#       Mode: Interpolation.CONST_SETPOINT_MODE_{INTERPOLATE, EXTRAPOLATE}
+CONST_SETPOINT_MODE = Interpolation.CONST_SETPOINT_MODE_EXTRAPOLATE
+#       Maximum extrapolation time in seconds (two glove periods)
+CONST_SETPOINT_MAX_EXTRAPOLATION = 2 * Parameters.CONST_TIME_STEP
+#   Sensor Workspace: Calibrated (pub_p5_glove_stream.py: button (c)) or the default one
+CONST_SENSOR_POS_WORKSPACE = Calibration.Load_Workspace(Parameters.CONST_CALIBRATION_FILE_PATH, Parameters.CONST_SENSOR_POS_WORKSPACE)
 #   Sensor Factor: Conversion between sensor and robot workspace
-CONST_SENSOR_FACTOR = [(Parameters.CONST_UR_WORKSPACE[0] / (np.abs(Parameters.CONST_SENSOR_POS_WORKSPACE[0][0] - Parameters.CONST_SENSOR_POS_WORKSPACE[0][1]))),
-                       (Parameters.CONST_UR_WORKSPACE[1] / (np.abs(Parameters.CONST_SENSOR_POS_WORKSPACE[1][0] - Parameters.CONST_SENSOR_POS_WORKSPACE[1][1]))),
-                       (Parameters.CONST_UR_WORKSPACE[2] / (np.abs(Parameters.CONST_SENSOR_POS_WORKSPACE[2][0] - Parameters.CONST_SENSOR_POS_WORKSPACE[2][1])))]
+CONST_SENSOR_FACTOR = [(Parameters.CONST_UR_WORKSPACE[0] / (np.abs(CONST_SENSOR_POS_WORKSPACE[0][0] - CONST_SENSOR_POS_WORKSPACE[0][1]))),
+                       (Parameters.CONST_UR_WORKSPACE[1] / (np.abs(CONST_SENSOR_POS_WORKSPACE[1][0] - CONST_SENSOR_POS_WORKSPACE[1][1]))),
+                       (Parameters.CONST_UR_WORKSPACE[2] / (np.abs(CONST_SENSOR_POS_WORKSPACE[2][0] - CONST_SENSOR_POS_WORKSPACE[2][1])))]
 #   Sensor Offset: Positive and negative sensor direction
-CONST_SENSOR_POS_OFFSET = [np.sum(Parameters.CONST_SENSOR_POS_WORKSPACE[0])/2, 
-                           np.sum(Parameters.CONST_SENSOR_POS_WORKSPACE[1])/2, 
-                           np.sum(Parameters.CONST_SENSOR_POS_WORKSPACE[2])/2]
+CONST_SENSOR_POS_OFFSET = [np.sum(CONST_SENSOR_POS_WORKSPACE[0])/2, 
+                           np.sum(CONST_SENSOR_POS_WORKSPACE[1])/2, 
+                           np.sum(CONST_SENSOR_POS_WORKSPACE[2])/2]
 #   Direction of movement: 1.0 (Default), -1.0 (Inverse)
 CONST_MOVEMENT_DIRECTION = [-1.0, -1.0, 1.0]
+#   Snapshot of the filter state (Hot restart of the controller)
+#       File path, period of the snapshot in seconds and the maximum age of the snapshot at startup in seconds
+CONST_FILTER_STATE_FILE_PATH = 'Filter_State.bin'
+CONST_FILTER_STATE_PERIOD    = 1.0
+CONST_FILTER_STATE_MAX_AGE   = 5.0
+
+def Save_Filter_State(blob, file_path):
+    """
+    Description:
+        Function to save the state of the filter to a file. The file is replaced atomically, so a restarted 
+        controller never reads a partially written snapshot.
+
+    Args:
+        (1) blob [Bytes]: Binary blob of the state (Filter_Bank.Get_State).
+        (2) file_path [String]: File path.
+    """
+
+    with open(file_path + '.tmp', 'wb') as f:
+        f.write(blob)
+    os.replace(file_path + '.tmp', file_path)
+
+def Filter_State_Writer(blob_queue, file_path):
+    """
+    Description:
+        Function (thread) to save the snapshots of the filter state from the queue, so the disk I/O is not 
+        part of the servo loop. The thread ends with the None item.
+
+    Args:
+        (1) blob_queue [Queue]: Binary blobs of the state.
+        (2) file_path [String]: File path.
+    """
+
+    while True:
+        blob = blob_queue.get()
+        if blob is None:
+            break
+        Save_Filter_State(blob, file_path)
+
+def Load_Filter_State(FILTER, file_path, max_age):
+    """
+    Description:
+        Function to load the state of the filter from a file, if the snapshot is not older than {max_age} seconds.
+
+    Args:
+        (1) FILTER [Filter_Bank]: Filter.
+        (2) file_path [String]: File path.
+        (3) max_age [Float]: Maximum age of the snapshot in seconds.
+
+    Returns:
+        (1) parameter [Bool]: The state has been successfully loaded.
+    """
+
+    if not os.path.isfile(file_path) or time.time() - os.path.getmtime(file_path) > max_age:
+        return False
+
+    with open(file_path, 'rb') as f:
+        return FILTER.Set_State(f.read())
 
 def Data_Stream(UR_CTRL, ROBOTIQ_CTRL):
     # Initiation of the process (Subscriber: Client)
@@ -84,15 +168,44 @@ def Data_Stream(UR_CTRL, ROBOTIQ_CTRL):
     #   Create a Socket associated with this Context.
     socket = context.socket(zmq.SUB)
     #   Set socket options with a unicode object.
-    socket.setsockopt_string(zmq.SUBSCRIBE,'')
-    #   Connect to a remote socket.
-    socket.connect('tcp://127.0.0.1:2224')
+    #       Note: Only the messages of one glove (topic: Parameters.CONST_P5_TOPIC + id).
+    socket.setsockopt_string(zmq.SUBSCRIBE, f'{Parameters.CONST_P5_TOPIC}{Parameters.CONST_P5_GLOVE_ID:02d}')
+    #   Connect to the endpoint of the process (CONST_SUBSCRIBER_ENDPOINT: tcp, ipc, inproc, multicast).
+    if Endpoint.Connect(socket, Parameters.CONST_SUBSCRIBER_ENDPOINT['sub_ur_ctrl']) == False:
+        socket.close()
+        context.term()
+        # Exit from Python.
+        sys.exit(1)
+    #   Receiver of the glove messages
+    #       Note: In the LATEST mode, a backlog of the messages (e.g. a stall of the loop) is skipped and the robot 
+    #             does not move to a sample older than CONST_SUBSCRIBER_MAX_AGE.
+    #       Note: The samples suppressed by the publisher (DEADBAND policy) are reconstructed (the last values are held).
+    SUBSCRIBER = Subscriber.Glove_Subscriber(socket, Parameters.CONST_SUBSCRIBER_MODE, Parameters.CONST_SUBSCRIBER_MAX_AGE, 
+                                             Parameters.CONST_TIME_STEP if Parameters.CONST_PUBLISH_POLICY == Deadband.CONST_PUBLISH_POLICY_DEADBAND else None)
     
-    BLPMA = []
-    # Initialization of filters for each part.
-    for _, limit in enumerate(Parameters.CONST_FILTER_POS_LIMIT):
-        # Butterworth Low Pass Moving Average (BLPMA)
-        BLPMA.append(Filter.Butterworth_Low_Pass_Moving_Average([limit[0], limit[1]], Parameters.CONST_FILTER_POS_NUM_OF_DATA, 20, 1/Parameters.CONST_TIME_STEP, 1.95, 3))
+    # Initialization of the filter bank for all parts {X, Y, Z}.
+    #   Note: The type of the filter is selected by the CONST_FILTER_POS_TYPE parameter (Default: BLPMA).
+    FILTER_POS = Filter.Filter_Bank(Filter.CONST_FILTER_TYPE_NAME[Parameters.CONST_FILTER_POS_TYPE], CONST_SENSOR_POS_WORKSPACE, 
+                                    Parameters.CONST_FILTER_POS_NUM_OF_DATA, Parameters.CONST_FILTER_POS_NUM_OF_DATA_AVG, 1/Parameters.CONST_TIME_STEP, 
+                                    Parameters.CONST_FILTER_POS_FRQ_C, Parameters.CONST_FILTER_POS_ORDER, 
+                                    min_cutoff = Parameters.CONST_FILTER_POS_ONE_EURO[0], beta = Parameters.CONST_FILTER_POS_ONE_EURO[1], 
+                                    d_cutoff = Parameters.CONST_FILTER_POS_ONE_EURO[2], process_noise = Parameters.CONST_FILTER_POS_KALMAN[0], 
+                                    measurement_noise = Parameters.CONST_FILTER_POS_KALMAN[1], warm_start = True, 
+                                    outlier = Parameters.CONST_FILTER_POS_OUTLIER)
+    
+    # Hot restart: The state of the filter is restored from the last snapshot, otherwise the filter is seeded from the first sample (warm start).
+    if Load_Filter_State(FILTER_POS, CONST_FILTER_STATE_FILE_PATH, CONST_FILTER_STATE_MAX_AGE) == True:
+        print('[INFO] The state of the filter has been restored.')
+    t_filter_state = time.time()
+    #   The snapshots are written by a background thread (only the serialization runs in the servo loop).
+    #       Note: One snapshot in the queue, a new snapshot is dropped while the previous one is being written.
+    filter_state_queue = queue.Queue(maxsize = 1)
+    t_filter_state_writer = threading.Thread(target=Filter_State_Writer, args=(filter_state_queue, CONST_FILTER_STATE_FILE_PATH, ), daemon=True)
+    t_filter_state_writer.start()
+
+    # Initialization of the setpoint stage: A new setpoint on every servo tick from the latest glove samples.
+    #   Note: The interpolation delay is one glove period.
+    SETPOINT = Interpolation.Setpoint_Interpolator(CONST_SETPOINT_MODE, CONST_SETPOINT_MAX_EXTRAPOLATION, Parameters.CONST_TIME_STEP)
 
     # Initialization Target (Position, Orientation, Parameters)
     #   Note: Convert data from mm to m.
@@ -105,70 +218,143 @@ def Data_Stream(UR_CTRL, ROBOTIQ_CTRL):
 
     # Initialization of the parameters:
     #   Receive message
-    pub_msg = [0.0, 0.0, 0.0, False, False, False]
+    pub_msg = Message.CONST_MESSAGE_EMPTY
     #   Reset P5 Glove (Sensor) Position
     robot_position  = [0.0] * len(Parameters.CONST_UR_CARTES_POS_HOME)
     sensor_position = [0.0] * len(Parameters.CONST_UR_CARTES_POS_HOME)
     #   Gripper status information: Open / Closed
     gripper_closed = False
     gripper_open   = False
+    #   Number of the invalid glove samples (IR tracking loss)
+    num_of_invalid = 0
+    #   Number of the servo ticks without the movement (stale glove sample)
+    num_of_stale = 0
+    #   Latency of the stages from the glove sample to the servo command (receive, filter, mapping, servo, end-to-end)
+    TRACE = Trace.Latency_Trace('UR_Control'); t_trace = time.perf_counter(); trace_sequence = -1
     
-    while pub_msg[5] != True:
+    # Scheduler of the loop (absolute deadlines, period: CONST_SEVOJ_DT)
+    RATE = Scheduler.Rate(CONST_SEVOJ_DT, name = 'UR_Control')
+
+    while pub_msg.quit != True:
         # t_{0}: time start
-        t_0 = time.time()
-
-        # Receive a Python object as a message using pickle to serialize.
-        #   pub_msg: 
-        #       Desired robot position:
-        #           [0]: X - Position
-        #           [1]: Y - Position
-        #           [2]: Z - Position
-        #       Gripper:
-        #           [3]: Gripper State
-        #           [4]: Movement State
-        #           [5]: Quit State
-        pub_msg = socket.recv_pyobj()
-        
-        # Recalculating the sensor position
-        sensor_position = [((BLPMA[0].Compute(pub_msg[0]) + CONST_SENSOR_POS_OFFSET[0]) * CONST_SENSOR_FACTOR[0]),
-                           ((BLPMA[2].Compute(pub_msg[2]) + CONST_SENSOR_POS_OFFSET[1]) * CONST_SENSOR_FACTOR[1]),
-                           ((BLPMA[1].Compute(pub_msg[1]) + CONST_SENSOR_POS_OFFSET[2]) * CONST_SENSOR_FACTOR[2])]
-
-        # Desired robot position:
-        robot_position = [Parameters.CONST_UR_CARTES_POS_HOME[0] + sensor_position[0]*CONST_MOVEMENT_DIRECTION[0],
-                          Parameters.CONST_UR_CARTES_POS_HOME[1] + sensor_position[1]*CONST_MOVEMENT_DIRECTION[1], 
-                          Parameters.CONST_UR_CARTES_POS_HOME[2] + sensor_position[2]*CONST_MOVEMENT_DIRECTION[2]]
+        t_0 = time.perf_counter()
+
+        # Receive the messages in the queue without blocking the servo loop (QUEUE: all, LATEST: the newest one).
+        #   Note: The glove publishes every CONST_TIME_STEP, so there is no message on every servo tick.
+        for pub_msg in SUBSCRIBER.Receive():
+            # The message in the binary wire format (Lib.Transport.Message).
+            #   pub_msg: 
+            #       Desired robot position: position {X, Y, Z}
+            #       Gripper: gripper, movement, quit (States)
+            #       Tracking: valid (State)
+            if pub_msg.quit == True:
+                break
+
+            # Latency: Acquisition of the glove sample -> processing by the subscriber
+            #   Note: Only the received messages, not the reconstructed samples (the same sequence number of the message).
+            #   Note: The timestamp of the publisher, valid only if the publisher runs on the same machine (tcp://127.0.0.1, ipc, inproc).
+            t_1 = time.perf_counter()
+            if pub_msg.sequence != trace_sequence:
+                TRACE.Add(Trace.CONST_TRACE_STAGE_RECEIVE, t_1 - pub_msg.timestamp)
+                TRACE.Add_Sequence(pub_msg.sample_sequence)
+                trace_sequence = pub_msg.sequence
+
+            # The IR tracking is lost: The sample is not used, the setpoint is extrapolated for a short time 
+            # (CONST_SETPOINT_MAX_EXTRAPOLATION) and then held.
+            if pub_msg.valid != True:
+                num_of_invalid += 1
+                continue
+            
+            # Filtered sensor position {X, Y, Z}
+            #   Note: The filter runs at the sample frequency of the glove.
+            position_filtered = FILTER_POS.Compute(pub_msg.position)
+            t_2 = time.perf_counter()
+            TRACE.Add(Trace.CONST_TRACE_STAGE_FILTER, t_2 - t_1)
+
+            # Recalculating the sensor position
+            sensor_position = [((position_filtered[0] + CONST_SENSOR_POS_OFFSET[0]) * CONST_SENSOR_FACTOR[0]),
+                               ((position_filtered[2] + CONST_SENSOR_POS_OFFSET[1]) * CONST_SENSOR_FACTOR[1]),
+                               ((position_filtered[1] + CONST_SENSOR_POS_OFFSET[2]) * CONST_SENSOR_FACTOR[2])]
+
+            # Desired robot position (glove sample):
+            #   Note: The time of the glove sample on the local clock (the clock of the publisher can be on another host), 
+            #         a backlog received at once keeps the spacing of the publisher.
+            SETPOINT.Add(pub_msg.received, [Parameters.CONST_UR_CARTES_POS_HOME[0] + sensor_position[0]*CONST_MOVEMENT_DIRECTION[0],
+                                            Parameters.CONST_UR_CARTES_POS_HOME[1] + sensor_position[1]*CONST_MOVEMENT_DIRECTION[1], 
+                                            Parameters.CONST_UR_CARTES_POS_HOME[2] + sensor_position[2]*CONST_MOVEMENT_DIRECTION[2]])
+            TRACE.Add(Trace.CONST_TRACE_STAGE_MAPPING, time.perf_counter() - t_2)
+
+        # Snapshot of the filter state (saved by the background thread)
+        if time.time() - t_filter_state >= CONST_FILTER_STATE_PERIOD:
+            try:
+                filter_state_queue.put_nowait(FILTER_POS.Get_State())
+            except queue.Full:
+                pass
+            t_filter_state = time.time()
+
+        # Desired robot position (servo tick): Interpolated / extrapolated from the latest glove samples
+        setpoint = SETPOINT.Get_Value(time.perf_counter())
+        if setpoint is not None:
+            robot_position = setpoint
 
         # Simple condition for gripper control
-        if pub_msg[3] == True and gripper_closed == False:
+        if pub_msg.gripper == True and gripper_closed == False:
             # Closed Gripper
             if ROBOTIQ_CTRL != None:
                 gripper_closed = ROBOTIQ_CTRL.close()
             gripper_open  = False
-        elif pub_msg[3] == False and gripper_open == False:
+        elif pub_msg.gripper == False and gripper_open == False:
             # Open Gripper
             if ROBOTIQ_CTRL != None:
                 gripper_open  = ROBOTIQ_CTRL.open()
             gripper_closed = False
 
+        # Age of the newest glove sample (from the receipt, local clock): The robot does not move to a stale sample.
+        age = SUBSCRIBER.Get_Age()
+        stale = SUBSCRIBER.Is_Stale()
+        if pub_msg.movement == True and stale == True:
+            num_of_stale += 1
+
         # Robot moves depending on the input parameters
-        if pub_msg[4] == True:
+        if pub_msg.movement == True and setpoint is not None and stale == False:
             # Set data to the robot via RTDE
+            t_3 = time.perf_counter()
             UR_CTRL.servoL([np.round(robot_position[0]/1000, 6),np.round(robot_position[1]/1000, 6), np.round(robot_position[2]/1000, 6), 
                             Parameters.CONST_UR_CARTES_ORIENT_HOME[0],  Parameters.CONST_UR_CARTES_ORIENT_HOME[1], Parameters.CONST_UR_CARTES_ORIENT_HOME[2]], 
                             CONST_ROBOT_VELOCITY, CONST_ROBOT_ACCELERATION, CONST_SEVOJ_DT, 
                             CONST_SERVOJ_LOOKAHEAD_TIME, CONST_SERVOJ_GAIN)           
+            # Latency: Servo command, Acquisition of the newest glove sample -> servo command
+            t_4 = time.perf_counter()
+            TRACE.Add(Trace.CONST_TRACE_STAGE_SERVO, t_4 - t_3)
+            TRACE.Add(Trace.CONST_TRACE_STAGE_END_TO_END, t_4 - SUBSCRIBER.Get_Message().timestamp)
 
         # t_{1}: time stop
         #   t = t_{1} - t_{0}
-        t = time.time() - t_0
+        t = time.perf_counter() - t_0
 
         # Writing data to the console (Desired robot position)
-        print(f'[Time:{t:0.03f}, X: {(np.round(robot_position[0]/1000, 6)):0.4f}, Y: {(np.round(robot_position[1]/1000, 6)):0.4f}, Z: {(np.round(robot_position[2]/1000, 6)):0.4f}, Gripper: {pub_msg[3]}]')
+        print(f'[Time:{t:0.03f}, X: {(np.round(robot_position[0]/1000, 6)):0.4f}, Y: {(np.round(robot_position[1]/1000, 6)):0.4f}, Z: {(np.round(robot_position[2]/1000, 6)):0.4f}, Gripper: {pub_msg.gripper}, Age: {(0.0 if age is None else age*1000):0.1f} ms]')
+
+        # Live summary of the latency
+        if time.perf_counter() - t_trace >= Parameters.CONST_TRACE_PRINT_PERIOD:
+            print(f'[INFO] Latency: {TRACE.To_String()}')
+            t_trace = time.perf_counter()
+
+        # Wait for the next deadline
+        RATE.Sleep()
 
-        # Recalculate the time
-        if t < CONST_SEVOJ_DT:
-            time.sleep(CONST_SEVOJ_DT - t)
+    # Last snapshot of the filter state (after the pending one)
+    filter_state_queue.put(None)
+    t_filter_state_writer.join()
+    Save_Filter_State(FILTER_POS.Get_State(), CONST_FILTER_STATE_FILE_PATH)
+    print(f'[INFO] Number of rejected samples (Outlier rejection) {{X, Y, Z}}: {FILTER_POS.Get_Num_Of_Rejected()}')
+    print(f'[INFO] Number of invalid samples (Tracking loss): {num_of_invalid}')
+    print(f'[INFO] Number of messages: Received: {SUBSCRIBER.Get_Num_Of_Received()}, Skipped: {SUBSCRIBER.Get_Num_Of_Skipped()}, '
+          f'Lost: {SUBSCRIBER.Get_Num_Of_Lost()}, Reconstructed: {SUBSCRIBER.Get_Num_Of_Reconstructed()}, Stale servo ticks: {num_of_stale}')
+    # Post-run report of the latency
+    TRACE.Dump('UR_Control_Latency')
+    # Statistics of the loop (period, work time, jitter)
+    Scheduler.Dump_Statistics('UR_Control')
 
     print('[INFO] Disconnect: UR-RTDE')
     time.sleep(1)
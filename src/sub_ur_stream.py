@@ -39,6 +39,18 @@ import threading
 import numpy as np
 # Lib.Parameters (Main Control Parameters)
 import Lib.Parameters as Parameters
+# Lib.Scheduler (Scheduler of the periodic loops)
+import Lib.Scheduler as Scheduler
+# Lib.Transport.Message (Binary wire format of the glove messages)
+import Lib.Transport.Message as Message
+# Lib.Transport.Subscriber (Receiver of the glove messages)
+import Lib.Transport.Subscriber as Subscriber
+# Lib.Transport.Deadband (Publish policy of the glove messages)
+import Lib.Transport.Deadband as Deadband
+# Lib.Transport.Endpoint (Endpoints of the glove messages)
+import Lib.Transport.Endpoint as Endpoint
+# Lib.P5.Calibration (Calibration of the workspace)
+import Lib.P5.Calibration as Calibration
 # Lib.Signal.Filter (Filters: SMA, BLP)
 import Lib.Signal.Filter as Filter
 # RTDE Control interface (Universal Robots) [pip install ur-rtde]
@@ -69,14 +81,16 @@ CONST_SERVOJ_GAIN           = 100
 #       UR-cb Version: 125 Hz -> 8 ms 
 #       UR-e Version: 500 Hz -> 2 ms
 CONST_SEVOJ_DT = 0.002
+#   Sensor Workspace: Calibrated (pub_p5_glove_stream.py: button (c)) or the default one
+CONST_SENSOR_POS_WORKSPACE = Calibration.Load_Workspace(Parameters.CONST_CALIBRATION_FILE_PATH, Parameters.CONST_SENSOR_POS_WORKSPACE)
 #   Sensor Factor: Conversion between sensor and robot workspace
-CONST_SENSOR_FACTOR = [(Parameters.CONST_UR_WORKSPACE[0] / (np.abs(Parameters.CONST_SENSOR_POS_WORKSPACE[0][0] - Parameters.CONST_SENSOR_POS_WORKSPACE[0][1]))),
-                       (Parameters.CONST_UR_WORKSPACE[1] / (np.abs(Parameters.CONST_SENSOR_POS_WORKSPACE[1][0] - Parameters.CONST_SENSOR_POS_WORKSPACE[1][1]))),
-                       (Parameters.CONST_UR_WORKSPACE[2] / (np.abs(Parameters.CONST_SENSOR_POS_WORKSPACE[2][0] - Parameters.CONST_SENSOR_POS_WORKSPACE[2][1])))]
+CONST_SENSOR_FACTOR = [(Parameters.CONST_UR_WORKSPACE[0] / (np.abs(CONST_SENSOR_POS_WORKSPACE[0][0] - CONST_SENSOR_POS_WORKSPACE[0][1]))),
+                       (Parameters.CONST_UR_WORKSPACE[1] / (np.abs(CONST_SENSOR_POS_WORKSPACE[1][0] - CONST_SENSOR_POS_WORKSPACE[1][1]))),
+                       (Parameters.CONST_UR_WORKSPACE[2] / (np.abs(CONST_SENSOR_POS_WORKSPACE[2][0] - CONST_SENSOR_POS_WORKSPACE[2][1])))]
 #   Sensor Offset: Positive and negative sensor direction
-CONST_SENSOR_POS_OFFSET = [np.sum(Parameters.CONST_SENSOR_POS_WORKSPACE[0])/2, 
-                           np.sum(Parameters.CONST_SENSOR_POS_WORKSPACE[1])/2, 
-                           np.sum(Parameters.CONST_SENSOR_POS_WORKSPACE[2])/2]
+CONST_SENSOR_POS_OFFSET = [np.sum(CONST_SENSOR_POS_WORKSPACE[0])/2, 
+                           np.sum(CONST_SENSOR_POS_WORKSPACE[1])/2, 
+                           np.sum(CONST_SENSOR_POS_WORKSPACE[2])/2]
 #   Direction of movement: 1.0 (Default), -1.0 (Inverse)
 CONST_MOVEMENT_DIRECTION = [-1.0, -1.0, 1.0]
 
@@ -87,15 +101,29 @@ def Data_Stream(UR_CTRL, UR_STREAM):
     #   Create a Socket associated with this Context.
     socket = context.socket(zmq.SUB)
     #   Set socket options with a unicode object.
-    socket.setsockopt_string(zmq.SUBSCRIBE,'')
-    #   Connect to a remote socket.
-    socket.connect('tcp://127.0.0.1:2224')
-
-    BLPMA = []
-    # Initialization of filters for each part.
-    for _, limit in enumerate(Parameters.CONST_FILTER_POS_LIMIT):
-        # Butterworth Low Pass Moving Average (BLPMA)
-        BLPMA.append(Filter.Butterworth_Low_Pass_Moving_Average([limit[0], limit[1]], Parameters.CONST_FILTER_POS_NUM_OF_DATA, 20, 1/Parameters.CONST_TIME_STEP, 1.95, 3))
+    #       Note: Only the messages of one glove (topic: Parameters.CONST_P5_TOPIC + id).
+    socket.setsockopt_string(zmq.SUBSCRIBE, f'{Parameters.CONST_P5_TOPIC}{Parameters.CONST_P5_GLOVE_ID:02d}')
+    #   Connect to the endpoint of the process (CONST_SUBSCRIBER_ENDPOINT: tcp, ipc, inproc, multicast).
+    if Endpoint.Connect(socket, Parameters.CONST_SUBSCRIBER_ENDPOINT['sub_ur_stream']) == False:
+        socket.close()
+        context.term()
+        # Exit from Python.
+        sys.exit(1)
+    #   Receiver of the glove messages
+    #       Note: In the LATEST mode, a backlog of the messages (e.g. a stall of the loop) is skipped and the robot 
+    #             does not move to a sample older than CONST_SUBSCRIBER_MAX_AGE.
+    #       Note: The samples suppressed by the publisher (DEADBAND policy) are reconstructed (the last values are held).
+    SUBSCRIBER = Subscriber.Glove_Subscriber(socket, Parameters.CONST_SUBSCRIBER_MODE, Parameters.CONST_SUBSCRIBER_MAX_AGE, 
+                                             Parameters.CONST_TIME_STEP if Parameters.CONST_PUBLISH_POLICY == Deadband.CONST_PUBLISH_POLICY_DEADBAND else None)
+
+    # Initialization of the filter bank for all parts {X, Y, Z}.
+    #   Note: The type of the filter is selected by the CONST_FILTER_POS_TYPE parameter (Default: BLPMA).
+    FILTER_POS = Filter.Filter_Bank(Filter.CONST_FILTER_TYPE_NAME[Parameters.CONST_FILTER_POS_TYPE], CONST_SENSOR_POS_WORKSPACE, 
+                                    Parameters.CONST_FILTER_POS_NUM_OF_DATA, Parameters.CONST_FILTER_POS_NUM_OF_DATA_AVG, 1/Parameters.CONST_TIME_STEP, 
+                                    Parameters.CONST_FILTER_POS_FRQ_C, Parameters.CONST_FILTER_POS_ORDER, 
+                                    min_cutoff = Parameters.CONST_FILTER_POS_ONE_EURO[0], beta = Parameters.CONST_FILTER_POS_ONE_EURO[1], 
+                                    d_cutoff = Parameters.CONST_FILTER_POS_ONE_EURO[2], process_noise = Parameters.CONST_FILTER_POS_KALMAN[0], 
+                                    measurement_noise = Parameters.CONST_FILTER_POS_KALMAN[1], outlier = Parameters.CONST_FILTER_POS_OUTLIER)
     
     # Initialization Target (Position, Orientation, Parameters)
     #   Note: Convert data from mm to m.
@@ -108,41 +136,50 @@ def Data_Stream(UR_CTRL, UR_STREAM):
 
     # Initialization of the parameters:
     #   Receive message
-    pub_msg = [0.0, 0.0, 0.0, False, False, False]
+    pub_msg = Message.CONST_MESSAGE_EMPTY
     #   Reset P5 Glove (Sensor) Position
-    robot_position  = [0.0] * len(Parameters.CONST_UR_CARTES_POS_HOME)
+    #       Note: The robot holds the home position until the first valid sample.
+    robot_position  = list(Parameters.CONST_UR_CARTES_POS_HOME)
     sensor_position = [0.0] * len(Parameters.CONST_UR_CARTES_POS_HOME)
+    #   Number of the servo ticks without the movement (stale glove sample)
+    num_of_stale = 0
 
     # Initialization of the Robot Cartesian positions vector
     x_rob_cartesian_position_rt = []; y_rob_cartesian_position_rt = []; z_rob_cartesian_position_rt = []
     # Initialization of the Sensor positions vector
     x_sensor_position_rt = []; y_sensor_position_rt = []; z_sensor_position_rt = []
 
-    while pub_msg[5] != True:
+    # Scheduler of the loop (absolute deadlines, period: CONST_SEVOJ_DT)
+    RATE = Scheduler.Rate(CONST_SEVOJ_DT, name = 'UR_Stream')
+
+    while pub_msg.quit != True:
         # t_{0}: time start
-        t_0 = time.time()
-
-        # Receive a Python object as a message using pickle to serialize.
-        #   pub_msg: 
-        #       Desired robot position:
-        #           [0]: X - Position
-        #           [1]: Y - Position
-        #           [2]: Z - Position
-        #       Gripper:
-        #           [3]: Gripper State
-        #           [4]: Movement State
-        #           [5]: Quit State
-        pub_msg = socket.recv_pyobj()
-
-        # Recalculating the sensor position
-        sensor_position = [((BLPMA[0].Compute(pub_msg[0]) + CONST_SENSOR_POS_OFFSET[0]) * CONST_SENSOR_FACTOR[0]),
-                           ((BLPMA[2].Compute(pub_msg[2]) + CONST_SENSOR_POS_OFFSET[1]) * CONST_SENSOR_FACTOR[1]),
-                           ((BLPMA[1].Compute(pub_msg[1]) + CONST_SENSOR_POS_OFFSET[2]) * CONST_SENSOR_FACTOR[2])]
-
-        # Desired robot position:
-        robot_position = [Parameters.CONST_UR_CARTES_POS_HOME[0] + sensor_position[0]*CONST_MOVEMENT_DIRECTION[0],
-                          Parameters.CONST_UR_CARTES_POS_HOME[1] + sensor_position[1]*CONST_MOVEMENT_DIRECTION[1], 
-                          Parameters.CONST_UR_CARTES_POS_HOME[2] + sensor_position[2]*CONST_MOVEMENT_DIRECTION[2]]
+        t_0 = time.perf_counter()
+
+        # Wait for the messages (QUEUE: all messages in the queue, LATEST: the newest one).
+        #   Note: DEADBAND policy: At most one period of the glove, the reconstructed samples are created in the meantime.
+        for pub_msg in SUBSCRIBER.Receive(int(Parameters.CONST_TIME_STEP * 1000) if Parameters.CONST_PUBLISH_POLICY == Deadband.CONST_PUBLISH_POLICY_DEADBAND 
+                                          else None):
+            # The message in the binary wire format (Lib.Transport.Message).
+            #   pub_msg: 
+            #       Desired robot position: position {X, Y, Z}
+            #       Gripper: gripper, movement, quit (States)
+            #       Tracking: valid (State)
+
+            # The IR tracking is lost: The robot holds the last desired position.
+            if pub_msg.valid == True:
+                # Filtered sensor position {X, Y, Z}
+                position_filtered = FILTER_POS.Compute(pub_msg.position)
+
+                # Recalculating the sensor position
+                sensor_position = [((position_filtered[0] + CONST_SENSOR_POS_OFFSET[0]) * CONST_SENSOR_FACTOR[0]),
+                                   ((position_filtered[2] + CONST_SENSOR_POS_OFFSET[1]) * CONST_SENSOR_FACTOR[1]),
+                                   ((position_filtered[1] + CONST_SENSOR_POS_OFFSET[2]) * CONST_SENSOR_FACTOR[2])]
+
+                # Desired robot position:
+                robot_position = [Parameters.CONST_UR_CARTES_POS_HOME[0] + sensor_position[0]*CONST_MOVEMENT_DIRECTION[0],
+                                  Parameters.CONST_UR_CARTES_POS_HOME[1] + sensor_position[1]*CONST_MOVEMENT_DIRECTION[1], 
+                                  Parameters.CONST_UR_CARTES_POS_HOME[2] + sensor_position[2]*CONST_MOVEMENT_DIRECTION[2]]
 
         # Get data fromt the robot via RTDE
         stream_cartesian_position = UR_STREAM.getActualTCPPose()
@@ -158,8 +195,14 @@ def Data_Stream(UR_CTRL, UR_STREAM):
         y_sensor_position_rt.append(np.round(robot_position[1]/1000, 6))
         z_sensor_position_rt.append(np.round(robot_position[2]/1000, 6))
 
+        # Age of the newest glove sample (from the receipt, local clock): The robot does not move to a stale sample.
+        age = SUBSCRIBER.Get_Age()
+        stale = SUBSCRIBER.Is_Stale()
+        if pub_msg.movement == True and stale == True:
+            num_of_stale += 1
+
         # Robot moves depending on the input parameters
-        if pub_msg[4] == True:
+        if pub_msg.movement == True and stale == False:
             # Set data to the robot via RTDE
             UR_CTRL.servoL([np.round(robot_position[0]/1000, 6),np.round(robot_position[1]/1000, 6), np.round(robot_position[2]/1000, 6), 
                             Parameters.CONST_UR_CARTES_ORIENT_HOME[0],  Parameters.CONST_UR_CARTES_ORIENT_HOME[1], Parameters.CONST_UR_CARTES_ORIENT_HOME[2]], 
@@ -168,14 +211,19 @@ def Data_Stream(UR_CTRL, UR_STREAM):
 
         # t_{1}: time stop
         #   t = t_{1} - t_{0}
-        t = time.time() - t_0
+        t = time.perf_counter() - t_0
 
         # Writing data to the console (Desired robot position)
-        print(f'[Time:{t:0.03f}, X: {(np.round(robot_position[0]/1000, 6)):0.4f}, Y: {(np.round(robot_position[1]/1000, 6)):0.4f}, Z: {(np.round(robot_position[2]/1000, 6)):0.4f}, Gripper: {pub_msg[3]}]')
+        print(f'[Time:{t:0.03f}, X: {(np.round(robot_position[0]/1000, 6)):0.4f}, Y: {(np.round(robot_position[1]/1000, 6)):0.4f}, Z: {(np.round(robot_position[2]/1000, 6)):0.4f}, Gripper: {pub_msg.gripper}, Age: {(0.0 if age is None else age*1000):0.1f} ms]')
+
+        # Wait for the next deadline
+        RATE.Sleep()
+
+    print(f'[INFO] Number of messages: Received: {SUBSCRIBER.Get_Num_Of_Received()}, Skipped: {SUBSCRIBER.Get_Num_Of_Skipped()}, '
+          f'Lost: {SUBSCRIBER.Get_Num_Of_Lost()}, Reconstructed: {SUBSCRIBER.Get_Num_Of_Reconstructed()}, Stale servo ticks: {num_of_stale}')
 
-        # Recalculate the time
-        if t < CONST_SEVOJ_DT:
-            time.sleep(CONST_SEVOJ_DT - t)
+    # Statistics of the loop (period, work time, jitter)
+    Scheduler.Dump_Statistics('UR_Stream')
 
     print('[INFO] Disconnect: UR-RTDE')
     time.sleep(1)
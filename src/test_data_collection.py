@@ -27,8 +27,6 @@ File Name: test_data_collection.py
 
 # System (Default)
 import sys
-# Time (Time access and conversions)
-import time
 # Threading (Thread-based parallelism)
 import threading
 # Numpy (Array computing) [pip3 install numpy]
@@ -37,6 +35,8 @@ import numpy as np
 import Lib.P5.Essential_Reality as Essential_Reality
 # Lib.Utils (Some useful functions)
 import Lib.Utils as Utils
+# Lib.Scheduler (Scheduler of the periodic loops)
+import Lib.Scheduler as Scheduler
 
 # Initialization of Constants:
 #   Universal Robots (UR10e)
@@ -62,19 +62,14 @@ def Test_Stream_T1(P5_cls):
     # Buttons
     #   [A: {P5_cls.Get_Buttons_Value_ID(0)}, B: {P5_cls.Get_Buttons_Value_ID(1)}, C: {P5_cls.Get_Buttons_Value_ID(2)}, D: {P5_cls.Get_Buttons_Value_ID(3)}]
 
-    while P5_cls.error != True:
-        # t_{0}: time start
-        t_0 = time.time()
+    # Scheduler of the loop (absolute deadlines, period: Essential_Reality.CONST_TIME_STEP)
+    RATE = Scheduler.Rate(Essential_Reality.CONST_TIME_STEP)
 
+    while P5_cls.error != True:
         print(f'[X: {P5_cls.Get_Absolute_Position_ID(0)}, Y: {P5_cls.Get_Absolute_Position_ID(1)}, Z: {P5_cls.Get_Absolute_Position_ID(2)}]')
         
-        # t_{1}: time stop
-        #   t = t_{1} - t_{0}
-        t = time.time() - t_0
-        
-        # Recalculate the time
-        if t < Essential_Reality.CONST_TIME_STEP:
-            time.sleep(Essential_Reality.CONST_TIME_STEP - t)
+        # Wait for the next deadline
+        RATE.Sleep()
 
 def Test_Stream_T2(P5_cls):
     # Reset P5 Glove (Sensor) Position
@@ -86,10 +81,10 @@ def Test_Stream_T2(P5_cls):
     #   The edge signal depends on the opening and closing of the hand
     SED_Gripper = Utils.Simple_Edge_Detector()
 
-    while P5_cls.error != True:
-        # t_{0}: time start
-        t_0 = time.time()
+    # Scheduler of the loop (absolute deadlines, period: Essential_Reality.CONST_TIME_STEP)
+    RATE = Scheduler.Rate(Essential_Reality.CONST_TIME_STEP)
 
+    while P5_cls.error != True:
         if SED_Move.Get_Value(P5_cls.Get_Buttons_Value_ID(0)) == True:
             # Robot moves depending on the input parameters
             sensor_position = [(P5_cls.Get_Filtered_Absolute_Position_ID(0) + CONST_SENSOR_POS_OFFSET[0]) * CONST_SENSOR_FACTOR, 
@@ -100,19 +95,15 @@ def Test_Stream_T2(P5_cls):
         # Writing data to the console (Desired robot position)
         print(f'[X: {(P5_cls.Get_Filtered_Absolute_Position_ID(2) + CONST_SENSOR_POS_OFFSET[0]):0.2f}, Y: {(P5_cls.Get_Filtered_Absolute_Position_ID(0) + CONST_SENSOR_POS_OFFSET[1]):0.2f}, Z: {(P5_cls.Get_Filtered_Absolute_Position_ID(1) + CONST_SENSOR_POS_OFFSET[2]):0.2f}, Gripper: {SED_Gripper.Get_Value(P5_cls.Get_Hand_Gesture())}]]')
         
-        # t_{1}: time stop
-        #   t = t_{1} - t_{0}
-        t = time.time() - t_0
-        
-        # Recalculate the time
-        if t < Essential_Reality.CONST_TIME_STEP:
-            time.sleep(Essential_Reality.CONST_TIME_STEP - t)
+        # Wait for the next deadline
+        RATE.Sleep()
 
 def main():
     try: 
         # Initialization of the Class (Essential Reality P5 Glove)
         #   'P5DLL.dll' - must be in the same folder
-        P5_G = Essential_Reality.P5_Glove('P5DLL.dll')
+        #   Note: The backend (P5 glove or simulation) is selected by the CONST_P5_BACKEND parameter.
+        P5_G = Essential_Reality.Create_P5_Glove('P5DLL.dll')
         
         # Thread initialization:
         #   Writing data to the console
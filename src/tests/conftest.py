@@ -0,0 +1,67 @@
+"""
+Tests of the Lib package (pytest).
+
+    Run from the src directory:
+        python -m pytest tests
+
+    Shared fixtures:
+        socket: SUB socket with the glove messages waiting in the queue (Lib.Transport.Subscriber).
+        clock: Local clock of the subscriber set by the test (t = 10 s).
+"""
+
+# System (Default)
+import sys
+# OS (Operating system interfaces)
+import os
+# Time (Time access and conversions)
+import time
+# Pytest (Testing framework) [pip3 install pytest]
+import pytest
+
+# The modules are imported as in the scripts (Lib.*), relative to the src directory.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Lib.Transport.Message (Binary wire format of the glove messages)
+import Lib.Transport.Message as Message
+
+class Fake_Socket(object):
+    """
+    Description:
+        SUB socket with the messages (topic + message) waiting in the queue (poll / recv only).
+    """
+
+    def __init__(self):
+        self.frames = []
+
+    def Send(self, sequence, timestamp = None, position = (0.0, 0.0, 0.0), fingers_bend = (0.0,) * 5, states = (False, True, False, True), 
+             sample_sequence = None):
+        # Note: By default, the glove sample is new and valid (states: gripper, movement, quit, valid).
+        timestamp = time.perf_counter() if timestamp is None else timestamp
+        sample_sequence = sequence if sample_sequence is None else sample_sequence
+        self.frames += [b'P5_GLOVE_00', Message.Encode(0, sequence, sample_sequence, timestamp, position, fingers_bend, *states)]
+
+    def poll(self, timeout = None):
+        return 1 if len(self.frames) != 0 else 0
+
+    def recv(self):
+        return self.frames.pop(0)
+
+class Fake_Clock(object):
+    """
+    Description:
+        Local clock of the subscriber (set by the test).
+    """
+
+    def __init__(self, t = 10.0):
+        self.t = t
+
+    def __call__(self):
+        return self.t
+
+@pytest.fixture
+def socket():
+    return Fake_Socket()
+
+@pytest.fixture
+def clock():
+    return Fake_Clock()
@@ -0,0 +1,80 @@
+"""
+Tests of the publish policy (Lib.Transport.Deadband) and of the reconstruction of the suppressed samples 
+by the subscriber (Lib.Transport.Subscriber).
+"""
+
+# Pytest (Testing framework) [pip3 install pytest]
+import pytest
+# Lib.Transport.Deadband (Publish policy of the glove messages)
+import Lib.Transport.Deadband as Deadband
+# Lib.Transport.Subscriber (Receiver of the glove messages)
+import Lib.Transport.Subscriber as Subscriber
+
+CONST_PERIOD    = 0.004
+CONST_DEADBAND  = [0.05, 1.0]
+CONST_HEARTBEAT = 0.04
+CONST_FINGERS_BEND = (10.0,) * 5
+CONST_STATES       = (False, True, False, True)
+
+def test_always():
+    DEADBAND = Deadband.Deadband(Deadband.CONST_PUBLISH_POLICY_ALWAYS, CONST_DEADBAND, CONST_HEARTBEAT)
+
+    assert all(DEADBAND.Is_Required(i * CONST_PERIOD, (0.0,) * 3, CONST_FINGERS_BEND, CONST_STATES) for i in range(10))
+    assert (DEADBAND.Get_Num_Of_Sent(), DEADBAND.Get_Num_Of_Suppressed()) == (10, 0)
+
+def test_deadband():
+    DEADBAND = Deadband.Deadband(Deadband.CONST_PUBLISH_POLICY_DEADBAND, CONST_DEADBAND, CONST_HEARTBEAT)
+
+    # The first message, a change inside the deadband, a drift (compared with the last sent value), a change of the fingers bend
+    assert DEADBAND.Is_Required(0.000, (0.0, 0.0, 0.0), CONST_FINGERS_BEND, CONST_STATES) == True
+    assert DEADBAND.Is_Required(0.004, (0.03, 0.0, 0.0), CONST_FINGERS_BEND, CONST_STATES) == False
+    assert DEADBAND.Is_Required(0.008, (0.06, 0.0, 0.0), CONST_FINGERS_BEND, CONST_STATES) == True
+    assert DEADBAND.Is_Required(0.012, (0.06, 0.0, 0.0), (12.0,) * 5, CONST_STATES) == True
+    # A change of the states
+    assert DEADBAND.Is_Required(0.016, (0.06, 0.0, 0.0), (12.0,) * 5, (True, True, False, True)) == True
+    # Heartbeat
+    assert DEADBAND.Is_Required(0.020, (0.06, 0.0, 0.0), (12.0,) * 5, (True, True, False, True)) == False
+    assert DEADBAND.Is_Required(0.016 + CONST_HEARTBEAT, (0.06, 0.0, 0.0), (12.0,) * 5, (True, True, False, True)) == True
+    assert (DEADBAND.Get_Num_Of_Sent(), DEADBAND.Get_Num_Of_Suppressed()) == (5, 2)
+
+def test_reconstruction(socket, clock):
+    DEADBAND = Deadband.Deadband(Deadband.CONST_PUBLISH_POLICY_DEADBAND, CONST_DEADBAND, CONST_HEARTBEAT)
+    SUBSCRIBER = Subscriber.Glove_Subscriber(socket, Subscriber.CONST_SUBSCRIBER_MODE_QUEUE, 0.05, CONST_PERIOD, clock = clock)
+
+    # A still hand with two movements, published with the DEADBAND policy
+    #   Note: The clock of the publisher is not the local clock, all messages are received at once (t = 10 s).
+    t_0 = 1000.0; positions = []; sequence = 0
+    for i in range(100):
+        position = (0.0 if i < 30 else 1.0 if i < 60 else 2.0 + 0.1 * (i - 60), 20.0, -20.0)
+        positions.append(position)
+        if DEADBAND.Is_Required(t_0 + i * CONST_PERIOD, position, CONST_FINGERS_BEND, CONST_STATES) == True:
+            sequence += 1
+            socket.Send(sequence, t_0 + i * CONST_PERIOD, position, CONST_FINGERS_BEND, CONST_STATES, i)
+    assert DEADBAND.Get_Num_Of_Suppressed() > 0
+
+    # One sample on each tick of the publisher: The suppressed samples are the copies of the last sent message.
+    messages = SUBSCRIBER.Receive()
+    assert len(messages) == 100
+    assert [message.timestamp for message in messages] == pytest.approx([t_0 + i * CONST_PERIOD for i in range(100)], abs = 1e-9)
+    assert [message.received for message in messages] == pytest.approx([10.0 - (99 - i) * CONST_PERIOD for i in range(100)], abs = 1e-9)
+    for message, position in zip(messages, positions):
+        assert all(abs(v - v_true) <= CONST_DEADBAND[0] for v, v_true in zip(message.position, position))
+    assert SUBSCRIBER.Get_Num_Of_Reconstructed() == DEADBAND.Get_Num_Of_Suppressed()
+    assert (SUBSCRIBER.Get_Num_Of_Received(), SUBSCRIBER.Get_Num_Of_Lost()) == (DEADBAND.Get_Num_Of_Sent(), 0)
+
+def test_reconstruction_max_age(socket, clock):
+    SUBSCRIBER = Subscriber.Glove_Subscriber(socket, Subscriber.CONST_SUBSCRIBER_MODE_QUEUE, 0.02, CONST_PERIOD, clock = clock)
+
+    # A gap longer than {max_age} between two messages: At most {max_age} seconds of the samples are held.
+    for sequence, i in enumerate([0, 50]):
+        socket.Send(sequence, 1000.0 + i * CONST_PERIOD, (0.0,) * 3, CONST_FINGERS_BEND, CONST_STATES, i)
+    messages = SUBSCRIBER.Receive()
+    assert len(messages) == 2 + int(0.02 / CONST_PERIOD)
+
+    # No new message (a dead publisher): The samples are held up to the current time minus one period, at most {max_age} seconds.
+    clock.t = 10.0 + 2.5 * CONST_PERIOD
+    assert len(SUBSCRIBER.Receive()) == 1
+    clock.t = 11.0
+    assert len(SUBSCRIBER.Receive()) == int(0.02 / CONST_PERIOD) - 1
+    assert len(SUBSCRIBER.Receive()) == 0
+    assert SUBSCRIBER.Get_Num_Of_Reconstructed() == 2 * int(0.02 / CONST_PERIOD)
@@ -0,0 +1,126 @@
+"""
+Tests of the filter state snapshot (Lib.Signal.Filter: Get_State / Set_State).
+"""
+
+# Numpy (Array computing) [pip3 install numpy]
+import numpy as np
+# Pytest (Testing framework) [pip3 install pytest]
+import pytest
+# Lib.Signal.Filter (Filters: SMA, BLP, BLPMA, One Euro, Kalman)
+import Lib.Signal.Filter as Filter
+
+CONST_LIMIT = [[-22.5, 22.5], [0.0, 45.0], [-45.0, 0.0]]
+#   Outlier rejection stage (Parameters.CONST_FILTER_POS_OUTLIER)
+CONST_OUTLIER = [9, 3.0, 0.5, 300.0]
+
+def Signal(num_of_data, seed = 0):
+    # Smooth movement with noise and a few spikes inside the limits
+    rng = np.random.default_rng(seed)
+    t = np.arange(num_of_data) / 250.0
+    data = np.stack([10.0 * np.sin(t), 20.0 + 10.0 * np.cos(t), -20.0 + 5.0 * np.sin(2.0 * t)], axis=1)
+    data += rng.normal(0.0, 0.2, data.shape)
+    data[rng.integers(0, num_of_data, num_of_data // 20), 1] += 8.0
+
+    return data
+
+def Create_Filter_Bank(filter_type, mode = Filter.CONST_BLP_MODE_WINDOW, outlier = None):
+    return Filter.Filter_Bank(filter_type, CONST_LIMIT, 50, 10, 250, 1.95, 3, mode, warm_start = True, outlier = outlier)
+
+def Create_Filters():
+    # Single-channel filters and the filter bank of each type
+    filters = [Filter.Simple_Moving_Average([-25.0, 25.0], 20), 
+               Filter.Butterworth_Low_Pass([-25.0, 25.0], 50, 250, 1.95, 3), 
+               Filter.Butterworth_Low_Pass([-25.0, 25.0], 50, 250, 1.95, 3, Filter.CONST_BLP_MODE_STREAM), 
+               Filter.Butterworth_Low_Pass_Moving_Average([-25.0, 25.0], 50, 10, 250, 1.95, 3), 
+               Filter.One_Euro_Filter([-25.0, 25.0], 250), 
+               Filter.Kalman_Filter([-25.0, 25.0], 250), 
+               Filter.Hampel_Filter(*CONST_OUTLIER, 250)]
+    filters += [Create_Filter_Bank(filter_type) for filter_type in Filter.CONST_FILTER_TYPE_NAME.values()]
+    filters += [Create_Filter_Bank(Filter.CONST_FILTER_TYPE_BLPMA, Filter.CONST_BLP_MODE_STREAM)]
+    #   With the outlier rejection stage in front of the filter
+    filters += [Create_Filter_Bank(filter_type, outlier = CONST_OUTLIER) for filter_type in Filter.CONST_FILTER_TYPE_NAME.values()]
+
+    return filters
+
+def Compute(FILTER, data):
+    # Filter bank: all channels, single-channel filter: the first channel
+    if isinstance(FILTER, Filter.Filter_Bank):
+        return np.array([FILTER.Compute(value) for value in data])
+
+    return np.array([FILTER.Compute(value) for value in data[:, 0]])
+
+@pytest.mark.parametrize('index', range(len(Create_Filters())))
+def test_round_trip(index):
+    data = Signal(400)
+
+    FILTER = Create_Filters()[index]
+    Compute(FILTER, data[:200])
+    blob = FILTER.Get_State()
+
+    # A new filter restored from the snapshot continues as the original one.
+    #   Note: The sum of the SMA stage is recalculated from the restored data (rounding of the floating-point sum).
+    FILTER_RESTORED = Create_Filters()[index]
+    assert FILTER_RESTORED.Set_State(blob) == True
+    assert FILTER_RESTORED.Get_State() == blob
+    np.testing.assert_allclose(Compute(FILTER_RESTORED, data[200:]), Compute(FILTER, data[200:]), rtol = 0.0, atol = 1e-9)
+
+@pytest.mark.parametrize('index', range(len(Create_Filters())))
+def test_truncated_blob(index):
+    FILTER = Create_Filters()[index]
+    Compute(FILTER, Signal(100))
+    blob = FILTER.Get_State()
+
+    # Each truncation of the blob (e.g. a half-written file) is rejected without an exception.
+    for length in range(len(blob)):
+        assert FILTER.Set_State(blob[:length]) == False
+    assert FILTER.Set_State(blob) == True
+
+@pytest.mark.parametrize('index', range(len(Create_Filters())))
+def test_corrupted_blob(index):
+    FILTER = Create_Filters()[index]
+    Compute(FILTER, Signal(100))
+    blob = FILTER.Get_State()
+
+    # Magic, name of the class, random bytes and an appended garbage
+    assert FILTER.Set_State(b'XXXX' + blob[4:]) == False
+    assert FILTER.Set_State(blob[:5] + b'X' + blob[6:]) == False
+    assert FILTER.Set_State(np.random.default_rng(0).bytes(len(blob))) == False
+    assert FILTER.Set_State(blob + b'\xff\x00') == False
+
+def test_mismatched_filter():
+    FILTER = Create_Filter_Bank(Filter.CONST_FILTER_TYPE_BLPMA)
+    Compute(FILTER, Signal(100))
+
+    # The state of another type of the filter, or of another number of channels
+    assert Create_Filter_Bank(Filter.CONST_FILTER_TYPE_SMA).Set_State(FILTER.Get_State()) == False
+    assert Filter.Filter_Bank(Filter.CONST_FILTER_TYPE_BLPMA, CONST_LIMIT[:2], 50, 10, 250, 1.95, 3).Set_State(FILTER.Get_State()) == False
+
+def test_outlier_stage_mismatch():
+    FILTER = Create_Filter_Bank(Filter.CONST_FILTER_TYPE_BLPMA, outlier = CONST_OUTLIER)
+    Compute(FILTER, Signal(100))
+
+    # The state with the outlier rejection stage does not match the filter without the stage (and vice versa).
+    assert Create_Filter_Bank(Filter.CONST_FILTER_TYPE_BLPMA).Set_State(FILTER.Get_State()) == False
+    assert FILTER.Set_State(Create_Filter_Bank(Filter.CONST_FILTER_TYPE_BLPMA).Get_State()) == False
+
+def test_outlier_rejection():
+    H = Filter.Hampel_Filter(*CONST_OUTLIER, 250)
+
+    # A signal at rest with a single spike: The spike is replaced by the median of the window.
+    data = [10.0, 10.1, 9.9, 10.0, 10.2, 9.8, 10.0, 10.1, 9.9, 25.0, 10.0]
+    result = [H.Compute(value) for value in data]
+    assert result[:9] == data[:9]
+    assert result[9] == pytest.approx(10.0)
+    assert H.Get_Num_Of_Rejected() == 1
+
+    # The same result as the offline (batch) version
+    data_batch, rejected = Filter.Hampel_Filter_Batch(np.array(data), *CONST_OUTLIER, 250)
+    np.testing.assert_allclose(data_batch, result)
+    assert np.flatnonzero(rejected).tolist() == [9]
+
+def test_outlier_rate_gate():
+    H = Filter.Hampel_Filter(3, 3.0, 100.0, 250.0, 250)
+
+    # A step is followed with the maximum rate (1 unit per sample).
+    result = [H.Compute(value) for value in [0.0, 5.0, 5.0, 5.0, 5.0, 5.0, 5.0]]
+    np.testing.assert_allclose(result, [0.0, 1.0, 2.0, 3.0, 4.0, 5.0, 5.0])
@@ -0,0 +1,78 @@
+"""
+Tests of the hand-gesture classifier (Lib.P5.Gesture) and of the calibration of its templates (Lib.P5.Calibration).
+"""
+
+# JSON (JSON encoder and decoder)
+import json
+# Pytest (Testing framework) [pip3 install pytest]
+import pytest
+# Lib.P5.Gesture (Hand-gesture classifier)
+import Lib.P5.Gesture as Gesture
+# Lib.P5.Calibration (Calibration of the workspace and of the gestures)
+import Lib.P5.Calibration as Calibration
+# Lib.Parameters (Main Control Parameters)
+import Lib.Parameters as Parameters
+
+def Classify(classifier, fingers_bend, num_of_data = 50):
+    for _ in range(num_of_data):
+        classifier.Compute(fingers_bend)
+
+    return classifier.Get_Gesture()
+
+@pytest.mark.parametrize('fingers_bend, gesture', [([60.0] * 5, 'CLOSED'), ([55.0, 65.0, 55.0, 65.0, 55.0], 'CLOSED'), 
+                                                   ([30.0, 60.0, 60.0, 60.0, 60.0], 'POINT'), ([54.0, 60.0, 60.0, 60.0, 60.0], 'POINT'), 
+                                                   ([15.0] * 5, 'OPEN')])
+def test_closed_rule(fingers_bend, gesture):
+    # CLOSED (the gripper) only if all five fingers are in [55, 65], the same rule as the original detection.
+    assert Classify(Gesture.Gesture_Classifier(), fingers_bend) == gesture
+
+def test_release():
+    # The gesture CLOSED is released as soon as a finger leaves the tolerance (without the hysteresis).
+    classifier = Gesture.Gesture_Classifier()
+    assert Classify(classifier, [60.0] * 5) == 'CLOSED'
+
+    for i in range(25):
+        classifier.Compute([45.0, 60.0, 60.0, 60.0, 60.0])
+        if classifier.Get_Gesture() != 'CLOSED':
+            break
+    assert classifier.Get_Gesture() != 'CLOSED'
+
+def Calibrate(templates, num_of_data = Calibration.CONST_GESTURE_MIN_NUM_OF_DATA):
+    calibration = Calibration.Gesture_Calibration(list(templates.keys()))
+    for name, template in templates.items():
+        for i in range(num_of_data):
+            calibration.Add(name, [value + (-1.0)**i for value in template])
+
+    return calibration
+
+def test_calibration(tmp_path):
+    templates = {'OPEN': [35.0, 33.0, 34.0, 36.0, 35.0], 'CLOSED': [58.0, 62.0, 63.0, 61.0, 57.0], 'POINT': [58.0, 20.0, 63.0, 61.0, 57.0]}
+    file_path = str(tmp_path / 'Gesture_Calibration.json')
+    calibration = Calibrate(templates)
+
+    assert calibration.Get_Templates() == {name: pytest.approx(template) for name, template in templates.items()}
+    assert calibration.Save(file_path) == True
+    assert Calibration.Load_Gestures(file_path, Parameters.CONST_GESTURE_TEMPLATES) == {name: pytest.approx(template) for name, template in templates.items()}
+
+    # The calibrated templates are used by the classifier (Gesture_Classifier.Calibrate), e.g. a stiff open hand.
+    classifier = Gesture.Gesture_Classifier()
+    assert Classify(classifier, [45.0, 40.0, 45.0, 45.0, 45.0]) == 'POINT'
+    calibration.Apply(classifier)
+    assert Classify(classifier, [45.0, 40.0, 45.0, 45.0, 45.0]) == 'OPEN'
+
+def test_calibration_rejected(tmp_path):
+    file_path = str(tmp_path / 'Gesture_Calibration.json')
+
+    # Too short, or two gestures that are not distinguishable
+    assert Calibrate(Parameters.CONST_GESTURE_TEMPLATES, 10).Save(file_path) == False
+    assert Calibrate({**Parameters.CONST_GESTURE_TEMPLATES, 'POINT': [60.0, 55.0, 60.0, 60.0, 60.0]}).Save(file_path) == False
+    assert Calibration.Load_Gestures(file_path, Parameters.CONST_GESTURE_TEMPLATES) == Parameters.CONST_GESTURE_TEMPLATES
+
+@pytest.mark.parametrize('templates', [{'OPEN': [15.0] * 5}, {'OPEN': [15.0] * 5, 'CLOSED': [60.0] * 4, 'POINT': [60.0] * 5}, 
+                                       {'OPEN': [15.0] * 5, 'CLOSED': [60.0] * 5, 'POINT': ['A'] * 5}])
+def test_invalid_file(tmp_path, templates):
+    file_path = str(tmp_path / 'Gesture_Calibration.json')
+    with open(file_path, 'w') as f:
+        json.dump({'timestamp': '', 'templates': templates}, f)
+
+    assert Calibration.Load_Gestures(file_path, Parameters.CONST_GESTURE_TEMPLATES) == Parameters.CONST_GESTURE_TEMPLATES
@@ -0,0 +1,55 @@
+"""
+Tests of the fixed-size histogram (Lib.Histogram) shared by the loop statistics (Lib.Scheduler) and the latency trace 
+(Lib.Transport.Trace).
+"""
+
+# Pytest (Testing framework) [pip3 install pytest]
+import pytest
+# Lib.Histogram (Fixed-size histogram of time values)
+import Lib.Histogram as Histogram
+# Lib.Scheduler (Scheduler of the periodic loops)
+import Lib.Scheduler as Scheduler
+# Lib.Transport.Trace (Latency tracing)
+import Lib.Transport.Trace as Trace
+
+def test_summary():
+    # 10 us bins, values of 5, 15, ..., 995 us (one value per bin).
+    histogram = Histogram.Histogram(10e-6, 200, 'us')
+    for i in range(100):
+        histogram.Add(i * 10000 + 5000)
+
+    summary = histogram.Get_Summary()
+    assert summary['num_of_values'] == 100
+    assert summary['mean_us'] == pytest.approx(500.0)
+    assert summary['p50_us'] == pytest.approx(500.0)
+    assert summary['p99_us'] == pytest.approx(990.0)
+    assert summary['max_us'] == pytest.approx(995.0)
+
+def test_range():
+    # A negative value is counted in the first bin, a value above the range in the last one (exact maximum).
+    histogram = Histogram.Histogram(1e-3, 10, 'ms')
+    histogram.Add(-5); histogram.Add(int(1.0e9))
+
+    edges, counts = histogram.Get_Histogram()
+    assert edges[0] == 0.0 and edges[-1] == pytest.approx(10.0)
+    assert counts[0] == 1 and counts[-1] == 1 and sum(counts) == 2
+    assert histogram.Get_Summary()['max_ms'] == pytest.approx(1000.0)
+
+def test_empty():
+    summary = Histogram.Histogram(1e-3, 10, 'ms').Get_Summary()
+
+    assert summary == {'num_of_values': 0, 'mean_ms': 0.0, 'p50_ms': 0.0, 'p99_ms': 0.0, 'max_ms': 0.0}
+
+def test_unit():
+    # The same values in the loop statistics (us) and in the latency trace (ms).
+    statistics = Scheduler.Loop_Statistics('Test', 0.004, [10e-6, 1000])
+    trace = Trace.Latency_Trace('Test', histogram = [10e-6, 1000])
+    for value in [1000000, 2000000, 3000000]:
+        statistics.Add(value, value, value)
+        trace.Add(Trace.CONST_TRACE_STAGE_FILTER, value / 1e9)
+
+    loop = statistics.Get_Summary()['work']; stage = trace.Get_Summary()['filter']
+    for quantity in ['mean', 'p50', 'p99', 'max']:
+        assert loop[f'{quantity}_us'] == pytest.approx(stage[f'{quantity}_ms'] * 1e3)
+    assert statistics.To_Dict()['bin_width_us'] == pytest.approx(10.0)
+    assert trace.To_Dict()['bin_width_ms'] == pytest.approx(0.01)
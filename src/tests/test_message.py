@@ -0,0 +1,71 @@
+"""
+Tests of the binary wire format of the glove messages (Lib.Transport.Message).
+"""
+
+# Struct (Interpret bytes as packed binary data)
+import struct
+# Numpy (Array computing) [pip3 install numpy]
+import numpy as np
+# Pytest (Testing framework) [pip3 install pytest]
+import pytest
+# Lib.Transport.Message (Binary wire format of the glove messages)
+import Lib.Transport.Message as Message
+
+def Encode(sequence = 7, **kwargs):
+    values = dict(glove = 1, sequence = sequence, sample_sequence = 11, timestamp = 123.456, position = (1.5, -2.25, 30.0), 
+                  fingers_bend = (10.0, 20.5, 30.0, 40.0, 50.0), gripper = True, movement = False, quit = False, valid = True)
+    values.update(kwargs)
+
+    return Message.Encode(**values)
+
+def test_size():
+    # Version 2: 68 bytes, the struct and the NumPy dtype have the same layout.
+    assert Message.CONST_MESSAGE_SIZE == 68
+    assert Message.CONST_MESSAGE_DTYPE.itemsize == Message.CONST_MESSAGE_SIZE
+    assert len(Encode()) == Message.CONST_MESSAGE_SIZE
+
+def test_round_trip():
+    message = Message.Decode(Encode())
+
+    assert (message.glove, message.sequence, message.sample_sequence, message.timestamp) == (1, 7, 11, 123.456)
+    assert message.position == (1.5, -2.25, 30.0)
+    assert message.fingers_bend == pytest.approx((10.0, 20.5, 30.0, 40.0, 50.0))
+    assert (message.gripper, message.movement, message.quit, message.valid) == (True, False, False, True)
+
+@pytest.mark.parametrize('states', [(False, False, False, False), (True, True, True, True), (False, True, False, True), (True, False, True, False)])
+def test_flags(states):
+    gripper, movement, quit, valid = states
+    message = Message.Decode(Encode(gripper = gripper, movement = movement, quit = quit, valid = valid))
+
+    assert (message.gripper, message.movement, message.quit, message.valid) == states
+
+def test_sequence_wraparound():
+    # The sequence numbers are sent modulo 2^32.
+    message = Message.Decode(Encode(sequence = 2**32 + 5, sample_sequence = 2**32 - 1))
+
+    assert (message.sequence, message.sample_sequence) == (5, 2**32 - 1)
+
+def test_decode_from_buffer():
+    # The message is decoded from a memoryview (e.g. the buffer of a ZeroMQ frame) without a copy.
+    assert Message.Decode(memoryview(bytearray(Encode()))) == Message.Decode(Encode())
+
+@pytest.mark.parametrize('length', [0, 1, Message.CONST_MESSAGE_SIZE - 1, Message.CONST_MESSAGE_SIZE + 1, 2 * Message.CONST_MESSAGE_SIZE])
+def test_reject_size(length):
+    assert Message.Decode((Encode() * 2)[:length]) is None
+
+def test_reject_magic():
+    assert Message.Decode(b'XX' + Encode()[2:]) is None
+
+@pytest.mark.parametrize('version', [0, 1, Message.CONST_MESSAGE_VERSION + 1, 255])
+def test_reject_version(version):
+    assert Message.Decode(Encode()[:2] + struct.pack('<B', version) + Encode()[3:]) is None
+
+def test_view():
+    # A recording of the messages as a structured array
+    data = Message.View(b''.join(Encode(sequence = i, timestamp = 0.004 * i) for i in range(10)))
+
+    assert data.shape == (10,)
+    assert np.all(data['magic'] == Message.CONST_MESSAGE_MAGIC) and np.all(data['version'] == Message.CONST_MESSAGE_VERSION)
+    np.testing.assert_array_equal(data['sequence'], np.arange(10))
+    np.testing.assert_allclose(data['timestamp'], 0.004 * np.arange(10))
+    np.testing.assert_array_equal(data['position'][3], [1.5, -2.25, 30.0])
@@ -0,0 +1,47 @@
+"""
+Tests of the sorted window of the outlier rejection (Lib.Signal.Filter: Sorted_Window, Hampel_Filter).
+"""
+
+# Numpy (Array computing) [pip3 install numpy]
+import numpy as np
+# Pytest (Testing framework) [pip3 install pytest]
+import pytest
+# Lib.Signal.Filter (Filters: SMA, BLP, BLPMA, One Euro, Kalman)
+import Lib.Signal.Filter as Filter
+
+@pytest.mark.parametrize('num_of_data', [1, 2, 9, 100])
+def test_sliding_window(num_of_data):
+    # Sliding window with many equal values (quantized signal), compared with a sorted list.
+    data = np.round(np.random.default_rng(0).normal(0.0, 2.0, 2000)).tolist()
+    window = Filter.Sorted_Window(num_of_data); reference = []
+
+    for i, value in enumerate(data):
+        if i >= num_of_data:
+            window.Remove(data[i - num_of_data]); reference.remove(data[i - num_of_data])
+        window.Insert(value); reference.append(value); reference.sort()
+
+        assert len(window) == len(reference)
+        assert [window[k] for k in range(len(window))] == reference
+        assert window[-1] == reference[-1]
+
+def test_missing_value():
+    window = Filter.Sorted_Window(9)
+    for value in [1.0, 2.0, 3.0]:
+        window.Insert(value)
+
+    with pytest.raises(ValueError):
+        window.Remove(2.5)
+    with pytest.raises(IndexError):
+        window[3]
+
+    window.Clear()
+    assert len(window) == 0
+
+def test_hampel_quantized():
+    # The streaming filter is the same as the batch version with many equal values in the window.
+    data = np.round(np.random.default_rng(1).normal(0.0, 1.0, 1000) * 2.0) / 2.0
+    data[::37] += 6.0
+    hampel = Filter.Hampel_Filter(9, 3.0, 0.5)
+
+    data_filtered, _ = Filter.Hampel_Filter_Batch(data, 9, 3.0, 0.5)
+    assert np.array_equal([hampel.Compute(value) for value in data], data_filtered)
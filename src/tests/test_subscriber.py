@@ -0,0 +1,112 @@
+"""
+Tests of the receiver of the glove messages (Lib.Transport.Subscriber).
+"""
+
+# Pytest (Testing framework) [pip3 install pytest]
+import pytest
+# Lib.Transport.Message (Binary wire format of the glove messages)
+import Lib.Transport.Message as Message
+# Lib.Transport.Subscriber (Receiver of the glove messages)
+import Lib.Transport.Subscriber as Subscriber
+
+def Receive(socket, mode, sequences):
+    SUBSCRIBER = Subscriber.Glove_Subscriber(socket, mode, 0.05)
+    for sequence in sequences:
+        socket.Send(sequence)
+
+    return SUBSCRIBER, SUBSCRIBER.Receive()
+
+def test_queue_mode(socket):
+    SUBSCRIBER, messages = Receive(socket, Subscriber.CONST_SUBSCRIBER_MODE_QUEUE, [0, 1, 2, 3])
+
+    # All messages in order
+    assert [message.sequence for message in messages] == [0, 1, 2, 3]
+    assert (SUBSCRIBER.Get_Num_Of_Received(), SUBSCRIBER.Get_Num_Of_Skipped(), SUBSCRIBER.Get_Num_Of_Lost()) == (4, 0, 0)
+    assert SUBSCRIBER.Get_Message().sequence == 3
+
+def test_latest_mode(socket):
+    SUBSCRIBER, messages = Receive(socket, Subscriber.CONST_SUBSCRIBER_MODE_LATEST, [0, 1, 2, 3, 4])
+
+    # Only the newest message, the backlog is skipped (not lost).
+    assert [message.sequence for message in messages] == [4]
+    assert (SUBSCRIBER.Get_Num_Of_Received(), SUBSCRIBER.Get_Num_Of_Skipped(), SUBSCRIBER.Get_Num_Of_Lost()) == (5, 4, 0)
+
+def test_sequence_gap(socket):
+    SUBSCRIBER, _ = Receive(socket, Subscriber.CONST_SUBSCRIBER_MODE_QUEUE, [0, 1, 4, 5, 10])
+
+    # Missing: 2, 3 and 6 - 9
+    assert SUBSCRIBER.Get_Num_Of_Lost() == 6
+
+def test_sequence_gap_across_calls(socket):
+    SUBSCRIBER = Subscriber.Glove_Subscriber(socket, Subscriber.CONST_SUBSCRIBER_MODE_LATEST, 0.05)
+
+    for sequences in [[0, 1], [3], [4, 8]]:
+        for sequence in sequences:
+            socket.Send(sequence)
+        SUBSCRIBER.Receive()
+
+    assert (SUBSCRIBER.Get_Num_Of_Received(), SUBSCRIBER.Get_Num_Of_Skipped(), SUBSCRIBER.Get_Num_Of_Lost()) == (5, 2, 4)
+
+def test_sequence_wraparound(socket):
+    # The sequence number wraps around at 2^32: No loss at the wraparound, the gap across it is counted.
+    SUBSCRIBER, _ = Receive(socket, Subscriber.CONST_SUBSCRIBER_MODE_QUEUE, [2**32 - 2, 2**32 - 1, 0, 1])
+    assert SUBSCRIBER.Get_Num_Of_Lost() == 0
+
+    SUBSCRIBER, _ = Receive(socket, Subscriber.CONST_SUBSCRIBER_MODE_QUEUE, [2**32 - 2, 1])
+    assert SUBSCRIBER.Get_Num_Of_Lost() == 2
+
+def test_sequence_restart(socket):
+    # The sequence that goes back (a restart of the publisher) is not a loss.
+    SUBSCRIBER, _ = Receive(socket, Subscriber.CONST_SUBSCRIBER_MODE_QUEUE, [100, 101, 0, 1])
+
+    assert (SUBSCRIBER.Get_Num_Of_Received(), SUBSCRIBER.Get_Num_Of_Lost()) == (4, 0)
+
+def test_invalid_message(socket):
+    SUBSCRIBER = Subscriber.Glove_Subscriber(socket, Subscriber.CONST_SUBSCRIBER_MODE_QUEUE, 0.05)
+    socket.Send(0); socket.frames += [b'P5_GLOVE_00', b'\x00' * Message.CONST_MESSAGE_SIZE]; socket.Send(1)
+
+    # The message with an unknown format is ignored (not received, not lost).
+    assert [message.sequence for message in SUBSCRIBER.Receive()] == [0, 1]
+    assert (SUBSCRIBER.Get_Num_Of_Received(), SUBSCRIBER.Get_Num_Of_Lost()) == (2, 0)
+
+def test_age(socket, clock):
+    SUBSCRIBER = Subscriber.Glove_Subscriber(socket, Subscriber.CONST_SUBSCRIBER_MODE_LATEST, 0.05, clock = clock)
+
+    # No message: stale
+    assert SUBSCRIBER.Get_Age() is None and SUBSCRIBER.Is_Stale() == True
+    assert SUBSCRIBER.Get_Message() == Message.CONST_MESSAGE_EMPTY
+
+    # The age is measured from the receipt (local clock).
+    socket.Send(0, timestamp = 10.0)
+    SUBSCRIBER.Receive()
+    clock.t = 10.03
+    assert SUBSCRIBER.Get_Age() == 10.03 - 10.0
+    assert SUBSCRIBER.Is_Stale() == False
+    assert SUBSCRIBER.Is_Stale(10.06) == True
+
+@pytest.mark.parametrize('offset', [-1.0e4, -0.2, 0.2, 1.0e4])
+def test_clock_offset(socket, clock, offset):
+    # The clock of the publisher (another host) is shifted against the local clock.
+    clock.t = 50.0
+    SUBSCRIBER = Subscriber.Glove_Subscriber(socket, Subscriber.CONST_SUBSCRIBER_MODE_QUEUE, 0.05, clock = clock)
+
+    # A backlog of three messages received at once: The spacing of the publisher, anchored at the receipt of the newest one.
+    for i in range(3):
+        socket.Send(i, timestamp = 50.0 + offset + 0.004 * i)
+    messages = SUBSCRIBER.Receive()
+    assert [message.received for message in messages] == pytest.approx([49.992, 49.996, 50.0], abs = 1e-9)
+
+    # The age and the staleness do not depend on the offset.
+    assert SUBSCRIBER.Get_Age(50.01) == pytest.approx(0.01)
+    assert SUBSCRIBER.Is_Stale(50.04) == False and SUBSCRIBER.Is_Stale(50.06) == True
+
+    # The next message (a late receipt): not earlier than the previous one, the age starts again from the receipt.
+    clock.t = 50.1; socket.Send(3, timestamp = 50.0 + offset + 0.012)
+    messages = SUBSCRIBER.Receive()
+    assert messages[0].received == pytest.approx(50.1)
+    assert SUBSCRIBER.Get_Age(50.11) == pytest.approx(0.01) and SUBSCRIBER.Is_Stale(50.11) == False
+
+def test_empty_queue(socket):
+    SUBSCRIBER, messages = Receive(socket, Subscriber.CONST_SUBSCRIBER_MODE_LATEST, [])
+
+    assert messages == [] and SUBSCRIBER.Get_Num_Of_Received() == 0
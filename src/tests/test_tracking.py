@@ -0,0 +1,89 @@
+"""
+Tests of the tracking quality of the glove position (Lib.P5.Tracking).
+"""
+
+# OS (Operating system interfaces)
+import os
+# Lib.Parameters (Main Control Parameters)
+import Lib.Parameters as Parameters
+# Lib.P5.P5_Binding (Layout of the output array of the P5 library)
+import Lib.P5.P5_Binding as P5_Binding
+# Lib.P5.P5_Simulator (Simulated / replayed P5 glove)
+import Lib.P5.P5_Simulator as P5_Simulator
+# Lib.P5.Tracking (Tracking quality of the glove position)
+import Lib.P5.Tracking as Tracking
+
+CONST_RECORDING_FILE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Evaluation', 'P5_Results', 
+                                         'Experiment_Position.txt')
+
+def Create_Tracking_Quality():
+    return Tracking.Tracking_Quality(Parameters.CONST_FILTER_POS_LIMIT, *Parameters.CONST_TRACKING_QUALITY, Parameters.CONST_TIME_STEP)
+
+def Compute(TRACKING, positions):
+    return [(TRACKING.Compute(position), TRACKING.Get_State())[1] for position in positions]
+
+def test_recording():
+    # The real glove: Most of the samples are valid (the switching of the IR tracking is left to the filters).
+    positions = P5_Simulator.Load_Recording(CONST_RECORDING_FILE_PATH, ['X_DATA_RT', 'Y_DATA_RT', 'Z_DATA_RT']).astype(float)
+
+    TRACKING = Create_Tracking_Quality()
+    states = Compute(TRACKING, positions)
+    assert sum(state != Tracking.CONST_TRACKING_VALID for state in states) < 0.1 * len(states)
+    assert TRACKING.Get_Num_Of_Invalid() == {'FROZEN': 0, 'OUT_OF_RANGE': 17, 'JUMP': 18, 'RECOVERY': 33}
+
+def test_synthetic():
+    # The synthetic glove with the default noise: No jump, only the dropouts (FROZEN) and the recovery after them.
+    LIBRARY = P5_Simulator.P5_Library_Simulator(P5_Simulator.CONST_SIMULATION_MODE_SYNTHETIC, None, Parameters.CONST_P5_SYNTHETIC_NOISE, 
+                                                Parameters.CONST_P5_SYNTHETIC_DROPOUT)
+    TRACKING = Create_Tracking_Quality()
+    for _ in range(5000):
+        LIBRARY.Read(0)
+        TRACKING.Compute(tuple(LIBRARY.Get_Data(0)[P5_Binding.CONST_P5_DATA_POSITION]))
+
+    assert TRACKING.Get_Num_Of_Invalid()['JUMP'] == 0 and TRACKING.Get_Num_Of_Invalid()['OUT_OF_RANGE'] == 0
+
+def test_switching():
+    # The glove switches between two solutions (Z: -36 / -45 cm): valid
+    states = Compute(Create_Tracking_Quality(), [(-7.0, 15.0, -36.0 if i % 3 else -45.0) for i in range(100)])
+
+    assert all(state == Tracking.CONST_TRACKING_VALID for state in states)
+
+def test_spike():
+    # A single spike far from the median: JUMP without the recovery
+    positions = [(0.0, 20.0, -20.0 + 0.1 * (i % 2)) for i in range(20)]
+    positions[10] = (0.0, 20.0, -2.0)
+    states = Compute(Create_Tracking_Quality(), positions)
+
+    assert states[10] == Tracking.CONST_TRACKING_JUMP
+    assert all(state == Tracking.CONST_TRACKING_VALID for i, state in enumerate(states) if i != 10)
+
+def test_fast_movement():
+    # A step of the position (e.g. a fast movement): valid again when the median follows (half of the window).
+    positions = [(0.0, 20.0, -40.0 + 0.1 * (i % 2)) for i in range(20)] + [(0.0, 20.0, -20.0 + 0.1 * (i % 2)) for i in range(20)]
+    states = Compute(Create_Tracking_Quality(), positions)
+
+    assert all(state == Tracking.CONST_TRACKING_JUMP for state in states[20:25])
+    assert all(state == Tracking.CONST_TRACKING_VALID for state in states[:20] + states[25:])
+
+def test_frozen():
+    # The position does not change for more than max_frozen: FROZEN, then the recovery.
+    max_frozen = int(round(Parameters.CONST_TRACKING_QUALITY[1] / Parameters.CONST_TIME_STEP))
+    recovery   = int(round(Parameters.CONST_TRACKING_QUALITY[4] / Parameters.CONST_TIME_STEP))
+    positions  = [(0.0, 20.0, -20.0)] * (max_frozen + 5) + [(0.0, 20.0, -20.0 + 0.1 * (i % 2)) for i in range(1, 20)]
+    states = Compute(Create_Tracking_Quality(), positions)
+
+    assert all(state == Tracking.CONST_TRACKING_VALID for state in states[:max_frozen])
+    assert all(state == Tracking.CONST_TRACKING_FROZEN for state in states[max_frozen:max_frozen + 5])
+    assert all(state == Tracking.CONST_TRACKING_RECOVERY for state in states[max_frozen + 5:max_frozen + 5 + recovery])
+    assert all(state == Tracking.CONST_TRACKING_VALID for state in states[max_frozen + 5 + recovery:])
+
+def test_out_of_range():
+    # A position out of the limit (+ margin): OUT_OF_RANGE, then the recovery.
+    recovery  = int(round(Parameters.CONST_TRACKING_QUALITY[4] / Parameters.CONST_TIME_STEP))
+    positions = [(0.0, 20.0, -20.0 + 0.1 * (i % 2)) for i in range(30)]
+    positions[10] = (0.0, 20.0, -94.0)
+    states = Compute(Create_Tracking_Quality(), positions)
+
+    assert states[10] == Tracking.CONST_TRACKING_OUT_OF_RANGE
+    assert all(state == Tracking.CONST_TRACKING_RECOVERY for state in states[11:11 + recovery])
+    assert all(state == Tracking.CONST_TRACKING_VALID for state in states[:10] + states[11 + recovery:])